@@ -0,0 +1,286 @@
+# --- Agregação entre Perfis (Índice Persistente de Áreas) ---
+# Cada execução descartava a 'minha_lista_api' depois de exibi-la. Aqui as observações são
+# acumuladas entre execuções, por área normalizada:
+#   * o nome da área é normalizado (sem acentos, minúsculas, espaços únicos), assim
+#     "Engenharia de Software" e "engenharia  de software" caem na mesma entrada;
+#   * cada entrada guarda estatísticas incrementais (contagem, mínimo, máximo, média e
+#     mediana aproximada por um estimador P², com memória constante);
+#   * também é registrado de qual perfil (folha da taxonomia dos menus) veio cada observação.
+# O índice fica em um dicionário (hash) na memória e é persistido em SQLite, permitindo
+# responder rankings globais sem consultar a IA novamente.
+# Cada ranking registrado é identificado por (origem, resumo do conteúdo): a mesma resposta
+# (vinda do cache, de um perfil repetido ou de um arquivo importado de novo) conta uma só vez.
+# A gravação soma as novas observações ao que já está no banco, dentro de uma transação de
+# escrita, para que processos simultâneos não sobrescrevam as contagens uns dos outros.
+import hashlib  # Resumo do conteúdo de cada ranking (deduplicação).
+import json  # Serialização do estimador e das origens.
+import os  # Criação do diretório do banco.
+import sqlite3  # Persistência do índice.
+import unicodedata  # Remoção de acentos.
+
+from ordenacao import selecionar_top_k
+
+CAMINHO_PADRAO = os.path.join(os.path.expanduser("~"), ".cache", "consultor_carreira", "agregacao.sqlite3")
+CRITERIOS_RANKING = ("mediana", "media", "maximo", "minimo", "contagem")
+LIMITE_PENDENTES = 100_000  # Observações guardadas na memória antes de um 'salvar' automático.
+_MASCARA_64 = (1 << 64) - 1
+
+
+def normalizar_area(texto):
+    """ 'Engenharia  de SOFTWARE ' -> 'engenharia de software' (sem acentos, minúsculas, espaços únicos). """
+    decomposto = unicodedata.normalize("NFKD", texto)
+    sem_acentos = "".join(c for c in decomposto if not unicodedata.combining(c))
+    return " ".join(sem_acentos.casefold().split())
+
+
+def _hash_observacao(chave, salario):
+    """ Hash estável (entre execuções) de uma observação, somado no resumo do ranking. """
+    return int.from_bytes(hashlib.blake2b(f"{chave}\t{salario}".encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class EstimadorP2:
+    """
+    Estimador P² (Jain & Chlamtac, 1985) de um quantil em fluxo: mantém apenas 5 marcadores,
+    independentemente da quantidade de observações. Com menos de 5 valores, o quantil é exato.
+    """
+    __slots__ = ("p", "alturas", "posicoes", "desejadas", "incrementos")
+
+    def __init__(self, p=0.5):
+        self.p = p
+        self.alturas = []  # Valores dos marcadores (os 5 primeiros valores, até a inicialização).
+        self.posicoes = [1, 2, 3, 4, 5]
+        self.desejadas = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.incrementos = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def adicionar(self, x):
+        q, n = self.alturas, self.posicoes
+        if len(q) < 5:  # Fase de inicialização: guarda os 5 primeiros valores ordenados.
+            q.append(x)
+            q.sort()
+            return
+
+        # 1. Encontra a célula k onde x cai e ajusta os extremos.
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = max(q[4], x)
+            k = 3
+        else:
+            k = 0
+            while k < 3 and x >= q[k + 1]:
+                k += 1
+
+        # 2. Incrementa as posições dos marcadores acima da célula e as posições desejadas.
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desejadas[i] += self.incrementos[i]
+
+        # 3. Ajusta os marcadores internos com interpolação parabólica (ou linear).
+        for i in (1, 2, 3):
+            d = self.desejadas[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                sinal = 1 if d > 0 else -1
+                candidata = self._parabolica(i, sinal)
+                if not q[i - 1] < candidata < q[i + 1]:
+                    candidata = q[i] + sinal * (q[i + sinal] - q[i]) / (n[i + sinal] - n[i])
+                q[i] = candidata
+                n[i] += sinal
+
+    def _parabolica(self, i, d):
+        q, n = self.alturas, self.posicoes
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+    def valor(self):
+        """ Estimativa atual do quantil (None sem observações). """
+        q = self.alturas
+        if not q:
+            return None
+        if len(q) < 5 or self.posicoes[4] < 5:  # Ainda exato: interpola nos valores guardados.
+            posicao = self.p * (len(q) - 1)
+            base = int(posicao)
+            fracao = posicao - base
+            return q[base] if base + 1 >= len(q) else q[base] + (q[base + 1] - q[base]) * fracao
+        return q[2]
+
+    def para_dict(self):
+        return {"p": self.p, "alturas": self.alturas, "posicoes": self.posicoes, "desejadas": self.desejadas}
+
+    @classmethod
+    def de_dict(cls, dados):
+        estimador = cls(dados["p"])
+        estimador.alturas = list(dados["alturas"])
+        estimador.posicoes = list(dados["posicoes"])
+        estimador.desejadas = list(dados["desejadas"])
+        return estimador
+
+
+class EstatisticaArea:
+    """ Estatísticas incrementais de uma área normalizada. """
+    __slots__ = ("chave", "nome", "contagem", "minimo", "maximo", "soma", "mediana", "origens")
+
+    def __init__(self, chave, nome):
+        self.chave = chave  # Nome normalizado (chave do índice).
+        self.nome = nome  # Primeira grafia vista, usada na exibição.
+        self.contagem = 0
+        self.minimo = None
+        self.maximo = None
+        self.soma = 0
+        self.mediana = EstimadorP2(0.5)
+        self.origens = {}  # Origem ('["Grande Área", "Campo", "Nicho"]' ou nome do arquivo) -> observações.
+
+    def adicionar(self, salario, origem=None):
+        self.contagem += 1
+        self.soma += salario
+        self.minimo = salario if self.minimo is None else min(self.minimo, salario)
+        self.maximo = salario if self.maximo is None else max(self.maximo, salario)
+        self.mediana.adicionar(salario)
+        if origem is not None:
+            self.origens[origem] = self.origens.get(origem, 0) + 1
+
+    @property
+    def media(self):
+        return self.soma / self.contagem if self.contagem else None
+
+    def resumo(self):
+        """ Dicionário pronto para exibição (mesmas chaves de 'mostrar_dados' + estatísticas). """
+        return {
+            "area": self.nome,
+            "contagem": self.contagem,
+            "minimo": self.minimo,
+            "maximo": self.maximo,
+            "media": round(self.media) if self.contagem else None,
+            "mediana": round(self.mediana.valor()) if self.contagem else None,
+            "perfis": len(self.origens),
+        }
+
+
+class IndiceAreas:
+    """ Índice persistente (SQLite) de área normalizada -> EstatisticaArea. """
+
+    def __init__(self, caminho=CAMINHO_PADRAO):
+        if caminho != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(caminho)), exist_ok=True)
+        self._conexao = sqlite3.connect(caminho)
+        self._conexao.execute(
+            "CREATE TABLE IF NOT EXISTS areas ("
+            " chave TEXT PRIMARY KEY, nome TEXT NOT NULL, contagem INTEGER NOT NULL,"
+            " minimo INTEGER, maximo INTEGER, soma INTEGER NOT NULL,"
+            " mediana TEXT NOT NULL, origens TEXT NOT NULL)"
+        )
+        self._conexao.execute(  # Rankings já contados: (origem, resumo do conteúdo).
+            "CREATE TABLE IF NOT EXISTS registros (origem TEXT NOT NULL, resumo TEXT NOT NULL,"
+            " PRIMARY KEY (origem, resumo))"
+        )
+        self._conexao.commit()
+        self.areas = {}  # Índice hash em memória.
+        self._pendentes = []  # Rankings ainda não gravados: (origem, resumo, [(chave, nome, salário), ...]).
+        self._resumos_pendentes = set()  # (origem, resumo) dos rankings pendentes.
+        self._observacoes_pendentes = 0
+        for linha in self._conexao.execute(
+                "SELECT chave, nome, contagem, minimo, maximo, soma, mediana, origens FROM areas"):
+            estatistica = self._de_linha(linha)
+            self.areas[estatistica.chave] = estatistica
+
+    @staticmethod
+    def _de_linha(linha):
+        chave, nome, contagem, minimo, maximo, soma, mediana, origens = linha
+        estatistica = EstatisticaArea(chave, nome)
+        estatistica.contagem, estatistica.minimo, estatistica.maximo, estatistica.soma = contagem, minimo, maximo, soma
+        estatistica.mediana = EstimadorP2.de_dict(json.loads(mediana))
+        estatistica.origens = json.loads(origens)
+        return estatistica
+
+    def registrar(self, linhas, perfil=None):
+        """
+        Acrescenta ao índice as linhas de um ranking ('area' e 'salario_estimado_mensal').
+        'perfil' identifica a folha de origem: tupla (Grande Área, Campo, Nicho) ou texto.
+        Retorna False (sem alterar o índice) se o mesmo conteúdo já foi registrado para esta origem.
+        """
+        # Perfis viram uma lista JSON: nomes com "/" (ex: "UX/UI") não se confundem com outros caminhos.
+        origem = json.dumps(list(perfil), ensure_ascii=False) if isinstance(perfil, (tuple, list)) else perfil
+        observacoes = []
+        resumo = 0  # Soma dos hashes das observações: não depende da ordem das linhas.
+        for linha in linhas:
+            chave = normalizar_area(linha['area'])
+            if not chave:
+                continue
+            salario = linha['salario_estimado_mensal']
+            observacoes.append((chave, linha['area'].strip(), salario))
+            resumo = (resumo + _hash_observacao(chave, salario)) & _MASCARA_64
+        if not observacoes:
+            return False
+        identificador = (origem or "", f"{len(observacoes)}:{resumo:016x}")
+        if identificador in self._resumos_pendentes or self._conexao.execute(
+                "SELECT 1 FROM registros WHERE origem = ? AND resumo = ?", identificador).fetchone():
+            return False
+
+        for chave, nome, salario in observacoes:
+            estatistica = self.areas.get(chave)
+            if estatistica is None:
+                estatistica = self.areas[chave] = EstatisticaArea(chave, nome)
+            estatistica.adicionar(salario, origem)
+        self._pendentes.append((origem, identificador[1], observacoes))
+        self._resumos_pendentes.add(identificador)
+        self._observacoes_pendentes += len(observacoes)
+        if self._observacoes_pendentes >= LIMITE_PENDENTES:  # Limita a memória em importações grandes.
+            self.salvar()
+        return True
+
+    def consultar(self, area):
+        """ Estatísticas de uma área (qualquer grafia), ou None. """
+        return self.areas.get(normalizar_area(area))
+
+    def ranking(self, k=20, criterio="mediana"):
+        """ As 'k' áreas com maior valor do critério (mediana, media, maximo, minimo ou contagem). """
+        if criterio not in CRITERIOS_RANKING:
+            raise ValueError(f"Critério de ranking desconhecido: {criterio!r}")
+        resumos = (estatistica.resumo() for estatistica in self.areas.values())
+        return selecionar_top_k(resumos, k, criterio, decrescente=True)
+
+    def salvar(self):
+        """
+        Grava os rankings registrados desde o último 'salvar'. Dentro de uma transação de escrita,
+        as observações novas são somadas às entradas atuais do banco (que outro processo pode ter
+        alterado), e rankings que outro processo já gravou são ignorados.
+        """
+        if not self._pendentes:
+            return
+        atualizadas = {}  # Entradas lidas do banco nesta transação, já com as observações novas.
+        self._conexao.execute("BEGIN IMMEDIATE")  # Trava de escrita: outros processos esperam.
+        try:
+            for origem, resumo, observacoes in self._pendentes:
+                cursor = self._conexao.execute(
+                    "INSERT OR IGNORE INTO registros (origem, resumo) VALUES (?, ?)", (origem or "", resumo))
+                if cursor.rowcount == 0:  # Outro processo gravou o mesmo ranking antes.
+                    continue
+                for chave, nome, salario in observacoes:
+                    estatistica = atualizadas.get(chave)
+                    if estatistica is None:
+                        linha = self._conexao.execute(
+                            "SELECT chave, nome, contagem, minimo, maximo, soma, mediana, origens"
+                            " FROM areas WHERE chave = ?", (chave,)).fetchone()
+                        estatistica = self._de_linha(linha) if linha else EstatisticaArea(chave, nome)
+                        atualizadas[chave] = estatistica
+                    estatistica.adicionar(salario, origem)
+            self._conexao.executemany(
+                "INSERT OR REPLACE INTO areas (chave, nome, contagem, minimo, maximo, soma, mediana, origens)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(chave, e.nome, e.contagem, e.minimo, e.maximo, e.soma, json.dumps(e.mediana.para_dict()),
+                  json.dumps(e.origens, ensure_ascii=False)) for chave, e in atualizadas.items()])
+            self._conexao.commit()
+        except BaseException:
+            self._conexao.rollback()
+            raise
+        self.areas.update(atualizadas)  # A visão em memória passa a incluir o que outros processos gravaram.
+        self._pendentes.clear()
+        self._resumos_pendentes.clear()
+        self._observacoes_pendentes = 0
+
+    def fechar(self):
+        """ Salva as alterações pendentes e fecha o banco. """
+        self.salvar()
+        self._conexao.close()
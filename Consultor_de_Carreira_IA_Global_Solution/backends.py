@@ -0,0 +1,236 @@
+# --- Backends de Modelo (Interface Plugável) ---
+# Todo acesso à IA passa por um "backend" com a mesma interface, o que permite trocar a API
+# real do Gemini por alternativas locais em benchmarks e testes de carga:
+#   * BackendGemini: cliente real (google-genai).
+#   * BackendSintetico: gera tópicos determinísticos no formato "* Área: Curso: Salário",
+#     com latência e tamanho configuráveis, sem rede.
+#   * BackendGravacao: grava as respostas de outro backend em um arquivo e as reproduz depois.
+# 'gerar' e 'gerar_async' aceitam um 'esquema' opcional (ver estruturado.py): com ele, a resposta
+# é um texto JSON no formato do esquema em vez dos tópicos.
+import hashlib  # Sementes determinísticas e chaves das gravações.
+import json  # Arquivo de gravações (JSON Lines).
+import os  # Verificação do arquivo de gravações.
+import random  # Conteúdo sintético.
+import threading  # Trava da escrita das gravações.
+import time  # Latência simulada.
+
+
+class BackendIA:
+    """ Interface comum dos backends. As subclasses implementam pelo menos 'gerar'. """
+    nome = "base"
+
+    def gerar(self, prompt, modelo, esquema=None):
+        """ Retorna o texto completo da resposta (JSON no formato de 'esquema', se informado). """
+        raise NotImplementedError
+
+    def gerar_stream(self, prompt, modelo):
+        """ Gera a resposta em pedaços de texto (padrão: um único pedaço). """
+        yield self.gerar(prompt, modelo)
+
+    async def gerar_async(self, prompt, modelo, esquema=None):
+        """ Versão assíncrona de 'gerar' (padrão: executa 'gerar' em uma thread). """
+        import asyncio  # Import adiado: asyncio só é necessário no modo lote (inicialização mais rápida).
+        argumentos = (prompt, modelo) if esquema is None else (prompt, modelo, esquema)
+        return await asyncio.get_running_loop().run_in_executor(None, self.gerar, *argumentos)
+
+    def validar(self):
+        """ Confirma que o backend está acessível; levanta uma exceção caso contrário. """
+
+
+class BackendGemini(BackendIA):
+    """
+    Backend real: API do Google Gemini via 'google-genai'.
+    O SDK só é importado e o cliente só é criado no primeiro uso (inicialização rápida).
+    """
+    nome = "gemini"
+
+    def __init__(self, chave, base_url=None):
+        self.chave = chave
+        self.base_url = base_url
+        self._cliente = None
+
+    @property
+    def cliente(self):
+        if self._cliente is None:
+            from google import genai  # Import adiado: só quem usa a API real paga o custo do SDK.
+            opcoes_http = {"base_url": self.base_url} if self.base_url else None
+            self._cliente = genai.Client(api_key=self.chave, http_options=opcoes_http)
+        return self._cliente
+
+    @staticmethod
+    def _configuracao(esquema):
+        """ Saída estruturada: a API devolve JSON validado contra o esquema. """
+        if esquema is None:
+            return None
+        return {"response_mime_type": "application/json", "response_schema": esquema}
+
+    def gerar(self, prompt, modelo, esquema=None):
+        return self.cliente.models.generate_content(
+            model=modelo, contents=prompt, config=self._configuracao(esquema)).text
+
+    def gerar_stream(self, prompt, modelo):
+        for chunk in self.cliente.models.generate_content_stream(model=modelo, contents=prompt):
+            if chunk.text:
+                yield chunk.text
+
+    async def gerar_async(self, prompt, modelo, esquema=None):
+        resposta = await self.cliente.aio.models.generate_content(
+            model=modelo, contents=prompt, config=self._configuracao(esquema))
+        return resposta.text
+
+    def validar(self):
+        # Chamada trivial (listar modelos) para forçar a autenticação; chave inválida levanta APIError.
+        self.cliente.models.list()
+
+
+_backends_gemini = {}  # (chave, base_url) -> BackendGemini: um único cliente por chave no processo.
+
+
+def obter_backend_gemini(chave, base_url=None):
+    """ Retorna o BackendGemini compartilhado desta chave (cria na primeira chamada). """
+    backend = _backends_gemini.get((chave, base_url))
+    if backend is None:
+        backend = _backends_gemini[(chave, base_url)] = BackendGemini(chave, base_url)
+    return backend
+
+
+def _topicos_sinteticos(prompt, linhas):
+    """ Tópicos determinísticos (mesmo prompt -> mesmos tópicos): (área, curso, salário). """
+    gerador = random.Random(hashlib.sha256(prompt.encode("utf-8")).digest())
+    for i in range(linhas):
+        salario = gerador.randrange(2_000, 40_000)
+        yield f"Área Sintética {gerador.randrange(1_000)}", f"Curso {i + 1}", salario
+
+
+def gerar_resposta_sintetica(prompt, linhas=20):
+    """ Texto determinístico (mesmo prompt -> mesma resposta) no formato pedido à IA. """
+    return "\n".join(f"* {area}: {curso}: {salario:,}".replace(",", ".")
+                     for area, curso, salario in _topicos_sinteticos(prompt, linhas))
+
+
+def gerar_resposta_sintetica_json(prompt, linhas=20):
+    """ Os mesmos tópicos de 'gerar_resposta_sintetica' no formato da resposta estruturada (JSON). """
+    return json.dumps([{"area": area, "curso": curso, "salario_estimado_mensal": salario}
+                       for area, curso, salario in _topicos_sinteticos(prompt, linhas)], ensure_ascii=False)
+
+
+class BackendSintetico(BackendIA):
+    """
+    Backend local e determinístico: 'linhas' tópicos por resposta, 'latencia' segundos até o
+    primeiro byte e 'intervalo_pedaco' segundos entre os pedaços do streaming.
+    """
+    nome = "sintetico"
+
+    def __init__(self, linhas=20, latencia=0.0, tamanho_pedaco=64, intervalo_pedaco=0.0):
+        self.linhas = linhas
+        self.latencia = latencia
+        self.tamanho_pedaco = tamanho_pedaco
+        self.intervalo_pedaco = intervalo_pedaco
+        self.chamadas = 0  # Quantidade de respostas geradas (útil em benchmarks).
+
+    def _resposta(self, prompt, esquema):
+        if esquema is not None:
+            return gerar_resposta_sintetica_json(prompt, self.linhas)
+        return gerar_resposta_sintetica(prompt, self.linhas)
+
+    def gerar(self, prompt, modelo, esquema=None):
+        self.chamadas += 1
+        if self.latencia:
+            time.sleep(self.latencia)
+        return self._resposta(prompt, esquema)
+
+    def gerar_stream(self, prompt, modelo):
+        self.chamadas += 1
+        if self.latencia:
+            time.sleep(self.latencia)
+        texto = gerar_resposta_sintetica(prompt, self.linhas)
+        for inicio in range(0, len(texto), self.tamanho_pedaco):
+            if inicio and self.intervalo_pedaco:
+                time.sleep(self.intervalo_pedaco)
+            yield texto[inicio:inicio + self.tamanho_pedaco]
+
+    async def gerar_async(self, prompt, modelo, esquema=None):
+        import asyncio  # Import adiado (ver BackendIA.gerar_async).
+        self.chamadas += 1
+        if self.latencia:
+            await asyncio.sleep(self.latencia)
+        return self._resposta(prompt, esquema)
+
+
+class RespostaNaoGravada(KeyError):
+    """ O modo de reprodução recebeu um prompt que não existe no arquivo de gravações. """
+
+
+class BackendGravacao(BackendIA):
+    """
+    Grava (modo 'gravar') as respostas de outro backend em um arquivo JSON Lines, ou as
+    reproduz (modo 'reproduzir') sem acessar a rede. A chave de cada gravação é o SHA-256
+    de modelo + prompt, então a reprodução é exata e reprodutível.
+    """
+    nome = "gravacao"
+
+    def __init__(self, caminho, modo="reproduzir", interno=None):
+        if modo not in ("gravar", "reproduzir"):
+            raise ValueError(f"Modo de gravação desconhecido: {modo!r}")
+        if modo == "gravar" and interno is None:
+            raise ValueError("O modo 'gravar' precisa de um backend interno.")
+        self.caminho = caminho
+        self.modo = modo
+        self.interno = interno
+        self._trava = threading.Lock()
+        self.gravacoes = {}  # chave -> texto
+        if os.path.exists(caminho):
+            with open(caminho, encoding="utf-8") as arquivo:
+                for linha in arquivo:
+                    if linha.strip():
+                        registro = json.loads(linha)
+                        self.gravacoes[registro["chave"]] = registro["texto"]
+        elif modo == "reproduzir":
+            raise FileNotFoundError(f"Arquivo de gravações não encontrado: {caminho}")
+
+    @staticmethod
+    def _chave(prompt, modelo):
+        return hashlib.sha256(f"{modelo}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def _registrar(self, chave, modelo, texto):
+        with self._trava:
+            self.gravacoes[chave] = texto
+            with open(self.caminho, "a", encoding="utf-8") as arquivo:
+                arquivo.write(json.dumps({"chave": chave, "modelo": modelo, "texto": texto}, ensure_ascii=False) + "\n")
+
+    def _reproduzir(self, chave):
+        try:
+            return self.gravacoes[chave]
+        except KeyError:
+            raise RespostaNaoGravada(f"Nenhuma resposta gravada para a chave {chave[:12]}...") from None
+
+    def gerar(self, prompt, modelo, esquema=None):
+        chave = self._chave(prompt, modelo)  # O prompt do modo estruturado é outro: chave própria.
+        if self.modo == "reproduzir":
+            return self._reproduzir(chave)
+        texto = self.interno.gerar(prompt, modelo, esquema)
+        self._registrar(chave, modelo, texto)
+        return texto
+
+    def gerar_stream(self, prompt, modelo):
+        chave = self._chave(prompt, modelo)
+        if self.modo == "reproduzir":
+            yield self._reproduzir(chave)
+            return
+        pedacos = []
+        for pedaco in self.interno.gerar_stream(prompt, modelo):
+            pedacos.append(pedaco)
+            yield pedaco
+        self._registrar(chave, modelo, "".join(pedacos))
+
+    async def gerar_async(self, prompt, modelo, esquema=None):
+        chave = self._chave(prompt, modelo)
+        if self.modo == "reproduzir":
+            return self._reproduzir(chave)
+        texto = await self.interno.gerar_async(prompt, modelo, esquema)
+        self._registrar(chave, modelo, texto)
+        return texto
+
+    def validar(self):
+        if self.interno is not None:
+            self.interno.validar()
@@ -0,0 +1,92 @@
+# --- Benchmark: vazão e latência do pipeline com backend local (sem rede) ---
+# Executa prompt -> parsing -> Mergesort contra o BackendSintetico (ou contra respostas
+# gravadas com --gravacoes), de forma sequencial e concorrente (asyncio).
+# Uso (a partir da pasta do projeto):
+#   python benchmarks/bench_backend.py --chamadas 200 --latencia-ms 50 --concorrencia 16
+#   python benchmarks/bench_backend.py --gravacoes gravacoes.jsonl
+import argparse  # Leitura dos parâmetros de linha de comando.
+import asyncio  # Execução concorrente.
+import os  # Montagem do caminho do projeto.
+import statistics  # Percentis de latência.
+import sys  # Ajuste do sys.path.
+import time  # Medição do tempo (perf_counter).
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backends import BackendGravacao, BackendSintetico  # noqa: E402  (import após ajustar o sys.path)
+from extracao import converter_linha  # noqa: E402
+from ordenacao import ordenar  # noqa: E402
+
+MODELO = "gemini-2.5-flash"
+
+
+def pipeline(texto):
+    """ Parsing + ordenação, como em coletar_dados_da_api + organizar_dados (sem mensagens). """
+    linhas = [converter_linha(linha.strip()) for linha in texto.split("\n")]
+    return ordenar([linha for linha in linhas if linha], 'salario_estimado_mensal')
+
+
+def resumir(nome, latencias, total):
+    latencias = sorted(latencias)
+    p50 = statistics.median(latencias)
+    p99 = latencias[min(len(latencias) - 1, int(len(latencias) * 0.99))]
+    print(f"{nome:<12} | {len(latencias) / total:>9.1f} | {p50 * 1000:>8.2f} | {p99 * 1000:>8.2f}")
+
+
+async def executar_concorrente(backend, prompts, concorrencia):
+    semaforo = asyncio.Semaphore(concorrencia)
+    latencias = []
+
+    async def uma(prompt):
+        async with semaforo:
+            inicio = time.perf_counter()
+            pipeline(await backend.gerar_async(prompt, MODELO))
+            latencias.append(time.perf_counter() - inicio)
+
+    await asyncio.gather(*(uma(p) for p in prompts))
+    return latencias
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vazão/latência do pipeline com backend local.")
+    parser.add_argument("--chamadas", type=int, default=200)
+    parser.add_argument("--linhas", type=int, default=20, help="Tópicos por resposta sintética.")
+    parser.add_argument("--latencia-ms", type=float, default=20.0, help="Latência simulada do backend.")
+    parser.add_argument("--concorrencia", type=int, default=16)
+    parser.add_argument("--gravacoes", help="Reproduz respostas gravadas em vez de usar o gerador sintético.")
+    args = parser.parse_args()
+
+    if args.gravacoes:
+        backend = BackendGravacao(args.gravacoes, modo="reproduzir")
+        prompts = None
+    else:
+        backend = BackendSintetico(linhas=args.linhas, latencia=args.latencia_ms / 1000)
+        prompts = [f"Perfil sintético {i}" for i in range(args.chamadas)]
+
+    print(f"{'modo':<12} | {'chamadas/s':>9} | {'p50 (ms)':>8} | {'p99 (ms)':>8}")
+    print("-" * 46)
+    if prompts is None:  # Reprodução: usa os próprios textos gravados.
+        textos = list(backend.gravacoes.values())
+        inicio = time.perf_counter()
+        latencias = []
+        for texto in textos:
+            t0 = time.perf_counter()
+            pipeline(texto)
+            latencias.append(time.perf_counter() - t0)
+        resumir("reprodução", latencias, time.perf_counter() - inicio)
+        return
+
+    latencias = []
+    inicio = time.perf_counter()
+    for prompt in prompts:
+        t0 = time.perf_counter()
+        pipeline(backend.gerar(prompt, MODELO))
+        latencias.append(time.perf_counter() - t0)
+    resumir("sequencial", latencias, time.perf_counter() - inicio)
+
+    inicio = time.perf_counter()
+    latencias = asyncio.run(executar_concorrente(backend, prompts, args.concorrencia))
+    resumir(f"async x{args.concorrencia}", latencias, time.perf_counter() - inicio)
+
+
+if __name__ == "__main__":
+    main()
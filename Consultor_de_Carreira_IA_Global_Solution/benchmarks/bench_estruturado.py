@@ -0,0 +1,107 @@
+# --- Benchmark: resposta estruturada (JSON) x tópicos de texto (Regex) ---
+# Para respostas sintéticas com N tópicos, compara a leitura atual (coletar_dados_da_api, Regex
+# sobre "* Área: Curso: Salário") com a leitura estruturada (coletar_dados_estruturados, JSON com
+# esquema + reparo), em respostas limpas e com os desvios típicos de cada formato:
+#   * tópicos: "R$" antes do salário, lista numerada, negrito, curso ausente, faixa salarial;
+#   * JSON: salário como texto, curso ausente, cercas de Markdown com vírgula sobrando, texto em volta;
+#   * ambos: resposta cortada no fim (limite de tokens).
+# Mede as linhas recuperadas por chamada (de N esperadas) e o custo de leitura por resposta.
+# Uso (a partir da pasta do projeto):
+#   python benchmarks/bench_estruturado.py --topicos 20 --fracao-desvios 0.2
+import argparse  # Leitura dos parâmetros de linha de comando.
+import contextlib  # Descarte das mensagens de leitura.
+import json  # Respostas JSON sintéticas.
+import os  # Montagem do caminho do projeto e os.devnull.
+import random  # Sorteio dos tópicos com desvio.
+import sys  # Ajuste do sys.path.
+import time  # Medição do tempo (perf_counter).
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import main  # noqa: E402  (import após ajustar o sys.path)
+from dados_sinteticos import gerar_linhas  # noqa: E402
+
+
+def _real(salario):
+    return f"{salario:,}".replace(",", ".")
+
+
+# Desvios de um tópico de texto (os que o Regex não aceita fazem a linha ser ignorada).
+DESVIOS_TEXTO = (
+    lambda i, a, c, s: f"* {a}: {c}: R$ {_real(s)}",
+    lambda i, a, c, s: f"{i}. {a}: {c}: {_real(s)}",
+    lambda i, a, c, s: f"* **{a}**: {c}: {_real(s)}",
+    lambda i, a, c, s: f"* {a}: {_real(s)}",
+    lambda i, a, c, s: f"* {a}: {c}: {_real(s)} a {_real(s * 6 // 5)}",
+)
+
+# Desvios de um objeto JSON.
+DESVIOS_JSON = (
+    lambda a, c, s: {"area": a, "curso": c, "salario_estimado_mensal": f"R$ {_real(s)},00"},
+    lambda a, c, s: {"area": a, "salario_estimado_mensal": s},
+    lambda a, c, s: {"area": a, "curso": c, "salario_estimado_mensal": float(s)},
+)
+
+
+def respostas(n, fracao, semente=42):
+    """ Cenários: nome -> (formato, texto da resposta). """
+    linhas = [(linha['area'], linha['curso'], linha['salario_estimado_mensal']) for linha in gerar_linhas(n)]
+    gerador = random.Random(semente)
+    desviar = [gerador.random() < fracao for _ in linhas]
+
+    texto_limpo = "\n".join(f"* {a}: {c}: {_real(s)}" for a, c, s in linhas)
+    texto_desvios = "\n".join(
+        gerador.choice(DESVIOS_TEXTO)(i + 1, a, c, s) if desvio else f"* {a}: {c}: {_real(s)}"
+        for i, ((a, c, s), desvio) in enumerate(zip(linhas, desviar)))
+
+    objetos = [{"area": a, "curso": c, "salario_estimado_mensal": s} for a, c, s in linhas]
+    json_limpo = json.dumps(objetos, ensure_ascii=False)
+    json_desvios = json.dumps([gerador.choice(DESVIOS_JSON)(a, c, s) if desvio else objeto
+                               for (a, c, s), objeto, desvio in zip(linhas, objetos, desviar)], ensure_ascii=False)
+    json_cercas = "```json\n" + json.dumps(objetos, ensure_ascii=False, indent=2)[:-1] + ",\n]\n```"
+    json_prosa = f"Claro! Seguem as áreas:\n{json_limpo}\nBons estudos!"
+
+    def cortar(texto):  # Corta nos últimos 10% do texto, como uma resposta interrompida.
+        return texto[:len(texto) * 9 // 10]
+
+    return {
+        "tópicos limpos": ("texto", texto_limpo),
+        "tópicos com desvios": ("texto", texto_desvios),
+        "tópicos cortados": ("texto", cortar(texto_limpo)),
+        "JSON limpo": ("json", json_limpo),
+        "JSON com desvios": ("json", json_desvios),
+        "JSON em cercas": ("json", json_cercas),
+        "JSON com texto": ("json", json_prosa),
+        "JSON cortado": ("json", cortar(json_limpo)),
+    }
+
+
+def medir(funcao, texto, repeticoes):
+    """ (linhas recuperadas, microssegundos por leitura), com as mensagens descartadas. """
+    with open(os.devnull, "w", encoding="utf-8") as nulo, contextlib.redirect_stdout(nulo):
+        linhas = funcao(texto)
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            funcao(texto)
+        return len(linhas), (time.perf_counter() - inicio) / repeticoes * 1e6
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description="Leitura estruturada (JSON) x tópicos de texto (Regex).")
+    parser.add_argument("--topicos", type=int, default=20, help="Tópicos por resposta.")
+    parser.add_argument("--fracao-desvios", type=float, default=0.2, help="Fração dos tópicos com desvio.")
+    parser.add_argument("--repeticoes", type=int, default=2000, help="Leituras por cenário.")
+    args = parser.parse_args()
+
+    leitores = {"texto": main.coletar_dados_da_api, "json": main.coletar_dados_estruturados}
+    print(f"{'cenário':<22} | {'leitura':<10} | {'linhas':>9} | {'recuperadas':>11} | {'µs/resposta':>11}")
+    print("-" * 76)
+    for nome, (formato, texto) in respostas(args.topicos, args.fracao_desvios).items():
+        recuperadas, custo = medir(leitores[formato], texto, args.repeticoes)
+        leitura = "Regex" if formato == "texto" else "JSON"
+        print(f"{nome:<22} | {leitura:<10} | {recuperadas:>4}/{args.topicos:<4} | "
+              f"{recuperadas / args.topicos:>10.0%} | {custo:>11.1f}")
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,112 @@
+# --- Benchmark: ingestão em massa x parsing linha a linha ---
+# Gera um acervo de respostas no formato da IA (com linhas fora do formato e salários com
+# centavos) e compara a vazão (MB/s) e o pico de memória de:
+#   * linha_a_linha: texto inteiro em memória + split('\n') + converter_linha (caminho atual);
+#   * massa_gerador: IngestaoEmMassa (mmap + finditer), apenas consumindo o gerador;
+#   * massa_lista / massa_tabela: ingestão em massa gravando em lista de dicionários ou TabelaColunar.
+# O pico de memória é medido com tracemalloc (alocações do Python); as páginas do mmap
+# pertencem ao cache de arquivos do sistema e não entram na conta.
+# Uso (a partir da pasta do projeto):
+#   python benchmarks/bench_ingestao.py --mb 50
+import argparse  # Leitura dos parâmetros de linha de comando.
+import os  # Montagem do caminho do projeto e tamanho do arquivo.
+import random  # Conteúdo sintético.
+import sys  # Ajuste do sys.path.
+import tempfile  # Arquivo temporário do acervo.
+import time  # Medição do tempo (perf_counter).
+import tracemalloc  # Pico de memória.
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from extracao import IngestaoEmMassa, converter_linha  # noqa: E402  (import após ajustar o sys.path)
+from tabela import TabelaColunar  # noqa: E402
+
+
+def gerar_acervo(caminho, megabytes, semente=42):
+    """ Grava respostas sintéticas até atingir 'megabytes' (10% de linhas fora do formato). """
+    gerador = random.Random(semente)
+    limite = int(megabytes * 1e6)
+    escritos = 0
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        while escritos < limite:
+            linhas = ["Aqui estão as 20 melhores áreas:"]
+            for i in range(20):
+                if gerador.random() < 0.1:
+                    linhas.append("Observação: os valores são estimativas.")
+                    continue
+                salario = f"{gerador.randrange(2_000, 40_000):,}".replace(",", ".")
+                centavos = gerador.choice(("", ",00", ",50"))
+                linhas.append(f"* Área {gerador.randrange(500)}: Curso {i + 1}: {salario}{centavos}")
+            bloco = "\n".join(linhas) + "\n\n"
+            escritos += arquivo.write(bloco)
+
+
+def linha_a_linha(caminho):
+    """ Caminho atual de 'coletar_dados_da_api': texto inteiro + split + Regex por linha. """
+    with open(caminho, encoding="utf-8") as arquivo:
+        texto = arquivo.read()
+    dados = []
+    for linha in texto.strip().split("\n"):
+        item = converter_linha(linha.strip())
+        if item:
+            dados.append(item)
+    return len(dados)
+
+
+def massa_gerador(caminho):
+    return sum(1 for _ in IngestaoEmMassa().topicos([caminho]))
+
+
+def massa_lista(caminho):
+    return len(list(IngestaoEmMassa().linhas([caminho])))
+
+
+def massa_tabela(caminho):
+    tabela = TabelaColunar()
+    for area, curso, salario in IngestaoEmMassa().topicos([caminho]):
+        tabela.adicionar(area, curso, salario)
+    return len(tabela)
+
+
+MODOS = {
+    "linha_a_linha": linha_a_linha,
+    "massa_gerador": massa_gerador,
+    "massa_lista": massa_lista,
+    "massa_tabela": massa_tabela,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vazão e memória: ingestão em massa x parsing linha a linha.")
+    parser.add_argument("--mb", type=float, default=20.0, help="Tamanho do acervo sintético em MB.")
+    parser.add_argument("--repeticoes", type=int, default=3, help="Repetições de tempo (vale o melhor).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = os.path.join(diretorio, "acervo.txt")
+        gerar_acervo(caminho, args.mb)
+        megabytes = os.path.getsize(caminho) / 1e6
+
+        print(f"Acervo: {megabytes:.1f} MB")
+        print(f"{'modo':<14} | {'tópicos':>9} | {'tempo (s)':>9} | {'MB/s':>7} | {'pico (MB)':>9}")
+        print("-" * 60)
+        referencia = None
+        for nome, funcao in MODOS.items():
+            tempos = []
+            for _ in range(args.repeticoes):
+                inicio = time.perf_counter()
+                total = funcao(caminho)
+                tempos.append(time.perf_counter() - inicio)
+            referencia = total if referencia is None else referencia
+            assert total == referencia, f"{nome} extraiu {total} tópicos; esperado {referencia}."
+
+            tracemalloc.start()  # Execução separada: o tracemalloc distorce o tempo.
+            funcao(caminho)
+            pico = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            melhor = min(tempos)
+            print(f"{nome:<14} | {total:>9} | {melhor:>9.3f} | {megabytes / melhor:>7.1f} | {pico / 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# --- Benchmark: tempo de inicialização (estilo 'python -X importtime') ---
+# Mede, em processos novos, o tempo para importar o main.py e quais módulos mais pesam.
+# Uso (a partir da pasta do projeto):
+#   python benchmarks/bench_inicializacao.py --repeticoes 10
+import argparse  # Leitura dos parâmetros de linha de comando.
+import os  # Montagem do caminho do projeto.
+import statistics  # Mediana das repetições.
+import subprocess  # Execução de processos Python novos (sem cache de módulos).
+import sys  # Caminho do interpretador atual.
+import time  # Medição do tempo total do processo.
+
+PASTA_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def medir_importtime(modulo):
+    """ Executa 'python -X importtime -c "import <modulo>"' e retorna {módulo: (próprio_us, acumulado_us)}. """
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=PASTA_PROJETO, capture_output=True, text=True, check=True)
+    tempos = {}
+    for linha in processo.stderr.splitlines():
+        if not linha.startswith("import time:") or "self [us]" in linha:
+            continue
+        proprio, acumulado, nome = linha[len("import time:"):].split("|")
+        tempos[nome.strip()] = (int(proprio), int(acumulado))
+    return tempos
+
+
+def medir_processo(codigo):
+    """ Tempo de parede (s) de um processo Python novo executando 'codigo'. """
+    inicio = time.perf_counter()
+    subprocess.run([sys.executable, "-c", codigo], cwd=PASTA_PROJETO, check=True, capture_output=True)
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo de inicialização do main.py.")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Quantidade de módulos mais pesados a listar.")
+    args = parser.parse_args()
+
+    base = statistics.median(medir_processo("pass") for _ in range(args.repeticoes))
+    total = statistics.median(medir_processo("import main") for _ in range(args.repeticoes))
+    tempos = medir_importtime("main")
+
+    print(f"Interpretador vazio:     {base * 1000:8.1f} ms")
+    print(f"Interpretador + main.py: {total * 1000:8.1f} ms  (importação: {(total - base) * 1000:.1f} ms)")
+    print(f"SDK google.genai carregado na importação: {'sim' if any(n.startswith('google') for n in tempos) else 'não'}")
+    print(f"\nMódulos mais pesados (acumulado, importtime):")
+    for nome, (_, acumulado) in sorted(tempos.items(), key=lambda item: -item[1][1])[:args.top]:
+        print(f"  {acumulado / 1000:8.2f} ms  {nome}")
+
+
+if __name__ == "__main__":
+    main()
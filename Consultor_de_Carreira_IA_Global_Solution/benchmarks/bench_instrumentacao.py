@@ -0,0 +1,48 @@
+# --- Benchmark: custo da instrumentação (desligada x ligada) ---
+# Executa o pipeline coletar_dados_da_api -> organizar_dados -> mostrar_dados várias vezes
+# sobre uma resposta sintética, com a saída descartada, e compara o tempo por execução com a
+# instrumentação desligada (padrão) e ligada (etapas + contadores + estatísticas da ordenação).
+# Uso (a partir da pasta do projeto):
+#   python benchmarks/bench_instrumentacao.py --linhas 20 --repeticoes 2000
+import argparse  # Leitura dos parâmetros de linha de comando.
+import contextlib  # Redirecionamento da saída padrão.
+import os  # Montagem do caminho do projeto e os.devnull.
+import sys  # Ajuste do sys.path.
+import time  # Medição do tempo (perf_counter).
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main  # noqa: E402  (import após ajustar o sys.path)
+from backends import gerar_resposta_sintetica  # noqa: E402
+from instrumentacao import metricas  # noqa: E402
+
+
+def executar(texto, repeticoes):
+    """ Tempo médio (em microssegundos) de uma passada do pipeline. """
+    with open(os.devnull, "w", encoding="utf-8") as nulo, contextlib.redirect_stdout(nulo):
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            dados = main.coletar_dados_da_api(texto)
+            main.mostrar_dados(main.organizar_dados(dados, 'salario_estimado_mensal'))
+        return (time.perf_counter() - inicio) / repeticoes * 1e6
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description="Custo da instrumentação no pipeline.")
+    parser.add_argument("--linhas", type=int, default=20, help="Tópicos na resposta sintética.")
+    parser.add_argument("--repeticoes", type=int, default=2000, help="Execuções do pipeline por medição.")
+    args = parser.parse_args()
+    texto = gerar_resposta_sintetica("bench", args.linhas)
+
+    executar(texto, args.repeticoes // 10)  # Aquecimento.
+    desligada = executar(texto, args.repeticoes)
+    metricas.ativar()
+    ligada = executar(texto, args.repeticoes)
+
+    print(f"{'instrumentação':<15} | {'µs/execução':>11} | {'custo':>7}")
+    print("-" * 40)
+    print(f"{'desligada':<15} | {desligada:>11.1f} | {'-':>7}")
+    print(f"{'ligada':<15} | {ligada:>11.1f} | {(ligada / desligada - 1) * 100:>6.1f}%")
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,83 @@
+# --- Benchmark: Mergesort iterativo x Mergesort recursivo original x sorted() ---
+# Uso (a partir da pasta do projeto):
+#   python benchmarks/bench_ordenacao.py
+#   python benchmarks/bench_ordenacao.py --tamanhos 1000,100000 --limite-legado 100000
+import argparse  # Leitura dos parâmetros de linha de comando.
+import os  # Montagem do caminho do projeto.
+import sys  # Ajuste do sys.path e do limite de recursão (apenas para a versão legada).
+import time  # Medição do tempo (perf_counter).
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from dados_sinteticos import gerar_linhas  # noqa: E402  (import após ajustar o sys.path)
+from ordenacao import ordenar  # noqa: E402
+
+CHAVE = 'salario_estimado_mensal'
+
+
+def mergesort_legado(lista_de_dados, chave_para_ordenar):
+    """ Cópia fiel do Mergesort recursivo original de 'organizar_dados', usada como referência. """
+
+    def merge(esquerda, direita):
+        resultado_mesclado = []
+        idx_esq, idx_dir = 0, 0
+        while idx_esq < len(esquerda) and idx_dir < len(direita):
+            if esquerda[idx_esq][chave_para_ordenar] >= direita[idx_dir][chave_para_ordenar]:
+                resultado_mesclado.append(esquerda[idx_esq])
+                idx_esq += 1
+            else:
+                resultado_mesclado.append(direita[idx_dir])
+                idx_dir += 1
+        resultado_mesclado.extend(esquerda[idx_esq:])
+        resultado_mesclado.extend(direita[idx_dir:])
+        return resultado_mesclado
+
+    def mergesort_interno(lista):
+        if len(lista) <= 1:
+            return lista
+        meio = len(lista) // 2
+        return merge(mergesort_interno(lista[:meio]), mergesort_interno(lista[meio:]))
+
+    return mergesort_interno(lista_de_dados)
+
+
+def cronometrar(funcao, *args, **kwargs):
+    """ Executa a função uma vez e retorna (segundos, resultado). """
+    inicio = time.perf_counter()
+    resultado = funcao(*args, **kwargs)
+    return time.perf_counter() - inicio, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do Mergesort de organizar_dados.")
+    parser.add_argument("--tamanhos", default="1000,10000,100000,1000000,10000000",
+                        help="Tamanhos separados por vírgula (padrão: 10^3 a 10^7).")
+    parser.add_argument("--limite-legado", type=int, default=100_000,
+                        help="Maior tamanho em que a versão recursiva original é medida.")
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(10_000)  # Só a versão legada precisa (profundidade ~ log2 n, mas por garantia).
+    print(f"{'n':>10} | {'distribuição':<12} | {'legado (s)':>10} | {'iterativo (s)':>13} | {'sorted (s)':>10}")
+    print("-" * 68)
+
+    for n in (int(float(t)) for t in args.tamanhos.split(",")):
+        cenarios = {
+            "aleatória": gerar_linhas(n, "aleatoria"),
+            "já ordenada": gerar_linhas(n, "ordenada"),
+            "invertida": gerar_linhas(n, "invertida"),
+        }
+        for nome, dados in cenarios.items():
+            t_legado = "-"
+            if n <= args.limite_legado:
+                segundos, esperado = cronometrar(mergesort_legado, dados, CHAVE)
+                t_legado = f"{segundos:.4f}"
+            t_iter, obtido = cronometrar(ordenar, dados, CHAVE, True)
+            t_sorted, referencia = cronometrar(sorted, dados, key=lambda item: -item[CHAVE])
+            if n <= args.limite_legado:
+                assert obtido == esperado, "O Mergesort iterativo divergiu da versão original."
+            assert obtido == referencia, "O Mergesort iterativo divergiu de sorted()."
+            print(f"{n:>10} | {nome:<12} | {t_legado:>10} | {t_iter:>13.4f} | {t_sorted:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
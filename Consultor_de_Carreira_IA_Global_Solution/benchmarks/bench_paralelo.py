@@ -0,0 +1,42 @@
+# --- Benchmark: Mergesort paralelo (1/2/4/8 processos) ---
+# Uso (a partir da pasta do projeto):
+#   python benchmarks/bench_paralelo.py
+#   python benchmarks/bench_paralelo.py --tamanhos 1000000 --processos 1,2,4,8
+import argparse  # Leitura dos parâmetros de linha de comando.
+import os  # Montagem do caminho do projeto.
+import sys  # Ajuste do sys.path.
+import time  # Medição do tempo (perf_counter).
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from dados_sinteticos import gerar_linhas  # noqa: E402  (import após ajustar o sys.path)
+from ordenacao import ordenar  # noqa: E402
+from ordenacao_paralela import ordenar_paralelo  # noqa: E402
+
+CHAVE = 'salario_estimado_mensal'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Speedup do Mergesort paralelo de organizar_dados.")
+    parser.add_argument("--tamanhos", default="100000,1000000", help="Tamanhos separados por vírgula.")
+    parser.add_argument("--processos", default="1,2,4,8", help="Quantidades de processos a medir.")
+    args = parser.parse_args()
+
+    print(f"Núcleos disponíveis: {os.cpu_count()}")
+    print(f"{'n':>10} | {'processos':>9} | {'tempo (s)':>9} | {'speedup':>7}")
+    print("-" * 45)
+    for n in (int(float(t)) for t in args.tamanhos.split(",")):
+        dados = gerar_linhas(n)
+        referencia = ordenar(dados, CHAVE)
+        base = None
+        for processos in (int(p) for p in args.processos.split(",")):
+            inicio = time.perf_counter()
+            obtido = ordenar_paralelo(dados, CHAVE, processos=processos, limiar=0)
+            segundos = time.perf_counter() - inicio
+            assert obtido == referencia, "A ordenação paralela divergiu do caminho serial."
+            base = base or segundos
+            print(f"{n:>10} | {processos:>9} | {segundos:>9.3f} | {base / segundos:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
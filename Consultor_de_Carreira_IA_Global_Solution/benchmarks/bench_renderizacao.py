@@ -0,0 +1,97 @@
+# --- Benchmark: renderização da tabela e exportadores ---
+# Compara o 'mostrar_dados' original (três passadas de max + um print por linha) com
+# 'renderizar_tabela' (uma passada de formatação + escrita em blocos), para lista, TabelaColunar
+# e gerador, e mede a vazão dos exportadores CSV, JSON Lines e binário.
+# A saída da tabela vai para os.devnull (mede a formatação e a escrita, não o terminal).
+# Uso (a partir da pasta do projeto):
+#   python benchmarks/bench_renderizacao.py --tamanhos 10000,1000000
+import argparse  # Leitura dos parâmetros de linha de comando.
+import contextlib  # Redirecionamento da saída padrão.
+import io  # Conferência da saída (StringIO).
+import os  # Montagem do caminho do projeto e os.devnull.
+import sys  # Ajuste do sys.path.
+import tempfile  # Arquivos temporários dos exportadores.
+import time  # Medição do tempo (perf_counter).
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from dados_sinteticos import gerar_linhas  # noqa: E402  (import após ajustar o sys.path)
+from exportacao import exportar, importar_binario  # noqa: E402
+from relatorio import renderizar_tabela  # noqa: E402
+from tabela import TabelaColunar  # noqa: E402
+
+
+def mostrar_dados_legado(dados_lista):
+    """ Cópia fiel do corpo original de 'mostrar_dados' (sem o título), usada como referência. """
+    header_area = "Área de Atuação"
+    header_curso = "Curso Exemplo"
+    header_salario = "Salário Mensal (R$)"
+    max_w_area = max(len(item['area']) for item in dados_lista)
+    max_w_curso = max(len(item['curso']) for item in dados_lista)
+    max_w_salario_num = max(len(f"{item['salario_estimado_mensal']:,}") for item in dados_lista)
+    w_area = max(len(header_area), max_w_area)
+    w_curso = max(len(header_curso), max_w_curso)
+    w_salario = max(len(header_salario), max_w_salario_num)
+    sep = " | "
+    print(f"{header_area:<{w_area}}" + sep + f"{header_curso:<{w_curso}}" + sep + f"{header_salario:>{w_salario}}")
+    total_width = w_area + w_curso + w_salario + len(sep) * 2
+    print("-" * total_width)
+    for item in dados_lista:
+        area = item['area']
+        curso = item['curso']
+        salario_f = f"{item['salario_estimado_mensal']:,}"
+        print(f"{area:<{w_area}}" + sep + f"{curso:<{w_curso}}" + sep + f"{salario_f:>{w_salario}}")
+
+
+def cronometrar(funcao, *args):
+    """ Executa a função com a saída padrão descartada e retorna o tempo em segundos. """
+    with open(os.devnull, "w", encoding="utf-8") as nulo, contextlib.redirect_stdout(nulo):
+        inicio = time.perf_counter()
+        funcao(*args)
+        return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Renderização da tabela e exportadores.")
+    parser.add_argument("--tamanhos", default="10000,200000", help="Tamanhos separados por vírgula.")
+    args = parser.parse_args()
+
+    for n in (int(float(t)) for t in args.tamanhos.split(",")):
+        dados = gerar_linhas(n)
+        tabela = TabelaColunar.de_linhas(dados)
+
+        # Conferência: mesma saída do original para a lista completa.
+        antigo, novo = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(antigo):
+            mostrar_dados_legado(dados)
+        renderizar_tabela(dados, novo)
+        assert antigo.getvalue() == novo.getvalue(), "A renderização divergiu do mostrar_dados original."
+
+        print(f"\nn = {n}")
+        print(f"{'exibição':<22} | {'tempo (s)':>9} | {'linhas/s':>11}")
+        print("-" * 49)
+        casos = [
+            ("original (lista)", mostrar_dados_legado, dados),
+            ("renderizar (lista)", renderizar_tabela, dados),
+            ("renderizar (tabela)", renderizar_tabela, tabela),
+            ("renderizar (gerador)", lambda d: renderizar_tabela(iter(d)), dados),
+        ]
+        for nome, funcao, entrada in casos:
+            tempo = cronometrar(funcao, entrada)
+            print(f"{nome:<22} | {tempo:>9.3f} | {n / tempo:>11,.0f}")
+
+        print(f"{'exportação':<22} | {'tempo (s)':>9} | {'MB':>11}")
+        print("-" * 49)
+        with tempfile.TemporaryDirectory() as diretorio:
+            for formato in ("csv", "jsonl", "bin"):
+                caminho = os.path.join(diretorio, f"ranking.{formato}")
+                inicio = time.perf_counter()
+                exportar(tabela, caminho)
+                tempo = time.perf_counter() - inicio
+                print(f"{formato:<22} | {tempo:>9.3f} | {os.path.getsize(caminho) / 1e6:>11.2f}")
+            assert list(importar_binario(os.path.join(diretorio, "ranking.bin"))) == dados, \
+                "O formato binário não reproduziu a tabela."
+
+
+if __name__ == "__main__":
+    main()
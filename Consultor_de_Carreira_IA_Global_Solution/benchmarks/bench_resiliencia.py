@@ -0,0 +1,70 @@
+# --- Benchmark: latência de cauda com e sem hedging ---
+# Simula um backend em que uma fração das chamadas é "retardatária" (muito mais lenta que
+# a mediana) e compara p50/p95/p99 de BackendResiliente sem hedging e com hedging no
+# percentil escolhido, além do custo em chamadas extras.
+# Uso (a partir da pasta do projeto):
+#   python benchmarks/bench_resiliencia.py --chamadas 300 --fracao-lentas 0.05
+import argparse  # Leitura dos parâmetros de linha de comando.
+import os  # Montagem do caminho do projeto.
+import random  # Sorteio das chamadas lentas.
+import sys  # Ajuste do sys.path.
+import threading  # Contador de chamadas compartilhado entre threads.
+import time  # Medição do tempo e latência simulada.
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backends import BackendIA  # noqa: E402  (import após ajustar o sys.path)
+from resiliencia import AMOSTRAS_MINIMAS_HEDGE, BackendResiliente  # noqa: E402
+
+
+class BackendComCauda(BackendIA):
+    """ Responde em 'rapida' segundos, exceto uma fração 'fracao_lentas' que leva 'lenta' segundos. """
+
+    def __init__(self, rapida, lenta, fracao_lentas, semente=42):
+        self.rapida = rapida
+        self.lenta = lenta
+        self.fracao_lentas = fracao_lentas
+        self.gerador = random.Random(semente)
+        self.chamadas = 0
+        self._trava = threading.Lock()
+
+    def gerar(self, prompt, modelo):
+        with self._trava:
+            self.chamadas += 1
+            lenta = self.gerador.random() < self.fracao_lentas
+        time.sleep(self.lenta if lenta else self.rapida)
+        return "* Área: Curso: 1.000"
+
+
+def percentil(ordenadas, p):
+    return ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * p / 100))]
+
+
+def medir(backend, chamadas):
+    latencias = []
+    for _ in range(chamadas):
+        inicio = time.perf_counter()
+        backend.gerar("prompt", "modelo")
+        latencias.append(time.perf_counter() - inicio)
+    return sorted(latencias[AMOSTRAS_MINIMAS_HEDGE:])  # Descarta o aquecimento do percentil.
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latência de cauda com e sem hedging.")
+    parser.add_argument("--chamadas", type=int, default=300, help="Chamadas por configuração.")
+    parser.add_argument("--rapida-ms", type=float, default=10.0, help="Latência típica.")
+    parser.add_argument("--lenta-ms", type=float, default=300.0, help="Latência das retardatárias.")
+    parser.add_argument("--fracao-lentas", type=float, default=0.05, help="Fração de chamadas retardatárias.")
+    parser.add_argument("--percentil", type=float, default=90.0, help="Percentil do hedging.")
+    args = parser.parse_args()
+
+    print(f"{'configuração':<16} | {'p50 (ms)':>8} | {'p95 (ms)':>8} | {'p99 (ms)':>8} | {'chamadas':>8}")
+    print("-" * 62)
+    for nome, percentil_hedge in (("sem hedging", None), (f"hedge p{args.percentil:g}", args.percentil)):
+        interno = BackendComCauda(args.rapida_ms / 1000, args.lenta_ms / 1000, args.fracao_lentas)
+        latencias = medir(BackendResiliente(interno, percentil_hedge=percentil_hedge), args.chamadas)
+        p50, p95, p99 = (percentil(latencias, p) * 1000 for p in (50, 95, 99))
+        print(f"{nome:<16} | {p50:>8.1f} | {p95:>8.1f} | {p99:>8.1f} | {interno.chamadas:>8}")
+
+
+if __name__ == "__main__":
+    main()
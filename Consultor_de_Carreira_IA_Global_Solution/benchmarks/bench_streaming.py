@@ -0,0 +1,62 @@
+# --- Benchmark: tempo até o primeiro tópico (streaming x resposta completa) ---
+# Simula uma IA que produz a resposta em pedaços com latência fixa por pedaço e compara:
+#   * modo atual: espera o texto inteiro e só então faz o parsing (coletar_dados_da_api);
+#   * modo streaming: analisador incremental devolve cada tópico assim que a linha termina.
+# Uso (a partir da pasta do projeto):
+#   python benchmarks/bench_streaming.py --linhas 20 --latencia-ms 40
+import argparse  # Leitura dos parâmetros de linha de comando.
+import os  # Montagem do caminho do projeto.
+import sys  # Ajuste do sys.path.
+import time  # Medição do tempo (perf_counter) e latência simulada (sleep).
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from extracao import converter_linha, linhas_do_fluxo  # noqa: E402  (import após ajustar o sys.path)
+
+
+def resposta_sintetica(linhas):
+    """ Texto no formato pedido à IA: '* Área: Curso: Salário'. """
+    return "".join(f"* Área {i}: Curso {i}: {1_000 + 37 * i:,}".replace(",", ".") + "\n" for i in range(linhas))
+
+
+def fluxo_simulado(texto, tamanho_pedaco, latencia):
+    """ Gera o texto em pedaços, aguardando 'latencia' segundos antes de cada um. """
+    for inicio in range(0, len(texto), tamanho_pedaco):
+        time.sleep(latencia)
+        yield texto[inicio:inicio + tamanho_pedaco]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo até o primeiro tópico: streaming x resposta completa.")
+    parser.add_argument("--linhas", type=int, default=20, help="Quantidade de tópicos na resposta.")
+    parser.add_argument("--tamanho-pedaco", type=int, default=64, help="Caracteres por pedaço do streaming.")
+    parser.add_argument("--latencia-ms", type=float, default=40.0, help="Latência simulada por pedaço.")
+    args = parser.parse_args()
+    texto = resposta_sintetica(args.linhas)
+    latencia = args.latencia_ms / 1000
+
+    # Modo atual: junta todos os pedaços e só então converte as linhas.
+    inicio = time.perf_counter()
+    completo = "".join(fluxo_simulado(texto, args.tamanho_pedaco, latencia))
+    linhas = [converter_linha(linha.strip()) for linha in completo.strip().split("\n")]
+    t_primeiro_bloqueante = time.perf_counter() - inicio
+    t_total_bloqueante = t_primeiro_bloqueante
+
+    # Modo streaming: cada tópico sai assim que a linha termina.
+    inicio = time.perf_counter()
+    t_primeiro_stream = None
+    itens = []
+    for item in linhas_do_fluxo(fluxo_simulado(texto, args.tamanho_pedaco, latencia)):
+        if t_primeiro_stream is None:
+            t_primeiro_stream = time.perf_counter() - inicio
+        itens.append(item)
+    t_total_stream = time.perf_counter() - inicio
+    assert itens == linhas, "O analisador incremental divergiu do parsing linha a linha."
+
+    print(f"{'modo':<12} | {'1º tópico (s)':>13} | {'total (s)':>9}")
+    print("-" * 40)
+    print(f"{'completo':<12} | {t_primeiro_bloqueante:>13.3f} | {t_total_bloqueante:>9.3f}")
+    print(f"{'streaming':<12} | {t_primeiro_stream:>13.3f} | {t_total_stream:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+# --- Suíte de Benchmarks do Pipeline (com Baselines e Checagem de Regressão) ---
+# Mede, para cada tamanho pedido (10^2 a 10^7 linhas) e com os dados de dados_sinteticos.py:
+#   * coletar_dados_da_api: texto limpo e texto com linhas fora do formato;
+#   * organizar_dados x sorted(): entrada aleatória, já ordenada, invertida e com salários repetidos;
+#   * mostrar_dados: tabela completa (saída descartada);
+#   * pipeline completo: prompt_para_ia (backend sintético, sem rede) -> coletar -> organizar -> mostrar.
+# Cada caso vale o MENOR tempo entre as repetições (o menos afetado por ruído da máquina).
+# Os resultados podem ser gravados como baseline JSON e comparados em execuções futuras:
+# a checagem termina com código 1 se algum caso ficar mais lento que a tolerância. Um caso que
+# parece ter regredido é medido de novo ('--confirmacoes' vezes) e só conta se continuar lento:
+# em máquinas compartilhadas, uma rajada de ruído não basta para reprovar a execução.
+# Os tempos do baseline são ajustados pela velocidade geral da máquina nesta execução (mediana
+# das razões de todos os casos), para que a comparação aponte casos que pioraram em relação aos
+# demais, e não uma máquina mais lenta ('--sem-normalizar' desliga o ajuste).
+# O baseline de referência do repositório fica em benchmarks/baseline.json (tamanhos padrão; o
+# bloco "ambiente" do arquivo descreve a máquina em que foi medido). Com o ajuste pela velocidade
+# da máquina ele serve de referência em outros computadores; para tempos absolutos, grave um
+# baseline próprio.
+# Uso (a partir da pasta do projeto):
+#   python benchmarks/bench_suite.py --comparar                              # contra benchmarks/baseline.json
+#   python benchmarks/bench_suite.py --salvar benchmarks/baseline.json       # regenera o baseline de referência
+#   python benchmarks/bench_suite.py --tamanhos 100,10000 --comparar outro.json --tolerancia 0.2
+import argparse  # Leitura dos parâmetros de linha de comando.
+import contextlib  # Descarte das mensagens do pipeline.
+import json  # Baselines.
+import os  # Montagem do caminho do projeto e os.devnull.
+import platform  # Descrição do ambiente no baseline.
+import statistics  # Mediana das repetições.
+import sys  # Ajuste do sys.path e código de saída.
+import time  # Medição do tempo (perf_counter).
+from operator import itemgetter  # Chave do sorted() de referência.
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import main  # noqa: E402  (import após ajustar o sys.path)
+from backends import BackendSintetico  # noqa: E402
+from dados_sinteticos import DISTRIBUICOES, gerar_linhas, gerar_texto  # noqa: E402
+
+CHAVE = 'salario_estimado_mensal'
+VERSAO_BASELINE = 1
+FRACAO_MALFORMADAS = 0.3  # Linhas ruins por tópico válido no caso 'coletar/malformadas'.
+BASELINE_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def cronometrar(funcao, repeticoes, tempo_maximo):
+    """ Executa 'funcao' até 'repeticoes' vezes (ou até somar 'tempo_maximo' s) e retorna os tempos. """
+    tempos = []
+    with open(os.devnull, "w", encoding="utf-8") as nulo, contextlib.redirect_stdout(nulo):
+        while len(tempos) < repeticoes and (not tempos or sum(tempos) < tempo_maximo):
+            inicio = time.perf_counter()
+            funcao()
+            tempos.append(time.perf_counter() - inicio)
+    return tempos
+
+
+def casos_do_tamanho(n):
+    """ Gera (nome, função) de todos os casos para 'n' linhas. Os dados são criados uma vez por caso. """
+    texto = gerar_texto(n)
+    yield f"coletar/limpo/{n}", lambda: main.coletar_dados_da_api(texto)
+    texto_ruim = gerar_texto(n, fracao_malformadas=FRACAO_MALFORMADAS)
+    yield f"coletar/malformadas/{n}", lambda: main.coletar_dados_da_api(texto_ruim)
+    del texto, texto_ruim
+
+    for distribuicao in DISTRIBUICOES:
+        linhas = gerar_linhas(n, distribuicao)
+        yield f"organizar/{distribuicao}/{n}", lambda: main.organizar_dados(linhas, CHAVE)
+        yield f"sorted/{distribuicao}/{n}", lambda: sorted(linhas, key=itemgetter(CHAVE), reverse=True)
+
+    linhas = gerar_linhas(n)
+    yield f"mostrar/aleatoria/{n}", lambda: main.mostrar_dados(linhas)
+    del linhas
+
+    main.backend = BackendSintetico(linhas=n)  # Backend falso: sem rede, resposta determinística.
+    main.cache_respostas = None
+
+    def pipeline():
+        dados = main.coletar_dados_da_api(main.prompt_para_ia("benchmark"))
+        main.mostrar_dados(main.organizar_dados(dados, CHAVE))
+    yield f"pipeline/sintetico/{n}", pipeline
+
+
+def executar(tamanhos, repeticoes, tempo_maximo, filtro=None, nomes=None):
+    """ Mede os casos (só os que contêm 'filtro' ou, se dado, só os de 'nomes') e retorna os resultados. """
+    resultados = {}
+    print(f"{'caso':<32} | {'mínimo (ms)':>12} | {'mediana (ms)':>12} | {'rep.':>4}")
+    print("-" * 70)
+    for n in tamanhos:
+        for nome, funcao in casos_do_tamanho(n):
+            if (filtro and filtro not in nome) or (nomes is not None and nome not in nomes):
+                continue
+            tempos = cronometrar(funcao, repeticoes, tempo_maximo)
+            resultados[nome] = {"n": n, "minimo_s": min(tempos), "mediana_s": statistics.median(tempos),
+                                "repeticoes": len(tempos)}
+            print(f"{nome:<32} | {min(tempos) * 1e3:>12.3f} | {statistics.median(tempos) * 1e3:>12.3f} | "
+                  f"{len(tempos):>4}")
+    return resultados
+
+
+def ler_baseline(caminho_baseline):
+    with open(caminho_baseline, encoding="utf-8") as arquivo:
+        return json.load(arquivo)["casos"]
+
+
+def fator_maquina(resultados, baseline):
+    """
+    Velocidade desta execução em relação ao baseline: mediana das razões atual/baseline de todos
+    os casos em comum (1.3 = máquina 30% mais lenta). Uma regressão de código atinge alguns casos;
+    uma máquina mais lenta (ou outra máquina) desloca todos, e esse deslocamento é descontado.
+    """
+    razoes = [atual["minimo_s"] / baseline[nome]["minimo_s"] for nome, atual in resultados.items()
+              if baseline.get(nome, {}).get("minimo_s")]
+    return statistics.median(razoes) if razoes else 1.0
+
+
+def comparar(resultados, baseline, tolerancia, minimo_absoluto, fator=1.0):
+    """
+    Compara com o baseline (já multiplicado pelo 'fator' da máquina) e retorna a lista de casos que
+    ficaram mais lentos que a tolerância.
+    """
+    regressoes = []
+    print(f"\n{'caso':<32} | {'baseline (ms)':>13} | {'atual (ms)':>10} | {'razão':>6}")
+    print("-" * 72)
+    for nome, atual in resultados.items():
+        anterior = baseline.get(nome)
+        if anterior is None:  # Caso novo: nada a comparar.
+            continue
+        base, agora = anterior["minimo_s"] * fator, atual["minimo_s"]
+        razao = agora / base if base else float("inf")
+        # Regressão: mais lento que a tolerância E com diferença absoluta acima do ruído.
+        regrediu = razao > 1 + tolerancia and agora - base > minimo_absoluto
+        marca = "  ❌ REGRESSÃO" if regrediu else ""
+        print(f"{nome:<32} | {base * 1e3:>13.3f} | {agora * 1e3:>10.3f} | {razao:>5.2f}x{marca}")
+        if regrediu:
+            regressoes.append(nome)
+    return regressoes
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description="Suíte de benchmarks do pipeline, com baselines JSON.")
+    parser.add_argument("--tamanhos", default="100,1000,10000", help="Tamanhos (linhas) separados por vírgula, até 1e7.")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Repetições máximas por caso.")
+    parser.add_argument("--tempo-maximo", type=float, default=5.0, help="Segundos máximos por caso.")
+    parser.add_argument("--filtro", help="Executa só os casos cujo nome contém este texto (ex: organizar).")
+    parser.add_argument("--salvar", metavar="ARQUIVO", help="Grava os resultados como baseline JSON.")
+    parser.add_argument("--comparar", metavar="ARQUIVO", nargs="?", const=BASELINE_PADRAO,
+                        help="Compara com um baseline JSON (código 1 se regredir); sem ARQUIVO, usa "
+                             "benchmarks/baseline.json.")
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="Lentidão relativa aceita (0.25 = 25%%).")
+    parser.add_argument("--sem-normalizar", action="store_true",
+                        help="Compara os tempos absolutos, sem descontar a velocidade geral da máquina.")
+    parser.add_argument("--confirmacoes", type=int, default=3,
+                        help="Novas medições de um caso antes de confirmá-lo como regressão.")
+    parser.add_argument("--minimo-absoluto-ms", type=float, default=0.5,
+                        help="Diferenças menores que isto (ms) nunca contam como regressão.")
+    args = parser.parse_args()
+
+    tamanhos = [int(float(t)) for t in args.tamanhos.split(",")]
+    resultados = executar(tamanhos, args.repeticoes, args.tempo_maximo, args.filtro)
+
+    if args.salvar:
+        baseline = {
+            "versao": VERSAO_BASELINE,
+            "ambiente": {"python": platform.python_version(), "implementacao": platform.python_implementation(),
+                         "plataforma": platform.platform(), "processador": platform.processor(),
+                         "nucleos": os.cpu_count()},
+            "casos": resultados,
+        }
+        with open(args.salvar, "w", encoding="utf-8") as arquivo:
+            json.dump(baseline, arquivo, ensure_ascii=False, indent=2)
+        print(f"\n-> Baseline gravado em {args.salvar}.")
+
+    if args.comparar:
+        baseline = ler_baseline(args.comparar)
+        fator = 1.0 if args.sem_normalizar else fator_maquina(resultados, baseline)
+        if fator != 1.0:
+            print(f"\n-> Fator da máquina: {fator:.2f}x o baseline (tempos do baseline ajustados por ele).")
+        regressoes = comparar(resultados, baseline, args.tolerancia, args.minimo_absoluto_ms / 1e3, fator)
+        for _ in range(args.confirmacoes):
+            if not regressoes:
+                break
+            print(f"\n-> Medindo de novo {len(regressoes)} caso(s) para confirmar a regressão...")
+            novos = executar(tamanhos, args.repeticoes, args.tempo_maximo, nomes=set(regressoes))
+            for nome, atual in novos.items():  # Vale o menor tempo entre todas as medições.
+                if atual["minimo_s"] < resultados[nome]["minimo_s"]:
+                    resultados[nome] = atual
+            regressoes = comparar({nome: resultados[nome] for nome in regressoes}, baseline,
+                                  args.tolerancia, args.minimo_absoluto_ms / 1e3, fator)
+        if regressoes:
+            print(f"\n❌ {len(regressoes)} caso(s) mais lento(s) que a tolerância de {args.tolerancia:.0%}.")
+            sys.exit(1)
+        print("\n✅ Nenhuma regressão acima da tolerância.")
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,73 @@
+# --- Benchmark: lista de dicionários x TabelaColunar (memória e vazão) ---
+# Uso (a partir da pasta do projeto):
+#   python benchmarks/bench_tabela.py --tamanhos 100000,1000000
+import argparse  # Leitura dos parâmetros de linha de comando.
+import os  # Montagem do caminho do projeto.
+import sys  # Ajuste do sys.path.
+import time  # Medição do tempo (perf_counter).
+import tracemalloc  # Medição da memória alocada por cada estrutura.
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from dados_sinteticos import gerar_linhas  # noqa: E402  (import após ajustar o sys.path)
+from ordenacao import ordenar  # noqa: E402
+from tabela import TabelaColunar, np  # noqa: E402
+
+CHAVE = 'salario_estimado_mensal'
+
+
+def gerar_tuplas(n, semente=42):
+    """ Gera 'n' linhas (área, curso, salário) com vocabulário limitado, como nas respostas reais. """
+    return [(linha['area'], linha['curso'], linha[CHAVE]) for linha in gerar_linhas(n, semente=semente)]
+
+
+def construir_lista(tuplas):
+    return [{'area': a, 'curso': c, CHAVE: s} for a, c, s in tuplas]
+
+
+def construir_tabela(tuplas):
+    tabela = TabelaColunar()
+    for a, c, s in tuplas:
+        tabela.adicionar(a, c, s)
+    return tabela
+
+
+def medir(funcao, *args):
+    """ Retorna (segundos, bytes alocados e retidos, resultado). """
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    segundos = time.perf_counter() - inicio
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return segundos, atual, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara a lista de dicionários com a TabelaColunar.")
+    parser.add_argument("--tamanhos", default="100000,1000000", help="Tamanhos separados por vírgula.")
+    args = parser.parse_args()
+
+    print(f"NumPy: {'sim' if np is not None else 'não'}")
+    print(f"{'n':>9} | {'estrutura':<9} | {'memória (MB)':>12} | {'montar (s)':>10} | {'ordenar (s)':>11} | {'iterar (s)':>10}")
+    print("-" * 77)
+    for n in (int(float(t)) for t in args.tamanhos.split(",")):
+        tuplas = gerar_tuplas(n)
+        for nome, construir, ordenar_estrutura in (
+            ("lista", construir_lista, lambda dados: ordenar(dados, CHAVE)),
+            ("colunar", construir_tabela, lambda dados: dados.ordenar(CHAVE)),
+        ):
+            t_montar, memoria, dados = medir(construir, tuplas)
+            inicio = time.perf_counter()
+            ordenados = ordenar_estrutura(dados)
+            t_ordenar = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            soma = sum(linha[CHAVE] for linha in ordenados)
+            t_iterar = time.perf_counter() - inicio
+            assert soma == sum(s for _, _, s in tuplas)
+            print(f"{n:>9} | {nome:<9} | {memoria / 2**20:>12.1f} | {t_montar:>10.3f} | {t_ordenar:>11.3f} | {t_iterar:>10.3f}")
+            del dados, ordenados
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# --- Benchmark: taxonomia grande (construção, carga compilada e busca) ---
+# Gera uma taxonomia sintética (dezenas de milhares de ocupações) e mede:
+#   * leitura do arquivo de origem (texto "A > B > C") com a montagem dos índices;
+#   * carga da forma compilada (o que acontece a cada inicialização com --taxonomia);
+#   * tempo por busca com os índices (prefixo, palavra, trecho e erro de digitação) comparado
+#     a uma varredura linear de todos os nomes normalizados.
+# Uso (a partir da pasta do projeto):
+#   python benchmarks/bench_taxonomia.py --folhas 50000 --profundidade 4
+import argparse  # Leitura dos parâmetros de linha de comando.
+import os  # Montagem do caminho do projeto.
+import sys  # Ajuste do sys.path.
+import tempfile  # Arquivos de origem e compilado temporários.
+import time  # Medição do tempo (perf_counter).
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from agregacao import normalizar_area  # noqa: E402  (import após ajustar o sys.path)
+from dados_sinteticos import gerar_caminhos_taxonomia  # noqa: E402
+from taxonomia import SEPARADOR_CAMINHO, Taxonomia, compilar_taxonomia, ler_taxonomia_fonte  # noqa: E402
+
+CONSULTAS = (("prefixo", "consul"), ("palavra", "hospit"), ("trecho", "nalise de da"), ("erro", "engenharai"))
+
+
+def cronometrar(funcao, repeticoes=1):
+    """ Menor tempo (s) entre as repetições e o último resultado. """
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def busca_linear(normalizados, consulta, limite):
+    """ Referência sem índice: confere a consulta em todos os nomes. """
+    termo = normalizar_area(consulta)
+    return [no for no, nome in enumerate(normalizados) if termo in nome][:limite]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Construção, carga compilada e busca em uma taxonomia grande.")
+    parser.add_argument("--folhas", type=int, default=50_000, help="Ocupações (folhas) da taxonomia.")
+    parser.add_argument("--profundidade", type=int, default=4, help="Níveis da taxonomia.")
+    parser.add_argument("--repeticoes", type=int, default=20, help="Repetições de cada busca.")
+    args = parser.parse_args()
+
+    caminhos = gerar_caminhos_taxonomia(args.folhas, args.profundidade)
+    with tempfile.TemporaryDirectory() as diretorio:
+        origem = os.path.join(diretorio, "ocupacoes.txt")
+        compilada = os.path.join(diretorio, "ocupacoes.bin")
+        with open(origem, "w", encoding="utf-8") as arquivo:
+            arquivo.writelines(SEPARADOR_CAMINHO.join(caminho) + "\n" for caminho in caminhos)
+
+        tempo_origem, taxonomia = cronometrar(lambda: ler_taxonomia_fonte(origem), 3)
+        compilar_taxonomia(origem, compilada)
+
+        def carregar():
+            with open(compilada, "rb") as arquivo:
+                return Taxonomia.ler_compilada(arquivo)
+        tempo_compilada, _ = cronometrar(carregar, 5)
+        tamanho_origem, tamanho_compilada = os.path.getsize(origem), os.path.getsize(compilada)
+
+    print(f"Taxonomia: {len(taxonomia):,} nós, {args.profundidade} níveis, {args.folhas:,} folhas.\n")
+    print(f"{'carga':<22} | {'tempo (ms)':>10} | {'arquivo (KB)':>12}")
+    print("-" * 50)
+    print(f"{'origem + índices':<22} | {tempo_origem * 1e3:>10.1f} | {tamanho_origem / 1024:>12.0f}")
+    print(f"{'forma compilada':<22} | {tempo_compilada * 1e3:>10.1f} | {tamanho_compilada / 1024:>12.0f}")
+
+    taxonomia.buscar("aquecimento")  # Monta o mapa de trigramas (feito uma vez, na primeira busca).
+    print(f"\n{'busca':<10} | {'consulta':<14} | {'índice (µs)':>11} | {'linear (µs)':>11} | {'resultados':>10}")
+    print("-" * 68)
+    for nome, consulta in CONSULTAS:
+        tempo_indice, resultados = cronometrar(lambda: taxonomia.buscar(consulta, 10), args.repeticoes)
+        tempo_linear, _ = cronometrar(lambda: busca_linear(taxonomia.normalizados, consulta, 10), args.repeticoes)
+        print(f"{nome:<10} | {consulta:<14} | {tempo_indice * 1e6:>11.0f} | {tempo_linear * 1e6:>11.0f} | "
+              f"{len(resultados):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# --- Benchmark: Top-K com heap x ordenação completa ---
+# Uso (a partir da pasta do projeto):
+#   python benchmarks/bench_top_k.py --tamanhos 1000000 --ks 10,50
+import argparse  # Leitura dos parâmetros de linha de comando.
+import os  # Montagem do caminho do projeto.
+import sys  # Ajuste do sys.path.
+import time  # Medição do tempo (perf_counter).
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from dados_sinteticos import gerar_linhas  # noqa: E402  (import após ajustar o sys.path)
+from ordenacao import ordenar, selecionar_top_k  # noqa: E402
+
+CHAVE = 'salario_estimado_mensal'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Top-K (heap) x Mergesort completo + fatia.")
+    parser.add_argument("--tamanhos", default="100000,1000000", help="Tamanhos separados por vírgula.")
+    parser.add_argument("--ks", default="10,50", help="Valores de K separados por vírgula.")
+    args = parser.parse_args()
+
+    print(f"{'n':>9} | {'k':>4} | {'ordenar+fatia (s)':>17} | {'top-k (s)':>9} | {'ganho':>6}")
+    print("-" * 58)
+    for n in (int(float(t)) for t in args.tamanhos.split(",")):
+        dados = gerar_linhas(n)
+        inicio = time.perf_counter()
+        completo = ordenar(dados, CHAVE)
+        t_completo = time.perf_counter() - inicio
+        for k in (int(v) for v in args.ks.split(",")):
+            inicio = time.perf_counter()
+            topo = selecionar_top_k(iter(dados), k, CHAVE)
+            t_topo = time.perf_counter() - inicio
+            assert topo == completo[:k], "O Top-K divergiu da ordenação completa."
+            print(f"{n:>9} | {k:>4} | {t_completo:>17.3f} | {t_topo:>9.3f} | {t_completo / t_topo:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
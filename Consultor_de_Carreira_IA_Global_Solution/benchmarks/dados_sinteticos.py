@@ -0,0 +1,84 @@
+# --- Geradores de Dados Sintéticos (Benchmarks) ---
+# Produz, de forma reprodutível (semente fixa), os dois formatos do pipeline:
+#   * texto no formato pedido à IA: "* Área: Curso: Salário" (entrada de coletar_dados_da_api);
+#   * lista de dicionários (entrada de organizar_dados e mostrar_dados).
+# Distribuições dos salários, incluindo casos adversariais para o Mergesort:
+#   aleatoria, ordenada (já na ordem final: maior -> menor), invertida (menor -> maior),
+#   iguais (poucos valores distintos, muitos empates).
+# O texto pode conter uma fração de linhas fora do formato (sem salário, sem marcador,
+# texto livre e linhas em branco).
+import random  # Sorteio reprodutível.
+
+DISTRIBUICOES = ("aleatoria", "ordenada", "invertida", "iguais")
+SALARIO_MINIMO, SALARIO_MAXIMO = 1_500, 60_000
+SALARIOS_REPETIDOS = (3_000, 5_000, 8_000, 12_000, 20_000)  # Distribuição 'iguais'.
+
+_MALFORMADAS = (
+    "* {area}: {curso}",  # Sem salário.
+    "{area}: {curso}: {salario}",  # Sem o marcador '*'.
+    "Observação: os valores são estimativas de mercado.",  # Texto livre.
+    "",  # Linha em branco.
+)
+
+
+def gerar_salarios(n, distribuicao="aleatoria", semente=42):
+    """ Lista de 'n' salários inteiros na distribuição pedida. """
+    if distribuicao not in DISTRIBUICOES:
+        raise ValueError(f"Distribuição desconhecida: {distribuicao!r} (use {', '.join(DISTRIBUICOES)}).")
+    gerador = random.Random(semente)
+    if distribuicao == "iguais":
+        return [gerador.choice(SALARIOS_REPETIDOS) for _ in range(n)]
+    salarios = [gerador.randrange(SALARIO_MINIMO, SALARIO_MAXIMO) for _ in range(n)]
+    if distribuicao == "ordenada":
+        salarios.sort(reverse=True)
+    elif distribuicao == "invertida":
+        salarios.sort()
+    return salarios
+
+
+def gerar_linhas(n, distribuicao="aleatoria", semente=42):
+    """ Lista de 'n' dicionários no formato do dataframe do projeto. """
+    gerador = random.Random(semente + 1)
+    return [
+        {'area': f"Área {gerador.randrange(1_000)}", 'curso': f"Curso {gerador.randrange(100)}",
+         'salario_estimado_mensal': salario}
+        for salario in gerar_salarios(n, distribuicao, semente)
+    ]
+
+
+def gerar_texto(n, distribuicao="aleatoria", fracao_malformadas=0.0, semente=42):
+    """
+    Texto com 'n' tópicos válidos no formato da IA ('12.500' ou '12.500,00') e, opcionalmente,
+    linhas fora do formato intercaladas (fracao_malformadas = linhas ruins / tópicos válidos).
+    """
+    gerador = random.Random(semente + 2)
+    linhas = []
+    for linha in gerar_linhas(n, distribuicao, semente):
+        salario = f"{linha['salario_estimado_mensal']:,}".replace(",", ".") + gerador.choice(("", ",00"))
+        linhas.append(f"* {linha['area']}: {linha['curso']}: {salario}")
+        if fracao_malformadas and gerador.random() < fracao_malformadas:
+            modelo = gerador.choice(_MALFORMADAS)
+            linhas.append(modelo.format(area=linha['area'], curso=linha['curso'], salario=salario))
+    return "\n".join(linhas)
+
+
+_RADICAIS_OCUPACOES = ("Engenharia", "Gestão", "Análise", "Técnico", "Consultoria", "Pesquisa", "Design",
+                       "Docência", "Operação", "Auditoria", "Desenvolvimento", "Coordenação")
+_COMPLEMENTOS_OCUPACOES = ("de Dados", "Hospitalar", "Ambiental", "de Sistemas", "Financeira", "Industrial",
+                           "de Produto", "Jurídica", "Educacional", "Logística", "de Segurança", "Comercial")
+
+
+def gerar_caminhos_taxonomia(folhas, profundidade=4, semente=42):
+    """
+    Caminhos (tuplas de nomes) de uma taxonomia sintética com 'folhas' ocupações e 'profundidade'
+    níveis, no formato lido por taxonomia.py (ramificação aproximadamente igual em cada nível).
+    """
+    gerador = random.Random(semente + 3)
+    ramificacao = max(2, round(folhas ** (1 / profundidade)))
+    caminhos = []
+    for i in range(folhas):
+        indices = [(i // ramificacao ** nivel) % ramificacao for nivel in range(profundidade - 1, 0, -1)]
+        grupos = tuple(f"Grupo {'.'.join(map(str, indices[:nivel + 1]))}" for nivel in range(profundidade - 1))
+        ocupacao = f"{gerador.choice(_RADICAIS_OCUPACOES)} {gerador.choice(_COMPLEMENTOS_OCUPACOES)} {i}"
+        caminhos.append(grupos + (ocupacao,))
+    return caminhos
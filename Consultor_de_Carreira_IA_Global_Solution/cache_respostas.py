@@ -0,0 +1,161 @@
+# --- Cache Persistente das Respostas da IA ---
+# O menu gera no máximo 125 perfis distintos (5 áreas x 5 campos x 5 nichos), então a mesma
+# pergunta é enviada à API muitas vezes. Este cache guarda cada resposta em um banco SQLite,
+# endereçada pelo conteúdo: hash SHA-256 de (modelo, versão do template do prompt, prompt).
+#   * TTL: respostas mais antigas que 'ttl_segundos' são descartadas.
+#   * LRU: acima de 'max_entradas', as entradas acessadas há mais tempo são removidas.
+#   * Single-flight: chamadas idênticas simultâneas aguardam uma única ida à API.
+import hashlib  # Hash SHA-256 da chave.
+import os  # Criação do diretório do banco.
+import sqlite3  # Banco de dados embutido (arquivo único).
+import threading  # Trava do banco e coordenação do single-flight.
+import time  # Carimbos de tempo (TTL e LRU).
+
+CAMINHO_PADRAO = os.path.join(os.path.expanduser("~"), ".cache", "consultor_carreira", "respostas.sqlite3")
+TTL_PADRAO_SEGUNDOS = 7 * 24 * 3600  # Uma semana: salários mudam devagar.
+MAX_ENTRADAS_PADRAO = 1000  # Folga sobre os 125 perfis do menu (e versões do template).
+
+
+def gerar_chave(modelo, prompt, versao_template):
+    """ Chave endereçada pelo conteúdo: SHA-256 de modelo + versão do template + prompt. """
+    conteudo = f"{modelo}\0{versao_template}\0{prompt}".encode("utf-8")
+    return hashlib.sha256(conteudo).hexdigest()
+
+
+class _Voo:
+    """ Uma chamada em andamento: quem chegar depois aguarda o resultado dela (single-flight). """
+    __slots__ = ("evento", "resultado", "erro")
+
+    def __init__(self):
+        self.evento = threading.Event()
+        self.resultado = None
+        self.erro = None
+
+
+class CacheRespostas:
+    """ Cache de respostas da IA em SQLite, com TTL, descarte LRU, contadores e single-flight. """
+
+    def __init__(self, caminho=CAMINHO_PADRAO, ttl_segundos=TTL_PADRAO_SEGUNDOS, max_entradas=MAX_ENTRADAS_PADRAO):
+        if caminho != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(caminho)), exist_ok=True)
+        self.ttl_segundos = ttl_segundos
+        self.max_entradas = max_entradas
+        self.acertos = 0  # Respostas servidas pelo cache.
+        self.falhas = 0  # Consultas que precisaram da API (inclui expiradas).
+        self.expiradas = 0  # Entradas descartadas por TTL.
+        self.descartadas = 0  # Entradas removidas pelo limite de tamanho (LRU).
+        self.agrupadas = 0  # Chamadas que aguardaram uma chamada idêntica em andamento (single-flight).
+        self._trava = threading.Lock()  # Protege a conexão e os contadores.
+        self._voos = {}  # chave -> _Voo em andamento.
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")  # Leituras concorrentes entre processos.
+        self._conexao.execute(
+            "CREATE TABLE IF NOT EXISTS respostas ("
+            " chave TEXT PRIMARY KEY, modelo TEXT NOT NULL, texto TEXT NOT NULL,"
+            " criado_em REAL NOT NULL, acessado_em REAL NOT NULL)"
+        )
+        self._conexao.execute("CREATE INDEX IF NOT EXISTS idx_acessado ON respostas (acessado_em)")
+        self._conexao.commit()
+
+    def obter(self, chave, contar=True):
+        """
+        Retorna o texto guardado para a chave, ou None se não existir ou tiver expirado.
+        Com contar=False, a consulta não altera os contadores de acerto/falha.
+        """
+        agora = time.time()
+        with self._trava:
+            linha = self._conexao.execute(
+                "SELECT texto, criado_em FROM respostas WHERE chave = ?", (chave,)).fetchone()
+            if linha is None:
+                self.falhas += contar
+                return None
+            texto, criado_em = linha
+            if self.ttl_segundos is not None and agora - criado_em > self.ttl_segundos:
+                self._conexao.execute("DELETE FROM respostas WHERE chave = ?", (chave,))
+                self._conexao.commit()
+                self.expiradas += 1
+                self.falhas += contar
+                return None
+            self._conexao.execute("UPDATE respostas SET acessado_em = ? WHERE chave = ?", (agora, chave))
+            self._conexao.commit()
+            self.acertos += contar
+            return texto
+
+    def guardar(self, chave, modelo, texto):
+        """ Grava (ou substitui) uma resposta e aplica o limite de tamanho (LRU). """
+        agora = time.time()
+        with self._trava:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO respostas (chave, modelo, texto, criado_em, acessado_em)"
+                " VALUES (?, ?, ?, ?, ?)", (chave, modelo, texto, agora, agora))
+            total = self._conexao.execute("SELECT COUNT(*) FROM respostas").fetchone()[0]
+            excesso = total - self.max_entradas
+            if excesso > 0:  # Remove as entradas usadas há mais tempo.
+                self._conexao.execute(
+                    "DELETE FROM respostas WHERE chave IN"
+                    " (SELECT chave FROM respostas ORDER BY acessado_em ASC LIMIT ?)", (excesso,))
+                self.descartadas += excesso
+            self._conexao.commit()
+
+    def obter_ou_calcular(self, modelo, prompt, versao_template, calcular, renovar=False):
+        """
+        Retorna a resposta do cache ou executa 'calcular()' (a chamada à API) e guarda o resultado.
+        Com renovar=True, ignora o valor guardado e o substitui pela nova resposta.
+        Chamadas idênticas simultâneas (em threads) compartilham uma única execução de 'calcular'.
+        """
+        chave = gerar_chave(modelo, prompt, versao_template)
+        if not renovar:
+            texto = self.obter(chave)
+            if texto is not None:
+                return texto
+
+        with self._trava:
+            voo = self._voos.get(chave)
+            lider = voo is None
+            if lider:  # Primeira chamada para esta chave: ela fará a ida à API.
+                voo = self._voos[chave] = _Voo()
+            else:
+                self.agrupadas += 1
+
+        if not lider:  # Outra thread já está buscando a mesma resposta: aguarda.
+            voo.evento.wait()
+            if voo.erro is not None:
+                raise voo.erro
+            return voo.resultado
+
+        try:
+            # Outra thread pode ter gravado a resposta entre a consulta acima e a liderança.
+            voo.resultado = None if renovar else self.obter(chave, contar=False)
+            if voo.resultado is not None:
+                return voo.resultado
+            voo.resultado = calcular()
+            if voo.resultado:  # Respostas vazias não são guardadas.
+                self.guardar(chave, modelo, voo.resultado)
+            return voo.resultado
+        except BaseException as erro:
+            voo.erro = erro
+            raise
+        finally:
+            with self._trava:
+                del self._voos[chave]
+            voo.evento.set()
+
+    def estatisticas(self):
+        """ Contadores de uso do cache. """
+        with self._trava:
+            entradas = self._conexao.execute("SELECT COUNT(*) FROM respostas").fetchone()[0]
+        consultas = self.acertos + self.falhas
+        return {
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "expiradas": self.expiradas,
+            "descartadas": self.descartadas,
+            "agrupadas": self.agrupadas,
+            "entradas": entradas,
+            "taxa_acerto": self.acertos / consultas if consultas else 0.0,
+        }
+
+    def fechar(self):
+        """ Fecha a conexão com o banco. """
+        with self._trava:
+            self._conexao.close()
@@ -0,0 +1,153 @@
+# --- Respostas Estruturadas (JSON com Esquema) ---
+# Alternativa à raspagem do texto "* Área: Curso: Salário" por Regex: o modelo recebe um esquema
+# JSON (lista de objetos com área, curso e salário inteiro) e a resposta é decodificada direto
+# nas linhas do dataframe, já com os tipos certos.
+#   * caminho rápido: um único 'loads' (orjson, se instalado) + validação de cada objeto;
+#   * reparo: cercas de Markdown, texto antes/depois da lista e vírgulas sobrando;
+#   * objetos avulsos: resposta cortada no meio (limite de tokens) -> os objetos completos são lidos um a um;
+#   * último recurso: o modelo respondeu em tópicos de texto -> mesmo parser Regex do modo texto.
+# Salários em texto ("12.500,00", "R$ 8.000") são convertidos com a mesma regra do modo texto.
+# Salários negativos ou acima de SALARIO_MAXIMO (limite da coluna de 64 bits da TabelaColunar,
+# ex: 1e30) são rejeitados como qualquer outro valor inválido.
+import json  # Decodificação (alternativa sem orjson).
+import re  # Reparo da resposta e salários em texto.
+
+from extracao import converter_linha, converter_salario
+from tabela import SALARIO_MAXIMO
+
+try:  # Dependência opcional: decodificação JSON mais rápida.
+    import orjson
+except ImportError:
+    orjson = None
+
+CAMPOS = ('area', 'curso', 'salario_estimado_mensal')  # Mesmo esquema da lista de dicionários.
+
+# Esquema enviado à API (subconjunto OpenAPI aceito pelo Gemini em 'response_schema').
+ESQUEMA_RESPOSTA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "area": {"type": "STRING", "description": "Nome da área de atuação."},
+            "curso": {"type": "STRING", "description": "Site ou curso de exemplo para começar."},
+            "salario_estimado_mensal": {"type": "INTEGER", "description": "Salário mensal em reais, sem centavos."},
+        },
+        "required": list(CAMPOS),
+        "propertyOrdering": list(CAMPOS),
+    },
+}
+
+# Como a resposta foi lida (também usados como sufixo dos contadores de instrumentação).
+CAMINHOS_LEITURA = ("json", "json_reparado", "objetos", "regex", "vazia")
+
+PADRAO_VIRGULA_SOBRANDO = re.compile(r',\s*([\]}])')  # "[{...},]" -> "[{...}]"
+PADRAO_OBJETO = re.compile(r'\{[^{}]*\}')  # Objetos sem aninhamento (os itens do esquema).
+PADRAO_NUMERO = re.compile(r'\d[\d.]*(?:,\d+)?')  # Salário dentro de um texto ("R$ 12.500,00").
+
+_decodificar = orjson.loads if orjson is not None else json.loads  # Ambos levantam ValueError.
+
+
+def converter_item(item):
+    """
+    Valida um objeto da resposta e o converte no dicionário do dataframe.
+    Retorna None se ele não seguir o esquema (campo ausente, área vazia, salário inválido ou fora
+    do intervalo de 0 a SALARIO_MAXIMO).
+    """
+    if not isinstance(item, dict):
+        return None
+    area, curso, salario = item.get('area'), item.get('curso'), item.get('salario_estimado_mensal')
+    if not isinstance(area, str) or not area.strip() or not isinstance(curso, str):
+        return None
+    if type(salario) is not int:  # Fora do caminho comum: aceita 12500.0 e "12.500,00" (bool não vale).
+        if isinstance(salario, float) and salario == salario and abs(salario) != float("inf"):
+            salario = int(salario)
+        else:
+            numero = PADRAO_NUMERO.search(salario) if isinstance(salario, str) else None
+            if numero is None:
+                return None
+            try:
+                salario = converter_salario(numero.group())
+            except ValueError:  # Ex: mais dígitos do que int() aceita converter (limite de 4300).
+                return None
+    if not 0 <= salario <= SALARIO_MAXIMO:
+        return None
+    return {'area': area.strip(), 'curso': curso.strip(), 'salario_estimado_mensal': salario}
+
+
+def _itens(dados):
+    """ A lista de objetos da resposta: a própria lista ou a primeira lista dentro de um objeto. """
+    if isinstance(dados, list):
+        return dados
+    if isinstance(dados, dict):
+        for valor in dados.values():
+            if isinstance(valor, list):
+                return valor
+    return None
+
+
+def _converter_itens(itens):
+    """ Converte os objetos válidos; retorna (linhas, quantidade de objetos descartados). """
+    linhas = []
+    for item in itens:
+        linha = converter_item(item)
+        if linha is not None:
+            linhas.append(linha)
+    return linhas, len(itens) - len(linhas)
+
+
+def _reparar(texto):
+    """ Recorta a lista (sem cercas e comentários em volta), remove vírgulas sobrando e tenta de novo. """
+    inicio, fim = texto.find("["), texto.rfind("]")
+    if inicio == -1 or fim < inicio:
+        return None
+    try:
+        return _decodificar(PADRAO_VIRGULA_SOBRANDO.sub(r"\1", texto[inicio:fim + 1]))
+    except ValueError:
+        return None
+
+
+def converter_resposta_json(texto):
+    """
+    Converte a resposta estruturada em linhas do dataframe, do caminho mais barato ao mais tolerante.
+    Retorna (linhas, caminho, descartados): 'caminho' é um de CAMINHOS_LEITURA e 'descartados'
+    conta os objetos (ou linhas de texto) que não puderam ser aproveitados.
+    """
+    if not texto or not texto.strip():
+        return [], "vazia", 0
+
+    # 1. Caminho rápido: JSON válido. 2. Reparo: JSON com "sujeira" em volta.
+    try:
+        dados, caminho = _decodificar(texto), "json"
+    except ValueError:
+        dados, caminho = _reparar(texto), "json_reparado"
+    itens = _itens(dados)
+    if itens:
+        linhas, descartados = _converter_itens(itens)
+        if linhas:
+            return linhas, caminho, descartados
+
+    # 3. Objetos avulsos: resposta cortada ou lista malformada, mas com objetos completos.
+    itens = []
+    for trecho in PADRAO_OBJETO.findall(texto):
+        try:
+            itens.append(_decodificar(trecho))
+        except ValueError:
+            itens.append(None)  # Conta como descartado.
+    if itens:
+        linhas, descartados = _converter_itens(itens)
+        if linhas:
+            return linhas, "objetos", descartados
+
+    # 4. Último recurso: tópicos em texto, com o mesmo parser Regex de 'coletar_dados_da_api'.
+    linhas = []
+    descartados = 0
+    for linha in texto.splitlines():
+        linha_limpa = linha.strip()
+        if not linha_limpa:
+            continue
+        item = converter_linha(linha_limpa)
+        if item is None:  # Fora do formato ou salário inválido (inclusive acima de SALARIO_MAXIMO).
+            descartados += 1
+        else:
+            linhas.append(item)
+    return linhas, "regex", descartados
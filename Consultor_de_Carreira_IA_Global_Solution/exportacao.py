@@ -0,0 +1,87 @@
+# --- Exportação dos Rankings (CSV, JSON Lines e Binário) ---
+# Envia os resultados para outros sistemas sem a formatação do console:
+#   * CSV: cabeçalho com os nomes das colunas + uma linha por tópico (módulo csv, em C).
+#   * JSON Lines: um objeto por linha; usa 'orjson' se estiver instalado (bem mais rápido).
+#   * Binário: formato colunar compacto da TabelaColunar (vocabulário + códigos + salários),
+#     gravado direto dos arrays, sem conversão por linha; lido de volta com 'importar_binario'.
+# Aceita lista de dicionários, TabelaColunar ou gerador (exceto o binário, que precisa das colunas).
+import csv  # Escrita CSV.
+import itertools  # Escrita em blocos.
+import json  # JSON Lines (alternativa sem orjson).
+import os  # Extensão do arquivo.
+
+from tabela import COLUNAS, TabelaColunar, iterar_tuplas
+
+try:  # Dependência opcional: serialização JSON mais rápida.
+    import orjson
+except ImportError:
+    orjson = None
+
+FORMATOS = ("csv", "jsonl", "bin")
+EXTENSOES = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".bin": "bin", ".cct": "bin"}
+LINHAS_POR_ESCRITA = 4096  # Linhas agrupadas em cada chamada de write (JSON Lines).
+
+
+def formato_do_caminho(caminho):
+    """ Deduz o formato pela extensão do arquivo (ex: 'ranking.csv' -> 'csv'). """
+    extensao = os.path.splitext(caminho)[1].lower()
+    try:
+        return EXTENSOES[extensao]
+    except KeyError:
+        raise ValueError(f"Extensão não reconhecida: {extensao!r} (use {', '.join(EXTENSOES)}).") from None
+
+
+def exportar_csv(dados, caminho):
+    """ Grava os dados em CSV (UTF-8). Retorna a quantidade de linhas. """
+    with open(caminho, "w", encoding="utf-8", newline="") as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(COLUNAS)
+        contador = itertools.count()
+        # zip com o contador conta as linhas sem um laço em Python.
+        escritor.writerows(linha for linha, _ in zip(iterar_tuplas(dados), contador))
+    return next(contador)
+
+
+def _json_linha(area, curso, salario):
+    if orjson is not None:
+        return orjson.dumps({COLUNAS[0]: area, COLUNAS[1]: curso, COLUNAS[2]: salario})
+    return json.dumps({COLUNAS[0]: area, COLUNAS[1]: curso, COLUNAS[2]: salario}, ensure_ascii=False).encode("utf-8")
+
+
+def exportar_jsonl(dados, caminho):
+    """ Grava os dados em JSON Lines (um objeto por linha). Retorna a quantidade de linhas. """
+    tuplas = iterar_tuplas(dados)
+    total = 0
+    with open(caminho, "wb") as arquivo:
+        while True:
+            bloco = list(itertools.islice(tuplas, LINHAS_POR_ESCRITA))
+            if not bloco:
+                break
+            arquivo.write(b"\n".join(itertools.starmap(_json_linha, bloco)) + b"\n")
+            total += len(bloco)
+    return total
+
+
+def exportar_binario(dados, caminho):
+    """ Grava os dados no formato binário colunar. Retorna a quantidade de linhas. """
+    tabela = dados if isinstance(dados, TabelaColunar) else TabelaColunar.de_linhas(dados)
+    with open(caminho, "wb") as arquivo:
+        tabela.gravar_binario(arquivo)
+    return len(tabela)
+
+
+def importar_binario(caminho):
+    """ Lê um arquivo gravado por 'exportar_binario' e retorna a TabelaColunar. """
+    with open(caminho, "rb") as arquivo:
+        return TabelaColunar.ler_binario(arquivo)
+
+
+_EXPORTADORES = {"csv": exportar_csv, "jsonl": exportar_jsonl, "bin": exportar_binario}
+
+
+def exportar(dados, caminho, formato=None):
+    """ Exporta no formato pedido (ou deduzido pela extensão). Retorna a quantidade de linhas. """
+    formato = formato or formato_do_caminho(caminho)
+    if formato not in _EXPORTADORES:
+        raise ValueError(f"Formato de exportação desconhecido: {formato!r}")
+    return _EXPORTADORES[formato](dados, caminho)
@@ -0,0 +1,170 @@
+# --- Extração dos Tópicos da IA (Parsing) ---
+# Concentra o Regex e a limpeza do salário usados por 'coletar_dados_da_api' (main.py).
+# O padrão é compilado uma única vez, no carregamento do módulo, e há um analisador
+# incremental que recebe a resposta em pedaços (streaming) e devolve cada linha assim
+# que ela termina, sem esperar a resposta completa.
+# Para grandes acervos de respostas gravadas em disco há ainda a ingestão em massa
+# ('IngestaoEmMassa'): o arquivo é mapeado em memória (mmap) e percorrido por um único
+# 'finditer' sobre o buffer inteiro, sem dividir o texto em linhas.
+import mmap  # Mapeamento dos arquivos em memória (ingestão em massa).
+import os  # Tamanho dos arquivos.
+import re  # Expressões Regulares.
+
+from tabela import SALARIO_MAXIMO  # Maior salário que cabe na coluna de 64 bits da TabelaColunar.
+
+# Regex: Busca o padrão "* [Área]: [Curso]: [Salário]" (compilado uma única vez).
+PADRAO_TOPICO = re.compile(r'^\*\s*(.*?)\s*:\s*(.*?)\s*:\s*([\d,.]+)')
+
+# Mesmo padrão, em bytes e multilinha, para percorrer um arquivo inteiro de uma vez.
+# Os espaços são [ \t\r\f\v] (nunca '\n'), para que um tópico não atravesse linhas; o salário é
+# capturado só até a primeira vírgula (grupo 3), então os centavos nem chegam a ser copiados.
+PADRAO_TOPICO_BYTES = re.compile(
+    rb'^[ \t\r\f\v]*\*[ \t\r\f\v]*(.*?)[ \t\r\f\v]*:[ \t\r\f\v]*(.*?)[ \t\r\f\v]*:[ \t\r\f\v]*'
+    rb'(?=[\d,.])([\d.]*)', re.MULTILINE)
+MAX_TEXTOS_EM_CACHE = 65_536  # Limite do cache de decodificação (bytes -> str) da ingestão em massa.
+
+
+def converter_salario(salario_str):
+    """ Converte um salário como '12.500,00' em inteiro (12500): descarta centavos e pontos de milhar. """
+    parte_inteira_str = salario_str.split(',')[0]  # Pega a parte antes da vírgula.
+    salario_limpo_str = parte_inteira_str.replace(".", "")  # Remove pontos de milhar.
+    return int(salario_limpo_str)  # Converte para inteiro (ponto de falha potencial).
+
+
+def converter_linha(linha_limpa):
+    """
+    Aplica o Regex a uma linha já sem espaços nas pontas.
+    Retorna o dicionário da linha ou None se ela não seguir o formato de tópico
+    (inclusive quando o salário não tem parte inteira, ex: ',50' ou '...', ou passa de SALARIO_MAXIMO).
+    """
+    match = PADRAO_TOPICO.match(linha_limpa)
+    if not match:
+        return None
+    try:
+        salario = converter_salario(match.group(3).strip())  # Grupo 3 (Salário).
+    except ValueError:  # Salário sem dígitos antes da vírgula: a linha é ignorada, sem encerrar o programa.
+        return None
+    if salario > SALARIO_MAXIMO:  # Não cabe na coluna int64 da TabelaColunar: linha ignorada.
+        return None
+    return {
+        'area': match.group(1).strip(),  # Grupo 1 (Área).
+        'curso': match.group(2).strip(),  # Grupo 2 (Curso).
+        'salario_estimado_mensal': salario,
+    }
+
+
+def converter_salario_bytes(inteiro):
+    """
+    Versão rápida de 'converter_salario' para a parte inteira já separada pelo Regex em bytes
+    (ex: b'12.500'): sem split, sem str intermediária; int() aceita bytes diretamente.
+    Parte inteira vazia (ex: ',50') levanta ValueError, como em 'converter_salario'.
+    """
+    return int(inteiro.replace(b'.', b''))
+
+
+class AnalisadorIncremental:
+    """
+    Recebe o texto da IA em pedaços arbitrários (como chegam do streaming) e devolve as
+    linhas completas já convertidas. Um pedaço pode conter várias linhas ou apenas parte de uma.
+    """
+
+    def __init__(self):
+        self._pendente = ""  # Início de uma linha que ainda não terminou.
+        self.linhas_ignoradas = []  # Linhas não vazias fora do formato de tópico.
+
+    def alimentar(self, pedaco):
+        """ Processa um pedaço de texto e retorna a lista de dicionários das linhas que terminaram nele. """
+        if '\n' not in pedaco:  # Nenhuma linha terminou: apenas acumula.
+            self._pendente += pedaco
+            return []
+        texto = self._pendente + pedaco
+        inicio = 0
+        resultado = []
+        while True:
+            fim = texto.find('\n', inicio)
+            if fim == -1:  # O resto ainda não tem quebra de linha: guarda para o próximo pedaço.
+                break
+            self._processar(texto[inicio:fim], resultado)
+            inicio = fim + 1
+        self._pendente = texto[inicio:]
+        return resultado
+
+    def finalizar(self):
+        """ Processa a última linha (sem quebra de linha no final) e retorna seus dados, se houver. """
+        resultado = []
+        if self._pendente:
+            self._processar(self._pendente, resultado)
+            self._pendente = ""
+        return resultado
+
+    def _processar(self, linha, resultado):
+        linha_limpa = linha.strip()
+        if not linha_limpa:  # Ignora linhas totalmente vazias.
+            return
+        item = converter_linha(linha_limpa)
+        if item is None:
+            self.linhas_ignoradas.append(linha)
+        else:
+            resultado.append(item)
+
+
+def linhas_do_fluxo(pedacos, analisador=None):
+    """ Gerador: consome um iterável de pedaços de texto e devolve cada tópico assim que a linha termina. """
+    analisador = analisador or AnalisadorIncremental()
+    for pedaco in pedacos:
+        if pedaco:
+            yield from analisador.alimentar(pedaco)
+    yield from analisador.finalizar()
+
+
+class IngestaoEmMassa:
+    """
+    Extrai os tópicos de arquivos de respostas gravadas (texto da IA, uma ou várias respostas
+    por arquivo) em uma única passada: cada arquivo é mapeado em memória e percorrido por
+    PADRAO_TOPICO_BYTES.finditer, sem 'split' nem cópias por linha.
+    Área e curso repetidos são decodificados uma única vez (cache bytes -> str).
+    """
+
+    def __init__(self):
+        self.bytes_lidos = 0  # Total de bytes percorridos.
+        self.topicos_extraidos = 0  # Tópicos extraídos.
+        self.salarios_invalidos = 0  # Tópicos descartados porque o salário não pôde ser convertido.
+        self._textos = {}  # Cache de decodificação: bytes -> str.
+
+    def _texto(self, dados):
+        texto = self._textos.get(dados)
+        if texto is None:
+            if len(self._textos) >= MAX_TEXTOS_EM_CACHE:  # Vocabulário grande demais: recomeça o cache.
+                self._textos.clear()
+            texto = self._textos[dados] = dados.decode("utf-8", "replace")
+        return texto
+
+    def topicos_do_buffer(self, buffer):
+        """ Gerador de tuplas (area, curso, salario) de um buffer de bytes (bytes, mmap, memoryview). """
+        texto, salario_de = self._texto, converter_salario_bytes
+        for match in PADRAO_TOPICO_BYTES.finditer(buffer):
+            area, curso, inteiro = match.groups()
+            try:
+                salario = salario_de(inteiro)
+            except ValueError:  # Ex: '* Área: Curso: ,50' (sem parte inteira).
+                salario = None
+            if salario is None or salario > SALARIO_MAXIMO:  # Inválido ou fora do int64 da TabelaColunar.
+                self.salarios_invalidos += 1
+                continue
+            self.topicos_extraidos += 1
+            yield texto(area), texto(curso), salario
+        self.bytes_lidos += len(buffer)
+
+    def topicos(self, caminhos):
+        """ Gerador de tuplas (area, curso, salario) de todos os arquivos, na ordem recebida. """
+        for caminho in caminhos:
+            if os.path.getsize(caminho) == 0:  # mmap não aceita arquivos vazios.
+                continue
+            with open(caminho, "rb") as arquivo, \
+                    mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield from self.topicos_do_buffer(buffer)
+
+    def linhas(self, caminhos):
+        """ Gerador de dicionários no mesmo formato de 'converter_linha'. """
+        for area, curso, salario in self.topicos(caminhos):
+            yield {'area': area, 'curso': curso, 'salario_estimado_mensal': salario}
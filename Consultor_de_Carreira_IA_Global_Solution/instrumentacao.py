@@ -0,0 +1,188 @@
+# --- Instrumentação do Pipeline (Tempos, Contadores e Perfil) ---
+# Mede onde o tempo é gasto entre as etapas (chave da API, chamada à IA, parsing, ordenação,
+# exibição) sem mudar o comportamento do programa:
+#   * etapas: blocos cronometrados ('with metricas.etapa("nome")' ou o decorador 'medir');
+#   * contadores: linhas convertidas/ignoradas, comparações e mesclagens da ordenação etc.;
+#   * relatório em JSON e no formato de texto do Prometheus;
+#   * PerfilExecucao: cProfile + tracemalloc da execução inteira (opção --profile).
+# Desativada (padrão), cada etapa custa apenas a verificação de um atributo: o decorador chama
+# a função diretamente e 'etapa' devolve um contexto vazio compartilhado.
+import functools  # Decorador 'medir'.
+import json  # Relatório em JSON.
+import time  # Relógio de alta resolução (perf_counter).
+
+PREFIXO_PROMETHEUS = "consultor_carreira"
+
+
+class _EtapaInativa:
+    """ Contexto vazio usado quando a instrumentação está desligada. """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        return False
+
+
+_ETAPA_INATIVA = _EtapaInativa()
+
+
+class _Etapa:
+    """ Cronometra um bloco e registra a duração na etapa 'nome'. """
+    __slots__ = ("metricas", "nome", "inicio")
+
+    def __init__(self, metricas, nome):
+        self.metricas = metricas
+        self.nome = nome
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *excecao):
+        self.metricas.registrar_tempo(self.nome, time.perf_counter() - self.inicio)
+        return False
+
+
+class Metricas:
+    """ Tempos por etapa e contadores da execução. Começa desligada (ver 'ativar'). """
+
+    def __init__(self):
+        self.ativo = False
+        self.etapas = {}  # nome -> [execuções, total, mínimo, máximo] (segundos).
+        self.contadores = {}  # nome -> valor acumulado.
+        self._inicio = time.perf_counter()
+
+    def ativar(self):
+        """ Liga a coleta (e zera o que já havia sido registrado). """
+        self.ativo = True
+        self.etapas.clear()
+        self.contadores.clear()
+        self._inicio = time.perf_counter()
+
+    def etapa(self, nome):
+        """ Contexto que cronometra um bloco: 'with metricas.etapa("organizar_dados"): ...'. """
+        return _Etapa(self, nome) if self.ativo else _ETAPA_INATIVA
+
+    def registrar_tempo(self, nome, segundos):
+        registro = self.etapas.get(nome)
+        if registro is None:
+            self.etapas[nome] = [1, segundos, segundos, segundos]
+        else:
+            registro[0] += 1
+            registro[1] += segundos
+            registro[2] = min(registro[2], segundos)
+            registro[3] = max(registro[3], segundos)
+
+    def contar(self, nome, valor=1):
+        """ Soma 'valor' ao contador 'nome' (nada faz com a instrumentação desligada). """
+        if self.ativo:
+            self.contadores[nome] = self.contadores.get(nome, 0) + valor
+
+    def relatorio(self):
+        """ Dicionário com a duração total, as etapas e os contadores. """
+        return {
+            "duracao_total_s": time.perf_counter() - self._inicio,
+            "etapas": {
+                nome: {"execucoes": n, "total_s": total, "media_s": total / n, "minimo_s": minimo, "maximo_s": maximo}
+                for nome, (n, total, minimo, maximo) in self.etapas.items()
+            },
+            "contadores": dict(self.contadores),
+        }
+
+    def exportar_json(self, caminho):
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(self.relatorio(), arquivo, ensure_ascii=False, indent=2)
+
+    def texto_prometheus(self):
+        """ Relatório no formato de exposição de texto do Prometheus (para o textfile collector). """
+        p = PREFIXO_PROMETHEUS
+        linhas = [
+            f"# HELP {p}_execucao_segundos Duração total da execução.",
+            f"# TYPE {p}_execucao_segundos gauge",
+            f"{p}_execucao_segundos {time.perf_counter() - self._inicio:.6f}",
+            f"# HELP {p}_etapa_segundos Tempo gasto em cada etapa do pipeline.",
+            f"# TYPE {p}_etapa_segundos summary",
+        ]
+        for nome, (n, total, _, _) in self.etapas.items():
+            rotulo = _rotulo(nome)
+            linhas.append(f'{p}_etapa_segundos_sum{{etapa="{rotulo}"}} {total:.6f}')
+            linhas.append(f'{p}_etapa_segundos_count{{etapa="{rotulo}"}} {n}')
+        for nome, valor in self.contadores.items():
+            metrica = f"{p}_{nome}_total"
+            linhas.append(f"# TYPE {metrica} counter")
+            linhas.append(f"{metrica} {valor}")
+        return "\n".join(linhas) + "\n"
+
+    def exportar_prometheus(self, caminho):
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            arquivo.write(self.texto_prometheus())
+
+    def resumo_texto(self):
+        """ Tabela curta com o tempo de cada etapa, para o console. """
+        linhas = [f"{'Etapa':<28} | {'Exec.':>5} | {'Total (s)':>9}", "-" * 49]
+        for nome, (n, total, _, _) in sorted(self.etapas.items(), key=lambda item: -item[1][1]):
+            linhas.append(f"{nome:<28} | {n:>5} | {total:>9.4f}")
+        for nome, valor in self.contadores.items():
+            linhas.append(f"{nome:<28} = {valor:,}")
+        return "\n".join(linhas)
+
+
+def _rotulo(texto):
+    """ Escapa um valor de rótulo do Prometheus (barra invertida, aspas e quebra de linha). """
+    return texto.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metricas = Metricas()  # Instância única do processo (desligada até 'metricas.ativar()').
+
+
+def medir(nome):
+    """ Decorador: cronometra cada chamada da função na etapa 'nome' (se a instrumentação estiver ativa). """
+    def decorador(funcao):
+        @functools.wraps(funcao)
+        def envolvida(*args, **kwargs):
+            if not metricas.ativo:  # Desligada: apenas esta verificação.
+                return funcao(*args, **kwargs)
+            with _Etapa(metricas, nome):
+                return funcao(*args, **kwargs)
+        return envolvida
+    return decorador
+
+
+class PerfilExecucao:
+    """
+    Perfil da execução inteira: cProfile (tempo por função) e tracemalloc (memória por linha).
+    'salvar' grava '<prefixo>.pstats' (abrir com pstats/snakeviz) e '<prefixo>_memoria.txt'.
+    """
+
+    def __init__(self, quadros_tracemalloc=1):
+        import cProfile  # Imports adiados: só quem usa --profile paga o custo.
+        import tracemalloc
+        self._tracemalloc = tracemalloc
+        self._perfilador = cProfile.Profile()
+        self._quadros = quadros_tracemalloc
+        self._instantaneo = None
+
+    def iniciar(self):
+        self._tracemalloc.start(self._quadros)
+        self._perfilador.enable()
+
+    def parar(self):
+        self._perfilador.disable()
+        self._instantaneo = self._tracemalloc.take_snapshot()
+        self.pico_memoria = self._tracemalloc.get_traced_memory()[1]
+        self._tracemalloc.stop()
+
+    def salvar(self, prefixo="perfil", linhas=25):
+        """ Grava os arquivos do perfil e retorna o resumo (funções mais caras) como texto. """
+        import io  # Imports adiados (ver __init__).
+        import pstats
+        self._perfilador.dump_stats(f"{prefixo}.pstats")
+        with open(f"{prefixo}_memoria.txt", "w", encoding="utf-8") as arquivo:
+            arquivo.write(f"Pico de memória (tracemalloc): {self.pico_memoria / 1e6:.2f} MB\n\n")
+            for estatistica in self._instantaneo.statistics("lineno")[:linhas]:
+                arquivo.write(f"{estatistica}\n")
+        resumo = io.StringIO()
+        pstats.Stats(self._perfilador, stream=resumo).sort_stats("cumulative").print_stats(linhas)
+        return resumo.getvalue()
@@ -0,0 +1,165 @@
+# --- Modo Lote (Sem Interação) ---
+# Pré-calcula os rankings de vários perfis de uma vez, sem os menus do 'input()'.
+# As chamadas à IA são assíncronas (asyncio) e controladas por:
+#   * um semáforo, que limita quantas chamadas ficam em andamento ao mesmo tempo;
+#   * um "balde de fichas" (token bucket), que limita as chamadas por segundo;
+#   * novas tentativas com espera exponencial e aleatória (jitter) para erros temporários.
+# Cada perfil concluído é gravado imediatamente em um arquivo JSON Lines, que também serve
+# de checkpoint: ao executar de novo, os perfis já gravados são pulados.
+import asyncio  # Execução concorrente das chamadas.
+import json  # Gravação do arquivo de saída (JSON Lines).
+import os  # Verificação do arquivo de saída existente.
+import random  # Jitter das esperas entre tentativas.
+import time  # Relógio monotônico do limitador de taxa.
+
+from resiliencia import erro_retentavel  # Mesmo critério de erro temporário da camada resiliente.
+from taxonomia import SEPARADOR_CAMINHO  # Separador dos níveis nos caminhos de perfil.
+
+
+class RespostaSemLinhas(Exception):
+    """ A IA respondeu, mas nenhum tópico válido foi extraído (texto vazio ou fora do formato). """
+
+
+def ler_prefixo(texto):
+    """
+    Converte um item de '--subconjunto' em tupla de nomes. Aceita o caminho no formato dos menus
+    ("Exatas > Tecnologia", mesmo separador dos arquivos de taxonomia) ou uma lista JSON
+    ('["Artes", "Design", "UX/UI"]'), para nomes que contenham qualquer caractere.
+    """
+    texto = texto.strip()
+    if texto.startswith("["):
+        return tuple(json.loads(texto))
+    return tuple(parte.strip() for parte in texto.split(SEPARADOR_CAMINHO.strip()))
+
+
+def listar_perfis(perfis, subconjunto=None):
+    """
+    Filtra os perfis (caminhos até as folhas da taxonomia, ex: (Grande Área, Campo, Nicho)).
+    'subconjunto' é uma lista opcional de prefixos (ver 'ler_prefixo'): "Exatas",
+    "Exatas > Tecnologia" ou o perfil completo "Exatas > Tecnologia > IA".
+    """
+    prefixos = [ler_prefixo(p) for p in subconjunto] if subconjunto else None
+    return [tuple(perfil) for perfil in perfis
+            if prefixos is None or any(tuple(perfil[:len(p)]) == p for p in prefixos)]
+
+
+def chave_perfil(perfil):
+    """
+    Identificador do perfil no checkpoint: a tupla de nomes, gravada como lista JSON
+    (ex: ["Artes", "Design", "UX/UI"]), sem separador que possa aparecer em um nome.
+    """
+    return tuple(perfil)
+
+
+def carregar_concluidos(caminho_saida):
+    """ Lê o arquivo de saída (se existir) e retorna as chaves dos perfis já gravados. """
+    concluidos = set()
+    if not os.path.exists(caminho_saida):
+        return concluidos
+    with open(caminho_saida, encoding="utf-8") as arquivo:
+        for linha in arquivo:
+            try:
+                perfil = json.loads(linha)["perfil"]
+            except (ValueError, KeyError):  # Linha truncada (ex: execução interrompida no meio da escrita).
+                continue
+            concluidos.add(chave_perfil(perfil))
+    return concluidos
+
+
+def _termina_com_quebra(caminho):
+    """ Verifica se o último byte do arquivo é uma quebra de linha. """
+    with open(caminho, "rb") as arquivo:
+        arquivo.seek(-1, os.SEEK_END)
+        return arquivo.read(1) == b"\n"
+
+
+class LimitadorTaxa:
+    """ Balde de fichas: no máximo 'taxa_por_segundo' chamadas por segundo, com rajadas de até 'capacidade'. """
+
+    def __init__(self, taxa_por_segundo, capacidade=None):
+        self.taxa = float(taxa_por_segundo)
+        self.capacidade = float(capacidade or max(1.0, self.taxa))
+        self._fichas = self.capacidade
+        self._ultima = time.monotonic()
+        self._trava = asyncio.Lock()
+
+    async def adquirir(self):
+        """ Aguarda até haver uma ficha disponível e a consome. """
+        async with self._trava:  # Serializa a espera: as fichas saem em ordem de chegada.
+            while True:
+                agora = time.monotonic()
+                self._fichas = min(self.capacidade, self._fichas + (agora - self._ultima) * self.taxa)
+                self._ultima = agora
+                if self._fichas >= 1:
+                    self._fichas -= 1
+                    return
+                await asyncio.sleep((1 - self._fichas) / self.taxa)
+
+
+async def chamar_com_tentativas(chamar, tentativas=5, espera_base=0.5, espera_maxima=20.0,
+                                limitador=None, eh_retentavel=erro_retentavel, gerador=random):
+    """
+    Executa 'await chamar()' com novas tentativas em caso de erro temporário.
+    A espera segue o padrão "full jitter": aleatória entre 0 e min(máximo, base * 2^tentativa).
+    """
+    for tentativa in range(tentativas):
+        if limitador is not None:
+            await limitador.adquirir()
+        try:
+            return await chamar()
+        except Exception as erro:
+            if tentativa == tentativas - 1 or not eh_retentavel(erro):
+                raise
+            await asyncio.sleep(gerador.uniform(0, min(espera_maxima, espera_base * 2 ** tentativa)))
+
+
+async def executar_lote(perfis, gerar, processar, caminho_saida, concorrencia=8, taxa_por_segundo=None,
+                        tentativas=5, espera_base=0.5, eh_retentavel=erro_retentavel, ao_concluir=None):
+    """
+    Executa o pipeline para cada perfil e grava os resultados em 'caminho_saida' (JSON Lines).
+      * gerar(perfil): corrotina que retorna o texto da IA para o perfil.
+      * processar(perfil, texto): função síncrona que retorna a lista de dicionários ordenada;
+        uma lista vazia conta como falha (nova tentativa e, se persistir, perfil fora do checkpoint).
+      * ao_concluir(perfil, erro): chamada opcional de progresso (erro é None em caso de sucesso).
+    Perfis já presentes no arquivo de saída são pulados (retomada). Retorna um resumo com as contagens.
+    """
+    concluidos = carregar_concluidos(caminho_saida)
+    pendentes = [p for p in perfis if chave_perfil(p) not in concluidos]
+    semaforo = asyncio.Semaphore(concorrencia)
+    limitador = LimitadorTaxa(taxa_por_segundo) if taxa_por_segundo else None
+    resumo = {"total": len(perfis), "pulados": len(perfis) - len(pendentes), "concluidos": 0, "falhas": 0}
+
+    with open(caminho_saida, "a", encoding="utf-8") as saida:
+        if saida.tell() and not _termina_com_quebra(caminho_saida):
+            saida.write("\n")  # Isola uma linha truncada por uma interrupção anterior.
+
+        def retentavel(erro):  # Resposta sem tópicos também merece nova tentativa.
+            return isinstance(erro, RespostaSemLinhas) or eh_retentavel(erro)
+
+        async def trabalhar(perfil):
+            async def gerar_e_processar():
+                texto = await gerar(perfil)
+                linhas = processar(perfil, texto)
+                if not linhas:  # Não entra no checkpoint: o perfil seria pulado na retomada.
+                    raise RespostaSemLinhas("a resposta da IA não trouxe nenhum tópico válido")
+                return linhas
+
+            try:
+                async with semaforo:  # Limita as chamadas em andamento.
+                    linhas = await chamar_com_tentativas(
+                        gerar_e_processar, tentativas, espera_base,
+                        limitador=limitador, eh_retentavel=retentavel)
+                registro = {"perfil": list(chave_perfil(perfil)), "linhas": linhas}
+                saida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+                saida.flush()  # Checkpoint: o perfil está salvo mesmo se o lote for interrompido.
+                resumo["concluidos"] += 1
+                erro = None
+            except Exception as falha:  # A falha de um perfil não interrompe os demais.
+                resumo["falhas"] += 1
+                erro = falha
+            if ao_concluir is not None:
+                ao_concluir(perfil, erro)
+
+        await asyncio.gather(*(trabalhar(perfil) for perfil in pendentes))
+
+    return resumo
@@ -1,15 +1,41 @@
 # --- Importações de Bibliotecas ---
-import re  # Importa a biblioteca 're' para usar Expressões Regulares (Regex).
+import argparse  # Importa a biblioteca 'argparse' para ler as opções de linha de comando.
+import atexit  # Importa 'atexit' para gravar os relatórios de instrumentação ao encerrar.
+import contextlib  # Importa 'contextlib' para silenciar as mensagens por perfil no modo lote.
+import io  # Importa 'io' (destino das mensagens silenciadas).
 import sys  # Importa a biblioteca 'sys' para interações com o interpretador e sistema.
 import time  # Importa a biblioteca 'time' para funções relacionadas ao tempo (como pausas).
 import os  # Importa a biblioteca 'os' para interagir com o sistema operacional (variáveis de ambiente).
-from google import genai  # Importa a classe principal 'genai' para comunicação com o Gemini API.
-from google.genai.errors import APIError # Importa a classe de exceção específica de erro da API para tratamento de chave inválida
+from ordenacao import ordenar, selecionar_top_k  # Importa o Mergesort iterativo e a seleção Top-K (ordenacao.py).
+from tabela import TabelaColunar  # Dataframe colunar compacto (alternativa à lista de dicionários).
+from cache_respostas import CacheRespostas, gerar_chave  # Cache persistente (SQLite) das respostas da IA.
+from backends import BackendGravacao, BackendSintetico, obter_backend_gemini  # Backends plugáveis da IA (real, sintético, gravação).
+from resiliencia import BackendResiliente, Disjuntor  # Prazo, novas tentativas, hedging e disjuntor nas chamadas.
+from validacao_chave import chave_validada, registrar_validacao  # Cache em disco da validação da chave.
+from agregacao import IndiceAreas, CRITERIOS_RANKING  # Índice persistente de áreas entre perfis (rankings globais).
+# Obs: o SDK do Google, o asyncio (modo lote) e as ordenações externa/paralela são importados
+# apenas quando usados, para que o programa inicie rápido.
+from instrumentacao import PerfilExecucao, medir, metricas  # Tempos por etapa, contadores e perfil (--profile).
+from relatorio import renderizar_tabela  # Renderização da tabela em blocos, com paginação.
+from exportacao import exportar  # Exportação para CSV, JSON Lines e binário.
+from extracao import AnalisadorIncremental, IngestaoEmMassa, converter_linha, linhas_do_fluxo  # Regex pré-compilado, streaming e ingestão em massa.
+from taxonomia import RAIZ, Taxonomia, carregar_taxonomia, compilar_taxonomia  # Menus de profundidade arbitrária com busca.
+from estruturado import ESQUEMA_RESPOSTA, converter_resposta_json  # Respostas em JSON com esquema (--estruturado).
 
 # --- Configurações Globais ---
-# Aumenta o limite padrão de recursão para 2000. Necessário para garantir que o Mergesort não falhe
-sys.setrecursionlimit(2000)  # em listas grandes, excedendo o limite padrão de 1000.
-client = None  # Inicializa a variável 'client' da API como None; será preenchida posteriormente.
+# O Mergesort agora é iterativo (bottom-up), portanto não é mais necessário aumentar o limite de recursão.
+backend = None  # Backend da IA (ver backends.py); será preenchido posteriormente.
+cache_respostas = None  # Cache das respostas da IA; None desativa o cache.
+renovar_cache = False  # Se True, ignora as respostas guardadas e grava as novas no lugar.
+inicio_rapido = False  # Se True (--rapido), remove as pausas de leitura da interface.
+indice_areas = None  # Índice de áreas acumulado entre execuções; None desativa a agregação.
+perfil_selecionado = None  # Última folha escolhida no menu: caminho da taxonomia, ex. (Grande Área, Campo, Nicho).
+taxonomia = None  # Árvore dos menus (ver taxonomia.py); por padrão, montada a partir de 'dados_profissoes'.
+linhas_por_pagina = None  # Se definido (--paginar), 'mostrar_dados' exibe as tabelas em páginas.
+MODELO_IA = "gemini-2.5-flash"  # Modelo usado nas chamadas (faz parte da chave do cache).
+VERSAO_TEMPLATE_PROMPT = 1  # Incrementar sempre que o texto de 'montar_prompt_detalhado' mudar (invalida o cache).
+OPCOES_POR_PAGINA = 20  # Opções exibidas por vez nos menus (taxonomias grandes).
+RESULTADOS_BUSCA = 10  # Resultados exibidos ao digitar um texto em vez de um número.
 
 # --- Dicionário de Dados (Base de Referência) ---
 # Esta estrutura de dados aninhada define os menus de seleção (Área > Campo > Nicho).
@@ -51,6 +77,24 @@ dados_profissoes = {
         "Comércio Exterior": ["Importação", "Exportação", "Logística Int.", "Aduaneira", "Negociação"]
     }
 }
+NIVEIS_PROFISSOES = ("Grande Área", "Campo de Atuação", "Nicho Específico")  # Nomes dos níveis nos menus.
+
+# Descrições exibidas no primeiro menu.
+DESCRICOES_AREAS = {
+    ("Exatas",): "Foco em lógica, cálculos, números e sistemas.",
+    ("Humanas",): "Foco em sociedade, cultura, comportamento e leis.",
+    ("Artes",): "Foco em criatividade, estética, expressão e design.",
+    ("Biológicas",): "Foco em vida, saúde, natureza e meio ambiente.",
+    ("Negócios",): "Foco em gestão, mercado, finanças e estratégia."
+}
+
+
+def obter_taxonomia():
+    """ Retorna a taxonomia dos menus, montando a padrão (a partir de 'dados_profissoes') no primeiro uso. """
+    global taxonomia
+    if taxonomia is None:
+        taxonomia = Taxonomia.de_dicionario(dados_profissoes, NIVEIS_PROFISSOES, DESCRICOES_AREAS)
+    return taxonomia
 
 
 # --- Funções Utilitárias (Interface) ---
@@ -62,7 +106,15 @@ def exibir_titulo(texto):
     print(f"{'=' * 40}\n")  # Imprime uma linha inferior de separação.
 
 
-def configurar_chave_api():
+def pausar(segundos):
+    """ Pausa para leitura na interface; ignorada no modo rápido ou fora de um terminal (TTY). """
+    if inicio_rapido or not sys.stdout.isatty():
+        return
+    time.sleep(segundos)
+
+
+@medir("configurar_chave_api")
+def configurar_chave_api(base_url=None):
     """ Define uma função para gerir a obtenção da chave de API. """
     exibir_titulo("Configuração de Acesso")  # Exibe o título da seção.
 
@@ -84,9 +136,9 @@ def configurar_chave_api():
 
         if chave_input:
             print("\n✅ Chave recebida. Testando conexão...")
-            time.sleep(0.5)
+            pausar(0.5)
 
-            if validar_chave_input(chave_input):
+            if validar_chave_input(chave_input, base_url):
                 return chave_input
             else:
                 print("\n❌ Chave inválida ou erro de conexão. Tente novamente.")
@@ -94,21 +146,30 @@ def configurar_chave_api():
             print("\n❌ A chave não pode estar vazia. Tente novamente.")
 
 
-def validar_chave_input(chave):
+def validar_chave_input(chave, base_url=None):
     """
-    Tenta inicializar o cliente da API e fazer uma chamada simples para validar a chave.
+    Tenta inicializar o backend Gemini e fazer uma chamada simples para validar a chave.
     Reintroduz o try/except APENAS para tratamento de erro de conexão/autenticação.
+    Uma validação bem sucedida fica guardada em disco (apenas o hash da chave e do 'base_url') até expirar.
+    'base_url' deve ser o mesmo endpoint usado depois pelo programa (--base-url).
     """
+    if chave_validada(chave, base_url=base_url):  # Validada recentemente: dispensa a ida à API.
+        print("✅ Chave validada anteriormente (cache).")
+        return True
+
+    from google.genai.errors import APIError  # Import adiado: o SDK só é carregado quando a chave precisa ser testada.
+
     try:
-        # Tenta inicializar o cliente com a chave fornecida
-        temp_client = genai.Client(api_key=chave)
+        # Obtém o backend compartilhado da chave (o mesmo cliente será reutilizado pelo programa)
+        backend_teste = obter_backend_gemini(chave, base_url=base_url)
 
         # Faz uma chamada trivial (ex: listar modelos) para forçar a autenticação
         # Se a chave for inválida, esta linha levantará uma APIError
-        temp_client.models.list()
+        backend_teste.validar()
 
         # Se chegou aqui, a chave é válida e a conexão foi estabelecida
         print("✅ Conexão estabelecida com sucesso.")
+        registrar_validacao(chave, base_url=base_url)
         return True
 
     except APIError as e:
@@ -125,149 +186,185 @@ def validar_chave_input(chave):
         return False
 
 
-def obter_escolha_usuario(opcoes, nome_nivel, permitir_voltar=False):
+def obter_escolha_usuario(opcoes, nome_nivel, permitir_voltar=False, buscar=None, por_pagina=OPCOES_POR_PAGINA):
     """
     Define uma função para exibir opções de menu, incluindo a opção 'Voltar' se permitido.
+    Listas longas são exibidas em páginas ('>' próxima, '<' anterior). Se 'buscar' for informado,
+    um texto digitado no lugar do número é pesquisado: buscar(texto) retorna pares (rótulo, valor)
+    e o valor do resultado escolhido é retornado.
     """
-    print(f"Selecione uma opção de {nome_nivel}:")  # Exibe o título do menu (nível).
+    total_paginas = max(1, -(-len(opcoes) // por_pagina))  # Divisão arredondada para cima.
+    pagina = 0  # Página exibida (começa em 0).
 
-    i = 1  # Inicializa o contador de índice para exibição (começa em 1).
-    for opcao in opcoes:  # Loop que itera sobre a lista de opções de dados.
-        print(f"   [{i}] ➤ {opcao}")  # Imprime a opção com o índice atual.
-        i = i + 1  # Incrementa o contador para a próxima linha.
-
-    # Lógica para adicionar a opção 'Voltar'
-    if permitir_voltar:  # Verifica se a opção de retorno está ativa.
-        print(f"   [{i}] ⬅️ Voltar")  # Imprime a opção 'Voltar' com o próximo índice.
-        limite_superior = i  # Define o limite superior como o índice de 'Voltar'.
-    else:
-        limite_superior = len(opcoes)  # Se não puder voltar, o limite é o tamanho da lista.
-
-    print("-" * 40)  # Imprime uma linha separadora.
+    # A opção 'Voltar' vem logo após a última opção; os números das opções não mudam entre páginas.
+    limite_superior = len(opcoes) + 1 if permitir_voltar else len(opcoes)
+    dica_busca = ", ou parte do nome para buscar" if buscar else ""
+    exibir_opcoes = True  # Reexibe a lista ao mudar de página ou ao voltar de uma busca.
 
     # Loop de validação de entrada
     while True:
-        prompt_range = f"(1-{limite_superior})"  # Define o intervalo de números válidos para o prompt.
-        entrada = input(f"Digite o número da sua escolha {prompt_range}: ")  # Solicita a entrada.
+        if exibir_opcoes:
+            print(f"Selecione uma opção de {nome_nivel}:")  # Exibe o título do menu (nível).
+            inicio = pagina * por_pagina  # Primeira opção da página atual.
+            for i, opcao in enumerate(opcoes[inicio:inicio + por_pagina], start=inicio + 1):
+                print(f"   [{i}] ➤ {opcao}")  # Imprime a opção com o índice atual.
+            if permitir_voltar:  # Verifica se a opção de retorno está ativa.
+                print(f"   [{len(opcoes) + 1}] ⬅️ Voltar")  # Imprime a opção 'Voltar' com o próximo índice.
+            if total_paginas > 1:
+                print(f"   Página {pagina + 1}/{total_paginas}: digite '>' para a próxima ou '<' para a anterior.")
+            print("-" * 40)  # Imprime uma linha separadora.
+            exibir_opcoes = False
 
-        escolha = int(entrada)  # Converte a entrada para inteiro (ponto frágil, sem try/except).
-
-        # 1. TRATAMENTO DE VOLTAR: Verifica se a escolha corresponde ao índice de 'Voltar'
+        prompt_range = f"(1-{limite_superior})"  # Define o intervalo de números válidos para o prompt.
+        entrada = input(f"Digite o número da sua escolha {prompt_range}{dica_busca}: ").strip()  # Solicita a entrada.
+
+        # 1. PAGINAÇÃO: avança ou recua uma página (circular).
+        if total_paginas > 1 and entrada in (">", "<"):
+            pagina = (pagina + (1 if entrada == ">" else -1)) % total_paginas
+            exibir_opcoes = True
+            continue
+
+        try:
+            escolha = int(entrada)  # Converte a entrada para inteiro.
+        except ValueError:
+            # 2. TEXTO: busca pelo nome (se disponível) ou mensagem de erro, sem encerrar o programa.
+            if buscar is None or not entrada:
+                print(f"❌ Opa! Digite apenas o número da opção, entre 1 e {limite_superior}.")
+                continue
+            resultados = buscar(entrada)
+            if not resultados:
+                print(f"🔍 Nenhuma opção encontrada para \"{entrada}\". Tente outro termo.")
+                continue
+            valor = escolher_resultado_busca(resultados)
+            if valor is not None:
+                return valor
+            exibir_opcoes = True  # Voltou da busca: reexibe a lista.
+            continue
+
+        # 3. TRATAMENTO DE VOLTAR: Verifica se a escolha corresponde ao índice de 'Voltar'
         if permitir_voltar and escolha == limite_superior:
             return "VOLTAR"  # Retorna a string de comando 'VOLTAR'.
 
-        # 2. TRATAMENTO DE OPÇÃO VÁLIDA: Verifica se o número está dentro do range das opções de dados
+        # 4. TRATAMENTO DE OPÇÃO VÁLIDA: Verifica se o número está dentro do range das opções de dados
         elif 1 <= escolha <= len(opcoes):
             return opcoes[escolha - 1]  # Retorna a string da opção escolhida (índice 0-based).
 
-        # 3. TRATAMENTO DE ERRO DE RANGE: Se o número for inválido
+        # 5. TRATAMENTO DE ERRO DE RANGE: Se o número for inválido
         else:
             print(
                 f"❌ Opa! O número {escolha} não está na lista. Tente entre 1 e {limite_superior}.")  # Mensagem de erro.
 
 
+def escolher_resultado_busca(resultados):
+    """ Exibe os resultados de uma busca do menu e retorna o valor escolhido (None para voltar à lista). """
+    print("\n🔍 Resultados da busca:")
+    for i, (rotulo, _) in enumerate(resultados, start=1):
+        print(f"   [{i}] ➤ {rotulo}")
+    print("   [0] ⬅️ Voltar à lista")
+    print("-" * 40)
+
+    while True:
+        entrada = input(f"Digite o número do resultado (0-{len(resultados)}): ").strip()
+        try:
+            escolha = int(entrada)
+        except ValueError:
+            print(f"❌ Opa! Digite apenas o número do resultado, entre 0 e {len(resultados)}.")
+            continue
+        if escolha == 0:
+            return None
+        if 1 <= escolha <= len(resultados):
+            return resultados[escolha - 1][1]
+        print(f"❌ Opa! O número {escolha} não está na lista. Tente entre 0 e {len(resultados)}.")
+
+
 # --- Função Principal da Interface (Menu) ---
 
+def montar_prompt_contexto(*escolhas):
+    """
+    Constrói o texto do perfil a partir do caminho escolhido na taxonomia (usado pelo menu e pelo
+    modo lote). Com 3 níveis: área, campo e foco; níveis intermediários extras entram no campo.
+    """
+    if len(escolhas) == 1:
+        return f"Atuo na área de {escolhas[0]}."
+    texto = f"Atuo na área de {escolhas[0]}, "
+    if len(escolhas) > 2:
+        texto += f"especificamente no campo de {' > '.join(escolhas[1:-1])}, "
+    return texto + f"com foco profissional em {escolhas[-1]}."
+
+
+@medir("menu_selecao_amigavel")
 def menu_selecao_amigavel():
     """
-    Define a função que gerencia os 3 menus interativos com navegação de retorno.
+    Define a função que gerencia os menus interativos com navegação de retorno: um menu por nível
+    da taxonomia (na padrão, Grande Área > Campo de Atuação > Nicho), até chegar a uma folha.
+    Em qualquer menu, digitar um texto busca a opção em toda a taxonomia e salta direto para ela.
     """
-    global dados_profissoes  # Declara uso da variável global de dados.
-
-    # Descrições usadas no primeiro menu
-    descricoes_areas = {
-        "Exatas": "Foco em lógica, cálculos, números e sistemas.",
-        "Humanas": "Foco em sociedade, cultura, comportamento e leis.",
-        "Artes": "Foco em criatividade, estética, expressão e design.",
-        "Biológicas": "Foco em vida, saúde, natureza e meio ambiente.",
-        "Negócios": "Foco em gestão, mercado, finanças e estratégia."
-    }
+    global perfil_selecionado  # Declara uso da variável global do perfil escolhido.
+    arvore = obter_taxonomia()
 
-    # Variáveis de estado para armazenar as escolhas em cada nível
-    escolha_1 = None  # Inicializa a escolha do Nível 1.
-    escolha_2 = None  # Inicializa a escolha do Nível 2.
-    escolha_3 = None  # Inicializa a escolha do Nível 3.
-    passo_atual = 1  # Inicializa a variável de controle de estado do menu no Passo 1.
+    def buscar(texto):  # Resultados da busca: (caminho completo, nó).
+        return [(" > ".join(arvore.caminho(no)), no) for no in arvore.buscar(texto, RESULTADOS_BUSCA)]
+
+    # Variável de estado: nós escolhidos em cada nível (pilha de navegação). Vazia = primeiro menu.
+    escolhas = []
 
     exibir_titulo("Consultor de Carreira IA")  # Exibe o título principal do programa.
-    print("Olá! Vou ajudar você a definir seu perfil profissional em 3 passos.")  # Mensagem de boas-vindas.
-    time.sleep(1.5)  # Pausa dramática para leitura.
+    print(f"Olá! Vou ajudar você a definir seu perfil profissional em {arvore.profundidade_maxima()} passos.")
+    pausar(1.5)  # Pausa dramática para leitura.
 
     # --- LOOP PRINCIPAL DE NAVEGAÇÃO ---
-    # O loop executa enquanto o passo atual for menor ou igual a 3 (Passos 1, 2 e 3).
-    while passo_atual <= 3:
-
-        # --- PASSO 1: Grande Área (Nível 1) ---
-        if passo_atual == 1:  # Verifica se o estado atual é o Passo 1.
-            print("\n📊 PASSO 1: A GRANDE ÁREA")  # Título da etapa.
-            for area, descricao in descricoes_areas.items():  # Itera e exibe as descrições.
+    # O loop executa até que o último nó escolhido seja uma folha da taxonomia.
+    while not escolhas or not arvore.eh_folha(escolhas[-1]):
+        no_atual = escolhas[-1] if escolhas else RAIZ
+        passo_atual = len(escolhas) + 1
+        opcoes_nos = arvore.filhos(no_atual)
+
+        # --- Título do passo: primeiro nível, nível intermediário ou último nível (nichos) ---
+        if passo_atual == 1:
+            print(f"\n📊 PASSO 1: {arvore.nome_nivel(1).upper()}")
+            descricoes = [(arvore.nomes[no], arvore.descricoes[no]) for no in opcoes_nos if no in arvore.descricoes]
+            for area, descricao in descricoes:  # Itera e exibe as descrições.
                 print(f"🔹 {area}: {descricao}")
-            print("")
-
-            opcoes_nivel_1 = list(dados_profissoes.keys())  # Obtém as chaves do dicionário principal.
-            # Chama a função de escolha. Não permite voltar (False).
-            resultado = obter_escolha_usuario(opcoes_nivel_1, "Grande Área", permitir_voltar=False)
-
-            # Atualiza o estado: armazena a escolha e avança para o Passo 2.
-            escolha_1 = resultado
-            passo_atual = 2
-            print(f"\n✅ Entendido! Vamos focar em **{escolha_1}**.")
-            time.sleep(1)
-
-        # --- PASSO 2: Subcategoria (Nível 2) ---
-        elif passo_atual == 2:  # Verifica se o estado atual é o Passo 2.
-            print(f"\n📂 PASSO 2: ESPECIALIDADE EM {escolha_1.upper()}")  # Título dinâmico baseado na escolha_1.
+            if descricoes:
+                print("")
+        elif all(arvore.eh_folha(no) for no in opcoes_nos):
+            print(f"\n🎯 PASSO {passo_atual}: NICHO EM {arvore.nomes[no_atual].upper()}")
+            print("Para finalizar, qual é o seu foco específico?\n")
+        else:
+            print(f"\n📂 PASSO {passo_atual}: ESPECIALIDADE EM {arvore.nomes[no_atual].upper()}")
             print("Qual destes campos mais te atrai?\n")
 
-            subcategorias = dados_profissoes[escolha_1]  # Acessa o dicionário de subcategorias com base na escolha_1.
-            opcoes_nivel_2 = list(subcategorias.keys())  # Obtém a lista de campos de atuação.
-            # Permite voltar para o Passo 1 (True).
-            resultado = obter_escolha_usuario(opcoes_nivel_2, "Campo de Atuação", permitir_voltar=True)
-
-            if resultado == "VOLTAR":  # Verifica se o usuário escolheu voltar.
-                # Reinicia o estado para o Passo 1, limpando a escolha anterior.
-                passo_atual = 1
-                escolha_1 = None
-                time.sleep(0.5)
-                continue  # Volta ao início do loop 'while' para reexibir o Passo 1.
-
-            # Atualiza o estado: armazena a escolha e avança para o Passo 3.
-            escolha_2 = resultado
-            passo_atual = 3
-            print(f"\n✅ Ótima escolha: **{escolha_2}**.")
-            time.sleep(1)
-
-        # --- PASSO 3: Nicho Específico (Nível 3) ---
-        elif passo_atual == 3:  # Verifica se o estado atual é o Passo 3.
-            print(f"\n🎯 PASSO 3: NICHO EM {escolha_2.upper()}")  # Título dinâmico baseado na escolha_2.
-            print("Para finalizar, qual é o seu foco específico?\n")
+        nomes_opcoes = [arvore.nomes[no] for no in opcoes_nos]
+        # Permite voltar a partir do segundo passo.
+        resultado = obter_escolha_usuario(nomes_opcoes, arvore.nome_nivel(passo_atual),
+                                          permitir_voltar=passo_atual > 1, buscar=buscar)
 
-            areas_finais = dados_profissoes[escolha_1][escolha_2]  # Acessa a lista final de nichos.
-            # Permite voltar para o Passo 2 (True).
-            resultado = obter_escolha_usuario(areas_finais, "Nicho Específico", permitir_voltar=True)
+        if resultado == "VOLTAR":  # Verifica se o usuário escolheu voltar.
+            escolhas.pop()  # Reabre o passo anterior, limpando a escolha dele.
+            pausar(0.5)
+            continue
 
-            if resultado == "VOLTAR":  # Verifica se o usuário escolheu voltar.
-                # Reinicia o estado para o Passo 2, limpando a escolha anterior.
-                passo_atual = 2
-                escolha_2 = None
-                time.sleep(0.5)
-                continue  # Volta ao início do loop 'while' para reexibir o Passo 2.
+        if isinstance(resultado, int):  # Resultado de busca: salta direto para o nó encontrado.
+            escolhas = arvore.linhagem(resultado)
+        else:
+            escolhas.append(opcoes_nos[nomes_opcoes.index(resultado)])
 
-            # Sai do loop: armazena a escolha e define o passo como 4.
-            escolha_3 = resultado
-            passo_atual = 4
+        if not arvore.eh_folha(escolhas[-1]):  # Ainda há um nível abaixo: confirma e segue.
+            if len(escolhas) == 1:
+                print(f"\n✅ Entendido! Vamos focar em **{arvore.nomes[escolhas[-1]]}**.")
+            else:
+                print(f"\n✅ Ótima escolha: **{arvore.nomes[escolhas[-1]]}**.")
+            pausar(1)
 
-    # --- FINALIZAÇÃO (Executada após passo_atual se tornar 4) ---
-    time.sleep(0.5)
+    # --- FINALIZAÇÃO (Executada ao chegar a uma folha) ---
+    pausar(0.5)
     exibir_titulo("Resultado Gerado")  # Exibe o título final.
 
-    # Constrói o prompt final concatenando as 3 escolhas.
-    lista_prompt = [escolha_1, escolha_2, escolha_3]
-    prompt_final = (
-        f"Atuo na área de {lista_prompt[0]}, "
-        f"especificamente no campo de {lista_prompt[1]}, "
-        f"com foco profissional em {lista_prompt[2]}."
-    )
+    # Guarda a folha escolhida: o índice de áreas registra de qual perfil veio cada observação.
+    perfil_selecionado = arvore.caminho(escolhas[-1])
+
+    # Constrói o prompt final concatenando as escolhas.
+    prompt_final = montar_prompt_contexto(*perfil_selecionado)
 
     print("Aqui está o resumo do seu perfil:\n")  # Mensagem de conclusão.
     print(f"📝 \"{prompt_final}\"")  # Imprime o prompt gerado.
@@ -278,197 +375,639 @@ def menu_selecao_amigavel():
 
 # --- Funções de Processamento de Dados (API e Mergesort) ---
 
-def prompt_para_ia(prompt_texto):
-    """ Envia um prompt para a API Gemini e retorna o texto de resposta. """
-    global client  # Acessa a variável global do cliente da API.
+def montar_prompt_detalhado(prompt_contexto):
+    """ Monta o prompt final detalhado, instruindo a IA sobre o formato de saída desejado. """
+    return f"""
+    {prompt_contexto}.
+    Apresente as 20 melhores áreas mais relevantes no futuro da tecnologia, com maiores salários mensais, no Brasil, de acordo com as minhas capacidades.
+    Apresente também um exemplo de site, curso simples, por onde posso começar.
+
+    Responda **APENAS** com tópicos (bullet points).
+    Não inclua nenhum texto antes ou depois dos tópicos.
+
+    Use o formato exato:
+    * [Nome da Área]: [Curso de exemplo]: [Salário mensal como número inteiro]
+
+    Exemplo:
+    * Engenharia de Software: FIAP: 2.500
+    * Engenharia de Petróleo: Curso Hipotético: 2.750
+    """
+
+
+def montar_prompt_estruturado(prompt_contexto):
+    """ Versão do prompt para a resposta estruturada (--estruturado): o formato vem do esquema JSON. """
+    return f"""
+    {prompt_contexto}.
+    Apresente as 20 melhores áreas mais relevantes no futuro da tecnologia, com maiores salários mensais, no Brasil, de acordo com as minhas capacidades.
+    Apresente também um exemplo de site, curso simples, por onde posso começar.
+
+    Responda com uma lista JSON com um objeto por área, contendo os campos "area", "curso" e
+    "salario_estimado_mensal" (salário mensal em reais, como número inteiro, sem pontos nem centavos).
+    """
+
+
+@medir("prompt_para_ia")
+def prompt_para_ia(prompt_texto, esquema=None):
+    """
+    Envia um prompt para a API Gemini e retorna o texto de resposta (consultando o cache, se ativo).
+    Com 'esquema' (ver estruturado.py), a API responde em JSON no formato do esquema.
+    """
+    global backend, cache_respostas  # Acessa as variáveis globais do backend da IA e do cache.
     print(f"\n-> Enviando prompt para a API...")
 
-    # Chamada da API: especifica o modelo e o conteúdo. Retorna apenas o texto.
-    response = client.models.generate_content(
-        model="gemini-2.5-flash",
-        contents=prompt_texto
-    ).text
+    def chamar_api():
+        # Chamada da API (via backend): especifica o modelo e o conteúdo. Retorna apenas o texto.
+        with metricas.etapa("api"):  # Latência da API (acertos do cache não entram).
+            return backend.gerar(prompt_texto, MODELO_IA, esquema)
+
+    try:
+        if cache_respostas is None:  # Cache desativado: sempre chama a API.
+            response = chamar_api()
+        else:
+            acertos_antes = cache_respostas.acertos
+            response = cache_respostas.obter_ou_calcular(
+                MODELO_IA, prompt_texto, VERSAO_TEMPLATE_PROMPT, chamar_api, renovar=renovar_cache)
+            if cache_respostas.acertos > acertos_antes:
+                print("-> Resposta encontrada no cache.")
+    except Exception as e:
+        # Falha definitiva (após as novas tentativas da camada resiliente): prazo, disjuntor aberto, erro da API...
+        print(f"❌ Falha na chamada à API: {e}")
+        return ""
 
     print("-> Resposta recebida.")
     return response  # Retorna o bloco de texto da IA.
 
 
-def coletar_dados_da_api(response_text):
-    """ Converte o texto da API (tópicos formatados) em uma lista de dicionários. """
+def prompt_para_ia_stream(prompt_texto):
+    """ Versão em streaming de 'prompt_para_ia': gera os pedaços de texto à medida que a IA responde. """
+    global backend, cache_respostas  # Acessa as variáveis globais do backend da IA e do cache.
+    print(f"\n-> Enviando prompt para a API (streaming)...")
+
+    chave = gerar_chave(MODELO_IA, prompt_texto, VERSAO_TEMPLATE_PROMPT)
+    if cache_respostas is not None and not renovar_cache:
+        texto_guardado = cache_respostas.obter(chave)
+        if texto_guardado is not None:  # Acerto: a resposta inteira sai de uma vez.
+            print("-> Resposta encontrada no cache.")
+            yield texto_guardado
+            return
+
+    # Chamada da API em streaming: cada pedaço traz um trecho do texto da resposta.
+    pedacos = []  # Acumula a resposta para gravá-la no cache ao final.
+    inicio = time.perf_counter()
+    try:
+        for pedaco in backend.gerar_stream(prompt_texto, MODELO_IA):
+            if not pedacos and metricas.ativo:  # Latência da API até o primeiro pedaço.
+                metricas.registrar_tempo("api_primeiro_pedaco", time.perf_counter() - inicio)
+            pedacos.append(pedaco)
+            yield pedaco
+    except Exception as e:
+        # Mesmo tratamento de 'prompt_para_ia': prazo, disjuntor aberto, erro da API...
+        # Os tópicos já entregues são mantidos; a resposta incompleta não vai para o cache.
+        print(f"❌ Falha na chamada à API: {e}")
+        return
+
+    if cache_respostas is not None and pedacos:
+        cache_respostas.guardar(chave, MODELO_IA, "".join(pedacos))
+    print("-> Resposta recebida.")
+
+
+@medir("coletar_dados_da_api_stream")
+def coletar_dados_da_api_stream(pedacos_texto, colunar=False):
+    """
+    Versão em streaming de 'coletar_dados_da_api': consome os pedaços de texto da IA,
+    exibe cada tópico assim que a linha termina e informa o tempo até o primeiro tópico.
+    Retorna a lista de dicionários (ou TabelaColunar) completa ao final.
+    """
+    print("-> Formatando dados da API (Tópicos, streaming)...")
+    dataframe_lista = TabelaColunar() if colunar else []
+    inicio = time.perf_counter()  # Marca o início para medir o tempo até o primeiro tópico.
+    tempo_primeiro = None
+    analisador = AnalisadorIncremental()  # Guarda a linha incompleta entre um pedaço e outro.
+
+    for item in linhas_do_fluxo(pedacos_texto, analisador):
+        if tempo_primeiro is None:
+            tempo_primeiro = time.perf_counter() - inicio
+            print(f"-> Primeiro tópico recebido em {tempo_primeiro:.3f} s.")
+        print(f"   • {item['area']} | {item['curso']} | {item['salario_estimado_mensal']:,}")
+        if colunar:
+            dataframe_lista.adicionar(item['area'], item['curso'], item['salario_estimado_mensal'])
+        else:
+            dataframe_lista.append(item)
+
+    for linha in analisador.linhas_ignoradas:
+        print(f"-> Linha ignorada (formato de tópico não reconhecido): {linha}")
+    metricas.contar("linhas_convertidas", len(dataframe_lista))
+    metricas.contar("linhas_ignoradas", len(analisador.linhas_ignoradas))
+
+    tempo_total = time.perf_counter() - inicio
+    print(f"-> {len(dataframe_lista)} tópicos convertidos para o dataframe em {tempo_total:.3f} s.")
+    return dataframe_lista
+
+
+@medir("coletar_dados_da_api")
+def coletar_dados_da_api(response_text, colunar=False):
+    """
+    Converte o texto da API (tópicos formatados) em uma lista de dicionários.
+    Com colunar=True, retorna uma TabelaColunar (mais compacta para grandes volumes).
+    """
     print("-> Formatando dados da API (Tópicos)...")
     if not response_text:  # Verifica se a resposta está vazia.
-        return []
+        return TabelaColunar() if colunar else []
 
-    dataframe_lista = []  # Inicializa a lista que atuará como nosso "dataframe".
+    dataframe_lista = TabelaColunar() if colunar else []  # Inicializa o "dataframe" (lista ou tabela colunar).
     linhas = response_text.strip().split('\n')  # Divide o texto em linhas.
+    ignoradas = 0  # Linhas não vazias fora do formato de tópico (instrumentação).
 
     for linha in linhas:  # Processa cada linha individualmente.
         linha_limpa = linha.strip()  # Remove espaços iniciais/finais.
-        # Regex: Busca o padrão "* [Área]: [Curso]: [Salário]"
-        match = re.match(r'^\*\s*(.*?)\s*:\s*(.*?)\s*:\s*([\d,.]+)', linha_limpa)
-
-        if match:  # Se a linha corresponder ao padrão Regex:
-            area = match.group(1).strip()  # Captura o Grupo 1 (Área).
-            curso = match.group(2).strip()  # Captura o Grupo 2 (Curso).
-            salario_str = match.group(3).strip()  # Captura o Grupo 3 (Salário, como string).
-
-            # Limpeza do Salário:
-            parte_inteira_str = salario_str.split(',')[0]  # Pega a parte antes da vírgula.
-            salario_limpo_str = parte_inteira_str.replace(".", "")  # Remove pontos de milhar.
-            salario_int = int(salario_limpo_str)  # Converte para inteiro (ponto de falha potencial).
-
-            item_dicionario = {  # Cria o dicionário com os dados extraídos.
-                'area': area,
-                'curso': curso,
-                'salario_estimado_mensal': salario_int  # Armazena o valor numérico (int).
-            }
-            dataframe_lista.append(item_dicionario)  # Adiciona o dicionário à lista.
+        # Regex (pré-compilado em extracao.py): Busca o padrão "* [Área]: [Curso]: [Salário]"
+        item_dicionario = converter_linha(linha_limpa)
+
+        if item_dicionario:  # Se a linha corresponder ao padrão Regex:
+            if colunar:  # Tabela colunar: grava direto nas colunas.
+                dataframe_lista.adicionar(item_dicionario['area'], item_dicionario['curso'],
+                                          item_dicionario['salario_estimado_mensal'])
+            else:
+                dataframe_lista.append(item_dicionario)  # Adiciona o dicionário à lista.
         else:
             if linha_limpa:  # Ignora linhas totalmente vazias.
                 print(f"-> Linha ignorada (formato de tópico não reconhecido): {linha}")
+                ignoradas += 1
 
+    metricas.contar("linhas_convertidas", len(dataframe_lista))
+    metricas.contar("linhas_ignoradas", ignoradas)
     print(f"-> {len(dataframe_lista)} tópicos convertidos para o dataframe.")
     return dataframe_lista  # Retorna a lista de dicionários.
 
 
-def mostrar_dados(dados_lista, titulo="Dados da API"):
-    """ Imprime a lista de dicionários formatada como tabela. """
+@medir("coletar_dados_estruturados")
+def coletar_dados_estruturados(response_text, colunar=False):
+    """
+    Versão de 'coletar_dados_da_api' para a resposta estruturada (--estruturado): decodifica o JSON
+    direto nas linhas do dataframe. Fora do esquema, a resposta é reparada ou, por último, lida como
+    tópicos de texto com o mesmo Regex (ver estruturado.py).
+    """
+    print("-> Formatando dados da API (JSON)...")
+    linhas, caminho, descartados = converter_resposta_json(response_text)
+
+    avisos = {
+        "json_reparado": "JSON reparado (texto em volta da lista ou vírgulas sobrando)",
+        "objetos": "objetos recuperados um a um (resposta incompleta ou malformada)",
+        "regex": "resposta sem JSON; tópicos de texto lidos pelo Regex",
+    }
+    if caminho in avisos:
+        print(f"-> Resposta fora do esquema: {avisos[caminho]}.")
+    if descartados:
+        print(f"-> {descartados} item(ns) ignorado(s) por não seguirem o esquema.")
+    metricas.contar("linhas_convertidas", len(linhas))
+    metricas.contar("linhas_ignoradas", descartados)
+    metricas.contar(f"respostas_{caminho}")  # Quantas respostas precisaram de cada caminho de leitura.
+
+    print(f"-> {len(linhas)} tópicos convertidos para o dataframe.")
+    return TabelaColunar.de_linhas(linhas) if colunar else linhas
+
+
+@medir("coletar_dados_de_arquivos")
+def coletar_dados_de_arquivos(caminhos, colunar=False, gerador=False):
+    """
+    Ingestão em massa de respostas gravadas em disco (um ou mais arquivos de texto com os tópicos).
+    Os arquivos são mapeados em memória e percorridos em uma única passada (ver IngestaoEmMassa).
+    Retorna uma lista de dicionários, uma TabelaColunar (colunar=True) ou, com gerador=True,
+    um gerador de dicionários (memória constante).
+    """
+    print(f"-> Importando {len(caminhos)} arquivo(s) de respostas...")
+    ingestao = IngestaoEmMassa()
+    if gerador:  # Os contadores da ingestão ficam em 'ingestao' (o gerador ainda não foi consumido).
+        return ingestao.linhas(caminhos)
+    if colunar:
+        dataframe = TabelaColunar()
+        for area, curso, salario in ingestao.topicos(caminhos):
+            dataframe.adicionar(area, curso, salario)
+    else:
+        dataframe = list(ingestao.linhas(caminhos))
+    metricas.contar("linhas_convertidas", ingestao.topicos_extraidos)
+    metricas.contar("salarios_invalidos", ingestao.salarios_invalidos)
+    metricas.contar("bytes_importados", ingestao.bytes_lidos)
+    print(f"-> {ingestao.topicos_extraidos} tópicos convertidos ({ingestao.bytes_lidos / 1e6:.1f} MB lidos, "
+          f"{ingestao.salarios_invalidos} salário(s) inválido(s)).")
+    return dataframe
+
+
+@medir("mostrar_dados")
+def mostrar_dados(dados_lista, titulo="Dados da API", limite=None, chave_limite='salario_estimado_mensal'):
+    """
+    Imprime a lista de dicionários formatada como tabela (ver relatorio.py).
+    Aceita listas, TabelaColunar e geradores (transmitidos sem serem guardados na memória).
+    Com 'limite', exibe apenas os 'limite' maiores valores de 'chave_limite' (Top-K com heap,
+    sem ordenar tudo), na mesma ordem que o Mergesort decrescente produziria.
+    Com a variável global 'linhas_por_pagina', a tabela é exibida em páginas.
+    """
     print(f"\n--- {titulo} ---")
-    if not dados_lista:  # Verifica se há dados a serem exibidos.
+    if limite is not None:  # Top-K: aceita qualquer iterável, inclusive geradores.
+        dados_lista = selecionar_top_k(dados_lista, limite, chave_limite, decrescente=True)
+    # Larguras calculadas em uma passada, escrita em blocos e paginação opcional.
+    exibidas = renderizar_tabela(dados_lista, por_pagina=linhas_por_pagina, continuar=continuar_paginacao)
+    metricas.contar("linhas_exibidas", exibidas)
+    if not exibidas:
         print("Nenhum dado para mostrar.")
-        return
 
-    # 1. Definição de Cabeçalhos
-    header_area = "Área de Atuação"
-    header_curso = "Curso Exemplo"
-    header_salario = "Salário Mensal (R$)"
 
-    # 2. Cálculo da largura máxima para garantir o alinhamento da tabela
-    max_w_area = max(len(item['area']) for item in dados_lista)  # Largura máxima do campo 'area'.
-    max_w_curso = max(len(item['curso']) for item in dados_lista)  # Largura máxima do campo 'curso'.
-    max_w_salario_num = max(
-        len(f"{item['salario_estimado_mensal']:,}") for item in dados_lista)  # Largura máxima do salário formatado.
+def continuar_paginacao():
+    """ Pergunta entre as páginas da tabela se a exibição deve continuar. """
+    try:
+        return input("-- Enter para a próxima página, 'q' para parar -- ").strip().lower() != "q"
+    except EOFError:  # Entrada encerrada (ex: redirecionada de um arquivo): para a paginação.
+        print()
+        return False
 
-    w_area = max(len(header_area), max_w_area)  # Largura final da coluna Área.
-    w_curso = max(len(header_curso), max_w_curso)  # Largura final da coluna Curso.
-    w_salario = max(len(header_salario), max_w_salario_num)  # Largura final da coluna Salário.
-    sep = " | "  # Separador entre colunas.
 
-    # 3. Impressão do Cabeçalho
-    print(
-        f"{header_area:<{w_area}}" + sep +  # Alinha a Área à esquerda.
-        f"{header_curso:<{w_curso}}" + sep +  # Alinha o Curso à esquerda.
-        f"{header_salario:>{w_salario}}"  # Alinha o Salário à direita.
-    )
-    total_width = w_area + w_curso + w_salario + len(sep) * 2  # Calcula o tamanho total da linha.
-    print("-" * total_width)  # Imprime o separador horizontal.
-
-    # 4. Impressão dos Dados
-    for item in dados_lista:  # Itera sobre cada dicionário na lista.
-        area = item['area']
-        curso = item['curso']
-        salario_f = f"{item['salario_estimado_mensal']:,}"  # Formata o número com separadores de milhar.
-
-        print(
-            f"{area:<{w_area}}" + sep +
-            f"{curso:<{w_curso}}" + sep +
-            f"{salario_f:>{w_salario}}"
-        )
-
-
-def organizar_dados(lista_de_dados, chave_para_ordenar):
+@medir("organizar_dados")
+def organizar_dados(lista_de_dados, chave_para_ordenar, decrescente=True, modo="memoria",
+                    memoria_max_mb=None, processos=None):
     """
     Função principal do algoritmo Mergesort.
+    'chave_para_ordenar' pode ser uma chave ou uma tupla de chaves (ex: ('salario_estimado_mensal', 'area')),
+    e 'decrescente' um booleano ou uma tupla com o sentido de cada chave (ex: (True, False)).
+    A ordenação é estável: itens empatados mantêm a ordem original.
+    Modos: "memoria" (padrão, retorna uma lista), "externo" (aceita qualquer iterável, usa o disco
+    com no máximo 'memoria_max_mb' de RAM e retorna um gerador) ou "paralelo" (usa 'processos'
+    núcleos; listas pequenas seguem pelo caminho serial).
     """
 
-    print(f"\nIniciando organização (Maior -> Menor) por '{chave_para_ordenar}'...")
+    sentido = "Maior -> Menor" if decrescente is True else "Menor -> Maior" if decrescente is False else "Múltiplas chaves"
+    print(f"\nIniciando organização ({sentido}) por '{chave_para_ordenar}'...")
+
+    if isinstance(lista_de_dados, TabelaColunar) and modo != "externo":
+        # Tabela colunar: ordena os índices (argsort) e reordena as colunas, sem criar dicionários.
+        dados_ordenados = lista_de_dados.ordenar(chave_para_ordenar, decrescente)
+        print("Organização concluída.")
+        return dados_ordenados
+
+    if modo == "externo":  # Ordenação out-of-core: os dados são consumidos sob demanda pelo chamador.
+        from ordenacao_externa import ordenar_externo, MEMORIA_PADRAO_MB  # Import adiado (inicialização rápida).
+        memoria_max_mb = memoria_max_mb or MEMORIA_PADRAO_MB
+        print(f"Modo externo: usando até {memoria_max_mb} MB de memória e arquivos temporários.")
+        return ordenar_externo(lista_de_dados, chave_para_ordenar, decrescente, memoria_max_mb)
+    if modo == "paralelo":  # Partições ordenadas em processos separados e mescladas aqui.
+        from ordenacao_paralela import ordenar_paralelo  # Import adiado (inicialização rápida).
+        dados_ordenados = ordenar_paralelo(lista_de_dados, chave_para_ordenar, decrescente, processos)
+        print("Organização concluída.")
+        return dados_ordenados
+    if modo != "memoria":
+        raise ValueError(f"Modo de ordenação desconhecido: {modo!r}")
+
+    # Mergesort iterativo: extrai cada chave uma vez, aproveita trechos já ordenados e usa um único buffer auxiliar.
+    estatisticas = {} if metricas.ativo else None  # Comparações e mesclagens (só com a instrumentação ligada).
+    dados_ordenados = ordenar(lista_de_dados, chave_para_ordenar, decrescente, estatisticas)
+    if estatisticas:
+        metricas.contar("ordenacao_runs", estatisticas.get("runs", 0))
+        metricas.contar("ordenacao_mesclagens", estatisticas.get("mesclagens", 0))
+        metricas.contar("ordenacao_comparacoes", estatisticas.get("comparacoes", 0))
 
-    def merge(esquerda, direita):
-        """ Função ANINHADA: Mescla duas sublistas ordenadas. """
-        resultado_mesclado = []
-        idx_esq, idx_dir = 0, 0
+    print("Organização concluída.")
+    return dados_ordenados
 
-        while idx_esq < len(esquerda) and idx_dir < len(direita):  # Enquanto houver elementos nas duas listas
-            # Comparação para ordenação DESCENDENTE (Maior >= Menor)
-            if esquerda[idx_esq][chave_para_ordenar] >= direita[idx_dir][chave_para_ordenar]:
-                resultado_mesclado.append(esquerda[idx_esq])  # Adiciona o item da esquerda (maior)
-                idx_esq += 1  # Avança o índice da esquerda
-            else:
-                resultado_mesclado.append(direita[idx_dir])  # Adiciona o item da direita (maior)
-                idx_dir += 1  # Avança o índice da direita
 
-        # Adiciona o que sobrou de cada lista (após o loop principal)
-        resultado_mesclado.extend(esquerda[idx_esq:])
-        resultado_mesclado.extend(direita[idx_dir:])
-        return resultado_mesclado
+@medir("organizar_top_k")
+def organizar_top_k(dados, chave_para_ordenar, k, decrescente=True):
+    """
+    Versão Top-K de 'organizar_dados': retorna apenas os 'k' primeiros itens da ordenação
+    (mesmos desempates do Mergesort estável) usando um heap limitado, em O(n log k).
+    'dados' pode ser qualquer iterável, inclusive um gerador (ex: tópicos chegando em streaming).
+    """
+    print(f"\nSelecionando os {k} primeiros por '{chave_para_ordenar}' (Top-K com heap)...")
+    selecionados = selecionar_top_k(dados, k, chave_para_ordenar, decrescente)
+    print("Seleção concluída.")
+    return selecionados
 
-    def mergesort_interno(lista):
-        """ Função ANINHADA: Recursiva que divide a lista. """
-        if len(lista) <= 1:  # Caso Base: se 0 ou 1 elemento, retorna a lista (já ordenada)
-            return lista
 
-        # Divisão:
-        meio = len(lista) // 2
-        lado_esquerdo = lista[:meio]  # Primeira metade (do início até o meio)
-        lado_direito = lista[meio:]  # Segunda metade (do meio até o fim)
+# --- Modo Lote (Sem Interação) ---
 
-        # Chamadas Recursivas:
-        esquerdo_ordenado = mergesort_interno(lado_esquerdo)  # Ordena a metade esquerda
-        direito_ordenado = mergesort_interno(lado_direito)  # Ordena a metade direita
+def executar_modo_lote(opcoes):
+    """
+    Executa o pipeline (prompt -> coletar_dados_da_api -> organizar_dados) para todos os perfis
+    da taxonomia (ou para o subconjunto pedido) usando a versão assíncrona do backend.
+    Os rankings são gravados em um único arquivo JSON Lines, que também permite retomar o lote.
+    """
+    global backend, cache_respostas  # Acessa as variáveis globais do backend da IA e do cache.
+    import asyncio  # Import adiado: só o modo lote precisa do asyncio.
+    from lote import executar_lote, listar_perfis  # Modo lote: todos os perfis de uma vez, sem menus.
+
+    exibir_titulo("Modo Lote")
+    perfis = listar_perfis(obter_taxonomia().caminhos_folhas(), opcoes.subconjunto)
+    print(f"-> {len(perfis)} perfis selecionados. Saída: {opcoes.saida}")
+
+    # Resposta estruturada (--estruturado): prompt, esquema e leitura próprios.
+    montar_prompt = montar_prompt_estruturado if opcoes.estruturado else montar_prompt_detalhado
+    esquema = ESQUEMA_RESPOSTA if opcoes.estruturado else None
+    coletar = coletar_dados_estruturados if opcoes.estruturado else coletar_dados_da_api
+
+    tentados = set()  # Perfis já chamados: uma nova tentativa (resposta sem tópicos) ignora o cache.
+
+    async def gerar(perfil):
+        prompt = montar_prompt(montar_prompt_contexto(*perfil))
+        chave = gerar_chave(MODELO_IA, prompt, VERSAO_TEMPLATE_PROMPT)
+        repeticao = perfil in tentados
+        tentados.add(perfil)
+        if cache_respostas is not None and not renovar_cache and not repeticao:
+            texto_guardado = cache_respostas.obter(chave)
+            if texto_guardado is not None:
+                return texto_guardado
+        with metricas.etapa("api"):  # Latência de cada chamada (as chamadas se sobrepõem no lote).
+            texto = await backend.gerar_async(prompt, MODELO_IA, esquema)
+        if cache_respostas is not None and texto:
+            cache_respostas.guardar(chave, MODELO_IA, texto)
+        return texto
+
+    def processar(perfil, texto):
+        # As mensagens de cada etapa são silenciadas: no lote, o progresso é exibido por perfil.
+        with contextlib.redirect_stdout(io.StringIO()):
+            linhas = organizar_dados(coletar(texto), 'salario_estimado_mensal')
+        if indice_areas is not None:  # Acumula as observações do perfil no índice global.
+            indice_areas.registrar(linhas, perfil)
+        return linhas
+
+    def ao_concluir(perfil, erro):
+        situacao = "✅" if erro is None else f"❌ {erro}"
+        print(f"   {situacao} {' > '.join(perfil)}")
+
+    resumo = asyncio.run(executar_lote(
+        perfis, gerar, processar, opcoes.saida,
+        concorrencia=opcoes.concorrencia, taxa_por_segundo=opcoes.taxa,
+        tentativas=opcoes.tentativas, ao_concluir=ao_concluir))
+
+    print(f"\n-> Lote finalizado: {resumo['concluidos']} concluído(s), {resumo['falhas']} falha(s), "
+          f"{resumo['pulados']} já existente(s) no checkpoint.")
+    return resumo
+
+
+# --- Ranking Global (Índice de Áreas) ---
+
+def mostrar_ranking_global(k, criterio="mediana"):
+    """ Exibe as 'k' áreas com maior salário (pelo critério escolhido) entre todos os perfis já consultados. """
+    ranking = indice_areas.ranking(k, criterio)
+    print(f"\n--- Ranking Global por {criterio} ({len(indice_areas.areas)} área(s) no índice) ---")
+    if not ranking:
+        print("Nenhum dado para mostrar. Consulte alguns perfis (ou use --lote) para preencher o índice.")
+        return
 
-        # Conquista (Mesclagem):
-        return merge(esquerdo_ordenado, direito_ordenado)  # Mescla as duas metades ordenadas
+    cabecalhos = ("Área de Atuação", "Mediana (R$)", "Média (R$)", "Mín. (R$)", "Máx. (R$)", "Obs.", "Perfis")
+    campos = ("area", "mediana", "media", "minimo", "maximo", "contagem", "perfis")
+    linhas = [[item[c] if c == "area" else f"{item[c]:,}" for c in campos] for item in ranking]
+    larguras = [max(len(cabecalho), max(len(linha[i]) for linha in linhas)) for i, cabecalho in enumerate(cabecalhos)]
+    sep = " | "  # Separador entre colunas.
 
-    # Ponto de Partida: inicia o processo recursivo
-    dados_ordenados = mergesort_interno(lista_de_dados)
+    def formatar(valores):  # A área fica alinhada à esquerda; os números, à direita.
+        return sep.join(f"{v:<{w}}" if i == 0 else f"{v:>{w}}" for i, (v, w) in enumerate(zip(valores, larguras)))
 
-    print("Organização concluída.")
-    return dados_ordenados
+    print(formatar(cabecalhos))
+    print("-" * (sum(larguras) + len(sep) * (len(larguras) - 1)))
+    for linha in linhas:
+        print(formatar(linha))
 
 
-# --- Execução Principal do Programa ---
+def exportar_ranking(dados, caminho):
+    """ Exporta o ranking no formato indicado pela extensão de 'caminho' (ver exportacao.py). """
+    try:
+        total = exportar(dados, caminho)
+    except (OSError, ValueError) as erro:
+        print(f"❌ Não foi possível exportar para {caminho}: {erro}")
+        return
+    print(f"-> {total} linha(s) exportada(s) para {caminho}.")
 
-if __name__ == "__main__":  # Bloco que garante que o código só é executado se o script for o principal.
 
-    # 1. CONFIGURAÇÃO DA API
-    minha_chave = configurar_chave_api()  # Chama a função para obter a chave do usuário/ambiente.
-    client = genai.Client(api_key=minha_chave)  # Inicializa o cliente da API com a chave.
+# --- Instrumentação ---
 
-    # 2. CONSTRUÇÃO DO PROMPT
-    prompt_contexto = menu_selecao_amigavel()  # Chama a função principal do menu, que retorna o texto do perfil.
+def finalizar_instrumentacao(opcoes, perfil):
+    """ Executada ao encerrar (atexit): exibe o resumo e grava os relatórios pedidos. """
+    if perfil is not None:
+        perfil.parar()
+        print("\n--- Perfil da Execução (cProfile, por tempo acumulado) ---")
+        print(perfil.salvar("perfil"))
+        print(f"-> Perfil gravado em perfil.pstats e perfil_memoria.txt "
+              f"(pico de memória: {perfil.pico_memoria / 1e6:.2f} MB).")
+    print("\n--- Instrumentação (Tempo por Etapa) ---")
+    print(metricas.resumo_texto())
+    if opcoes.metricas_json:
+        metricas.exportar_json(opcoes.metricas_json)
+        print(f"-> Relatório JSON gravado em {opcoes.metricas_json}.")
+    if opcoes.metricas_prometheus:
+        metricas.exportar_prometheus(opcoes.metricas_prometheus)
+        print(f"-> Métricas Prometheus gravadas em {opcoes.metricas_prometheus}.")
 
-    # Monta o prompt final detalhado, instruindo a IA sobre o formato de saída desejado.
-    prompt_detalhado = f"""
-    {prompt_contexto}.
-    Apresente as 20 melhores áreas mais relevantes no futuro da tecnologia, com maiores salários mensais, no Brasil, de acordo com as minhas capacidades.
-    Apresente também um exemplo de site, curso simples, por onde posso começar.
 
-    Responda **APENAS** com tópicos (bullet points).
-    Não inclua nenhum texto antes ou depois dos tópicos.
-
-    Use o formato exato:
-    * [Nome da Área]: [Curso de exemplo]: [Salário mensal como número inteiro]
+# --- Seleção do Backend ---
 
-    Exemplo:
-    * Engenharia de Software: FIAP: 2.500
-    * Engenharia de Petróleo: Curso Hipotético: 2.750
+def criar_backend(opcoes):
+    """
+    Cria o backend da IA conforme as opções de linha de comando:
+    "gemini" (API real), "sintetico" (local, determinístico) ou "reproduzir" (respostas gravadas).
+    Com --gravar, as respostas do backend escolhido são gravadas em --gravacoes.
     """
+    if opcoes.backend == "sintetico":
+        escolhido = BackendSintetico(linhas=opcoes.linhas_sinteticas, latencia=opcoes.latencia_sintetica_ms / 1000)
+    elif opcoes.backend == "reproduzir":
+        escolhido = BackendGravacao(opcoes.gravacoes, modo="reproduzir")
+    else:
+        if opcoes.lote:  # Sem interação: a chave precisa estar no ambiente.
+            minha_chave = os.getenv("GOOGLE_API_KEY")
+            if not minha_chave:
+                print("❌ Defina a variável de ambiente GOOGLE_API_KEY para usar o modo lote.")
+                sys.exit(1)
+        else:
+            minha_chave = configurar_chave_api(opcoes.base_url)  # Chama a função para obter a chave do usuário/ambiente.
+        # Reutiliza o cliente já criado na validação da chave (um único cliente por execução).
+        escolhido = obter_backend_gemini(minha_chave, base_url=opcoes.base_url)
+
+    if opcoes.gravar:  # Grava cada resposta para reproduzi-la depois sem rede.
+        escolhido = BackendGravacao(opcoes.gravacoes, modo="gravar", interno=escolhido)
+
+    # Camada resiliente (ver resiliencia.py): prazo por chamada, novas tentativas, hedging e disjuntor.
+    return BackendResiliente(
+        escolhido, prazo=opcoes.prazo or None, tentativas=opcoes.tentativas,
+        percentil_hedge=opcoes.hedge_percentil,
+        disjuntor=Disjuntor(opcoes.disjuntor_falhas, opcoes.disjuntor_espera))
+
+
+# --- Execução Principal do Programa ---
+
+if __name__ == "__main__":  # Bloco que garante que o código só é executado se o script for o principal.
 
-    # 3. CHAMA A API
-    resposta_em_texto = prompt_para_ia(prompt_detalhado)  # Envia o prompt para a IA e recebe o texto de volta.
+    # 0. OPÇÕES DE LINHA DE COMANDO
+    parser = argparse.ArgumentParser(description="Consultor de Carreira IA")
+    parser.add_argument("--stream", action="store_true",
+                        help="Recebe a resposta da IA em streaming e processa cada tópico assim que chega.")
+    parser.add_argument("--estruturado", action="store_true",
+                        help="Pede a resposta em JSON com esquema (área, curso, salário inteiro) em vez de tópicos.")
+    parser.add_argument("--sem-cache", action="store_true", help="Não consulta nem grava o cache de respostas.")
+    parser.add_argument("--renovar-cache", action="store_true",
+                        help="Ignora a resposta guardada, chama a API e substitui a entrada do cache.")
+    parser.add_argument("--lote", action="store_true",
+                        help="Modo sem interação: gera o ranking de todos os perfis e grava em --saida.")
+    parser.add_argument("--saida", default="rankings_lote.jsonl", help="Arquivo JSON Lines do modo lote.")
+    parser.add_argument("--subconjunto", nargs="*",
+                        help="Prefixos de perfis do modo lote, ex: Exatas 'Humanas > Direito' "
+                             "(ou listas JSON, ex: '[\"Artes\", \"Design\", \"UX/UI\"]').")
+    parser.add_argument("--concorrencia", type=int, default=8, help="Chamadas simultâneas no modo lote.")
+    parser.add_argument("--taxa", type=float, default=2.0, help="Máximo de chamadas por segundo no modo lote.")
+    parser.add_argument("--tentativas", type=int, default=5, help="Tentativas por chamada/perfil em erros temporários.")
+    parser.add_argument("--prazo", type=float, default=120.0, help="Prazo (s) de cada chamada à API; 0 desativa.")
+    parser.add_argument("--hedge-percentil", type=float, metavar="P",
+                        help="Dispara uma cópia da chamada quando ela passa do percentil P das latências recentes.")
+    parser.add_argument("--disjuntor-falhas", type=int, default=5,
+                        help="Falhas temporárias seguidas que abrem o disjuntor (chamadas recusadas).")
+    parser.add_argument("--disjuntor-espera", type=float, default=30.0,
+                        help="Segundos com o disjuntor aberto antes de uma chamada de teste.")
+    parser.add_argument("--base-url", help="Endereço alternativo da API (ex: servidor_falso.py local).")
+    parser.add_argument("--backend", choices=("gemini", "sintetico", "reproduzir"), default="gemini",
+                        help="Origem das respostas: API real, gerador sintético local ou respostas gravadas.")
+    parser.add_argument("--gravar", action="store_true", help="Grava as respostas do backend em --gravacoes.")
+    parser.add_argument("--gravacoes", default="gravacoes.jsonl", help="Arquivo de gravação/reprodução.")
+    parser.add_argument("--linhas-sinteticas", type=int, default=20, help="Tópicos por resposta do backend sintético.")
+    parser.add_argument("--latencia-sintetica-ms", type=float, default=0.0, help="Latência do backend sintético.")
+    parser.add_argument("--top", type=int, help="Exibe apenas os N maiores salários (seleção Top-K com heap).")
+    parser.add_argument("--rapido", action="store_true",
+                        help="Inicialização rápida: sem pausas de leitura na interface.")
+    parser.add_argument("--importar", nargs="+", metavar="ARQUIVO",
+                        help="Importa arquivos de respostas gravadas (ingestão em massa), exibe o Top --top e encerra.")
+    parser.add_argument("--paginar", type=int, metavar="N", help="Exibe as tabelas em páginas de N linhas.")
+    parser.add_argument("--exportar", metavar="ARQUIVO",
+                        help="Exporta o ranking final para .csv, .jsonl ou .bin (formato colunar compacto).")
+    parser.add_argument("--metricas-json", metavar="ARQUIVO", help="Grava tempos por etapa e contadores em JSON.")
+    parser.add_argument("--metricas-prometheus", metavar="ARQUIVO",
+                        help="Grava tempos por etapa e contadores no formato de texto do Prometheus.")
+    parser.add_argument("--profile", action="store_true",
+                        help="Liga a instrumentação e grava um perfil cProfile/tracemalloc da execução.")
+    parser.add_argument("--sem-agregacao", action="store_true",
+                        help="Não registra os resultados no índice global de áreas.")
+    parser.add_argument("--ranking-global", type=int, metavar="N",
+                        help="Exibe as N áreas mais bem pagas do índice global (sem chamar a IA) e encerra.")
+    parser.add_argument("--criterio", choices=CRITERIOS_RANKING, default="mediana",
+                        help="Critério do ranking global.")
+    parser.add_argument("--taxonomia", metavar="ARQUIVO",
+                        help="Taxonomia dos menus: JSON aninhado, texto 'A > B > C' por linha ou forma compilada.")
+    parser.add_argument("--compilar-taxonomia", metavar="SAIDA",
+                        help="Grava a forma compilada (carga rápida) da --taxonomia em SAIDA e encerra.")
+    opcoes = parser.parse_args()
+    inicio_rapido = opcoes.rapido
+    linhas_por_pagina = opcoes.paginar
+
+    if opcoes.profile or opcoes.metricas_json or opcoes.metricas_prometheus:  # Instrumentação (ver instrumentacao.py).
+        metricas.ativar()
+        perfil_execucao = PerfilExecucao() if opcoes.profile else None
+        atexit.register(finalizar_instrumentacao, opcoes, perfil_execucao)
+        if perfil_execucao is not None:
+            perfil_execucao.iniciar()
+
+    if opcoes.compilar_taxonomia:  # Pré-compila uma taxonomia grande para carregá-la rápido depois.
+        if not opcoes.taxonomia:
+            print("❌ Informe o arquivo de origem com --taxonomia.")
+            sys.exit(1)
+        try:
+            taxonomia = compilar_taxonomia(opcoes.taxonomia, opcoes.compilar_taxonomia, NIVEIS_PROFISSOES)
+        except (OSError, ValueError) as erro:
+            print(f"❌ Não foi possível compilar a taxonomia {opcoes.taxonomia}: {erro}")
+            sys.exit(1)
+        print(f"-> Taxonomia com {len(taxonomia)} nó(s) compilada em {opcoes.compilar_taxonomia}.")
+        sys.exit(0)
+
+    if opcoes.taxonomia:  # Taxonomia externa (usa a forma compilada em cache quando possível).
+        try:
+            with metricas.etapa("carregar_taxonomia"):
+                taxonomia = carregar_taxonomia(opcoes.taxonomia, NIVEIS_PROFISSOES)
+        except (OSError, ValueError) as erro:
+            print(f"❌ Não foi possível carregar a taxonomia {opcoes.taxonomia}: {erro}")
+            sys.exit(1)
+
+    if not opcoes.sem_agregacao or opcoes.ranking_global:  # Índice persistente de áreas (ver agregacao.py).
+        indice_areas = IndiceAreas()
+
+    if opcoes.ranking_global:  # Consulta apenas o índice: não precisa de chave nem de backend.
+        mostrar_ranking_global(opcoes.ranking_global, opcoes.criterio)
+        indice_areas.fechar()
+        sys.exit(0)
+
+    if not opcoes.sem_cache:  # Cache persistente das respostas (ver cache_respostas.py).
+        cache_respostas = CacheRespostas()
+        renovar_cache = opcoes.renovar_cache
+
+    if opcoes.importar:  # Reprocessa respostas gravadas: não precisa de chave nem de backend.
+        partes = []  # Uma tabela colunar por arquivo.
+        for caminho in opcoes.importar:
+            parte = coletar_dados_de_arquivos([caminho], colunar=True)
+            if indice_areas is not None:  # Cada arquivo conta como uma origem no índice global.
+                if not indice_areas.registrar(parte, os.path.basename(caminho)):
+                    print(f"-> {caminho} já foi importado no índice global de áreas (não contado de novo).")
+            partes.append(parte)
+        if indice_areas is not None:
+            indice_areas.fechar()
+        ranking_importado = selecionar_top_k(
+            (linha for parte in partes for linha in parte), opcoes.top or 20, 'salario_estimado_mensal')
+        mostrar_dados(ranking_importado, f"Top {opcoes.top or 20} (Arquivos Importados)")
+        if opcoes.exportar:
+            exportar_ranking(ranking_importado, opcoes.exportar)
+        sys.exit(0)
+
+    # 1. CONFIGURAÇÃO DA API (BACKEND)
+    backend = criar_backend(opcoes)
+
+    if opcoes.lote:
+        executar_modo_lote(opcoes)
+        if cache_respostas is not None:
+            cache_respostas.fechar()
+        if indice_areas is not None:
+            indice_areas.fechar()
+        sys.exit(0)
 
-    # 4. CONVERTE OS DADOS (ETL)
-    minha_lista_api = coletar_dados_da_api(resposta_em_texto)  # Processa o texto da IA em uma lista de dicionários.
+    # 2. CONSTRUÇÃO DO PROMPT
+    prompt_contexto = menu_selecao_amigavel()  # Chama a função principal do menu, que retorna o texto do perfil.
+
+    # Monta o prompt final detalhado, instruindo a IA sobre o formato de saída desejado.
+    if opcoes.estruturado:
+        prompt_detalhado = montar_prompt_estruturado(prompt_contexto)
+    else:
+        prompt_detalhado = montar_prompt_detalhado(prompt_contexto)
+
+    # 3 e 4. CHAMA A API E CONVERTE OS DADOS (ETL)
+    if opcoes.estruturado:  # JSON com esquema: o JSON só é válido completo, então não há streaming.
+        if opcoes.stream:
+            print("-> Aviso: --stream é ignorado com --estruturado (a resposta JSON é lida inteira).")
+        resposta_em_texto = prompt_para_ia(prompt_detalhado, esquema=ESQUEMA_RESPOSTA)
+        minha_lista_api = coletar_dados_estruturados(resposta_em_texto)
+    elif opcoes.stream:  # Streaming: cada tópico é processado assim que a linha chega.
+        minha_lista_api = coletar_dados_da_api_stream(prompt_para_ia_stream(prompt_detalhado))
+    else:
+        resposta_em_texto = prompt_para_ia(prompt_detalhado)  # Envia o prompt para a IA e recebe o texto de volta.
+        minha_lista_api = coletar_dados_da_api(resposta_em_texto)  # Processa o texto da IA em uma lista de dicionários.
 
     # 5. PROCESSA E EXIBE
     if minha_lista_api:  # Verifica se a lista não está vazia.
+        # Acumula as observações deste perfil no índice global de áreas.
+        if indice_areas is not None and not indice_areas.registrar(minha_lista_api, perfil_selecionado):
+            print("-> Esta resposta já está no índice global de áreas (não contada de novo).")
+
         # Exibe a tabela na ordem original da API.
         mostrar_dados(minha_lista_api, "DataFrame Original (Ordem da API)")
 
         # Ordena a lista usando o Mergesort.
-        lista_ordenada_salario = organizar_dados(minha_lista_api, 'salario_estimado_mensal')
+        if opcoes.top:  # Top-K: seleciona só os maiores salários, sem ordenar a lista inteira.
+            lista_ordenada_salario = organizar_top_k(minha_lista_api, 'salario_estimado_mensal', opcoes.top)
+            mostrar_dados(lista_ordenada_salario, f"Top {opcoes.top} (Maior Salário)")
+        else:
+            lista_ordenada_salario = organizar_dados(minha_lista_api, 'salario_estimado_mensal')
+
+            # Exibe a tabela ordenada pelo maior salário.
+            mostrar_dados(lista_ordenada_salario, "DataFrame Ordenado (Maior Salário)")
 
-        # Exibe a tabela ordenada pelo maior salário.
-        mostrar_dados(lista_ordenada_salario, "DataFrame Ordenado (Maior Salário)")
+        if opcoes.exportar:  # Envia o ranking final para outros sistemas (CSV, JSON Lines ou binário).
+            exportar_ranking(lista_ordenada_salario, opcoes.exportar)
     else:
-        print("\nPrograma encerrado. Não foi possível processar os dados da API.")  # Mensagem de falha final.
\ No newline at end of file
+        print("\nPrograma encerrado. Não foi possível processar os dados da API.")  # Mensagem de falha final.
+    # 6. ESTATÍSTICAS DO CACHE
+    if cache_respostas is not None:
+        estatisticas = cache_respostas.estatisticas()
+        print(f"\n-> Cache: {estatisticas['acertos']} acerto(s), {estatisticas['falhas']} falha(s), "
+              f"{estatisticas['entradas']} resposta(s) guardada(s).")
+        cache_respostas.fechar()
+    if indice_areas is not None:  # Persiste o índice de áreas (ver agregacao.py).
+        indice_areas.fechar()
@@ -0,0 +1,289 @@
+# --- Motor de Ordenação (Mergesort Iterativo) ---
+# Este módulo concentra o Mergesort usado por 'organizar_dados' (main.py).
+# A versão original era recursiva, copiava sublistas a cada nível (lista[:meio]) e
+# consultava item[chave] em toda comparação. Aqui o algoritmo é "bottom-up":
+#   1. Cada chave de ordenação é extraída UMA única vez.
+#   2. Sequências já ordenadas ("runs") da entrada são detectadas e aproveitadas.
+#   3. As mesclagens alternam entre dois vetores pré-alocados (sem recursão e sem
+#      criar sublistas a cada nível).
+import heapq  # Heap limitado da seleção Top-K.
+import itertools  # Reinsere o primeiro item lido (amostra) no iterador.
+from bisect import bisect_right  # Busca binária em C, usada na inserção dos runs curtos.
+from numbers import Number  # Tipo base para detectar colunas numéricas.
+from operator import itemgetter  # Extrator de campos implementado em C.
+
+TAMANHO_MINIMO_RUN = 32  # Runs menores que isto são completados com inserção binária.
+
+
+class _Invertido:
+    """ Envolve um valor não numérico para inverter sua ordem natural (usado em colunas decrescentes). """
+    __slots__ = ("valor",)
+
+    def __init__(self, valor):
+        self.valor = valor
+
+    def __lt__(self, outro):
+        return outro.valor < self.valor  # Inverte a comparação: "menor" passa a ser o maior.
+
+    def __eq__(self, outro):
+        return self.valor == outro.valor
+
+    def __repr__(self):
+        return f"_Invertido({self.valor!r})"
+
+
+def normalizar_campos(campos, decrescente):
+    """
+    Converte os parâmetros de ordenação para duas tuplas do mesmo tamanho.
+    'campos' pode ser uma string ou uma tupla de strings; 'decrescente' pode ser um
+    booleano (aplicado a todos os campos) ou uma tupla com um booleano por campo.
+    """
+    if isinstance(campos, str):  # Uma única chave (ex: 'salario_estimado_mensal').
+        campos = (campos,)
+    campos = tuple(campos)
+    if not campos:
+        raise ValueError("É necessário informar ao menos uma chave de ordenação.")
+
+    if isinstance(decrescente, bool):  # Mesmo sentido para todas as chaves.
+        decrescente = (decrescente,) * len(campos)
+    decrescente = tuple(decrescente)
+    if len(decrescente) != len(campos):
+        raise ValueError("Informe um sentido (decrescente True/False) para cada chave de ordenação.")
+
+    return campos, decrescente
+
+
+def _inversor(valor_exemplo):
+    """ Escolhe como inverter uma coluna decrescente: negação para números, envoltório para o resto. """
+    if isinstance(valor_exemplo, Number) and not isinstance(valor_exemplo, complex):
+        return lambda v: -v  # Números: basta negar (comparação continua em C).
+    return _Invertido
+
+
+def criar_extrator(campos, decrescente, amostra):
+    """
+    Cria uma função item -> chave em "forma crescente" (a mesma de 'preparar_chaves'),
+    para quando os itens chegam um a um (ex: de um gerador). 'amostra' é um item qualquer,
+    usado para decidir como inverter as colunas decrescentes.
+    """
+    campos, decrescente = normalizar_campos(campos, decrescente)
+    extrair = itemgetter(*campos)
+    if not any(decrescente):
+        return extrair
+    if len(campos) == 1:
+        inverter = _inversor(extrair(amostra))
+        return lambda item: inverter(extrair(item))
+    inversores = [_inversor(valor) if desc else None for valor, desc in zip(extrair(amostra), decrescente)]
+    return lambda item: tuple(
+        valor if inv is None else inv(valor) for valor, inv in zip(extrair(item), inversores))
+
+
+def preparar_chaves(itens, campos, decrescente=True):
+    """
+    Extrai as chaves de ordenação de cada item UMA única vez.
+    As chaves retornadas estão sempre em "forma crescente": colunas decrescentes são
+    invertidas aqui, assim o motor de mesclagem só precisa do operador '<'.
+    """
+    campos, decrescente = normalizar_campos(campos, decrescente)
+    extrair = itemgetter(*campos)  # Com vários campos, retorna uma tupla.
+    chaves = [extrair(item) for item in itens]  # Única passada de leitura dos dicionários.
+
+    if not chaves or not any(decrescente):  # Tudo crescente: nada a transformar.
+        return chaves
+
+    if len(campos) == 1:  # Caso comum: uma única chave decrescente.
+        inverter = _inversor(chaves[0])
+        return [inverter(c) for c in chaves]
+
+    # Várias chaves: inverte apenas as colunas decrescentes.
+    amostra = chaves[0]
+    inversores = [_inversor(amostra[i]) if desc else None for i, desc in enumerate(decrescente)]
+    return [
+        tuple(valor if inv is None else inv(valor) for valor, inv in zip(chave, inversores))
+        for chave in chaves
+    ]
+
+
+def _tamanho_minimo_run(n):
+    """ Calcula o tamanho mínimo de run (entre 16 e 32), no mesmo espírito do Timsort. """
+    sobra = 0
+    while n >= TAMANHO_MINIMO_RUN:
+        sobra |= n & 1
+        n >>= 1
+    return n + sobra
+
+
+def _inserir_ordenado(chaves, valores, inicio, ordenado_ate, fim):
+    """ Completa um run com inserção binária estável: [inicio, ordenado_ate) já está ordenado. """
+    for pos in range(ordenado_ate, fim):
+        chave = chaves[pos]
+        destino = bisect_right(chaves, chave, inicio, pos)  # 'right' preserva a estabilidade.
+        if destino != pos:  # Desloca o bloco uma posição para a direita (cópia em C).
+            valor = valores[pos]
+            chaves[destino + 1:pos + 1] = chaves[destino:pos]
+            valores[destino + 1:pos + 1] = valores[destino:pos]
+            chaves[destino] = chave
+            valores[destino] = valor
+
+
+def _detectar_runs(chaves, valores, estatisticas=None):
+    """
+    Percorre a lista uma vez e devolve os limites dos runs (já ordenados).
+    Runs estritamente decrescentes são invertidos no lugar (estrito para manter a estabilidade);
+    runs curtos são estendidos até o tamanho mínimo com inserção binária.
+    Com 'estatisticas' (dicionário), soma as comparações feitas nesta fase.
+    """
+    n = len(chaves)
+    minimo = _tamanho_minimo_run(n)
+    limites = [0]  # Início de cada run; o último elemento será 'n'.
+    inicio = 0
+    comparacoes = 0
+
+    while inicio < n:
+        fim = inicio + 1
+        if fim < n:
+            if chaves[fim] < chaves[inicio]:  # Run estritamente decrescente.
+                while fim + 1 < n and chaves[fim + 1] < chaves[fim]:
+                    fim += 1
+                fim += 1
+                chaves[inicio:fim] = chaves[inicio:fim][::-1]
+                valores[inicio:fim] = valores[inicio:fim][::-1]
+            else:  # Run não decrescente.
+                while fim + 1 < n and not chaves[fim + 1] < chaves[fim]:
+                    fim += 1
+                fim += 1
+
+        if estatisticas is not None:  # Uma comparação por vizinho examinado (+1 na quebra do run).
+            comparacoes += min(fim - inicio, n - inicio - 1)
+        if fim - inicio < minimo:  # Run curto: estende com inserção binária.
+            estendido = min(n, inicio + minimo)
+            _inserir_ordenado(chaves, valores, inicio, fim, estendido)
+            if estatisticas is not None:  # A busca binária em 'tamanho' itens faz até bit_length comparações.
+                comparacoes += sum(tamanho.bit_length() for tamanho in range(fim - inicio, estendido - inicio))
+            fim = estendido
+
+        limites.append(fim)
+        inicio = fim
+
+    if estatisticas is not None:
+        estatisticas["runs"] = estatisticas.get("runs", 0) + len(limites) - 1
+        estatisticas["comparacoes"] = estatisticas.get("comparacoes", 0) + comparacoes
+    return limites
+
+
+def _mesclar(ch_orig, va_orig, ch_dest, va_dest, inicio, meio, fim):
+    """
+    Mescla os runs [inicio, meio) e [meio, fim) da origem para o destino (estável).
+    Retorna a quantidade de comparações feitas (contada por mesclagem, não por comparação).
+    """
+    if not ch_orig[meio] < ch_orig[meio - 1]:  # Runs já encadeados: cópia direta.
+        ch_dest[inicio:fim] = ch_orig[inicio:fim]
+        va_dest[inicio:fim] = va_orig[inicio:fim]
+        return 1
+
+    i, j, k = inicio, meio, inicio
+    chave_i, chave_j = ch_orig[i], ch_orig[j]
+    while True:
+        if chave_j < chave_i:  # Estritamente menor: o item da direita vem antes.
+            ch_dest[k] = chave_j
+            va_dest[k] = va_orig[j]
+            k += 1
+            j += 1
+            if j == fim:
+                break
+            chave_j = ch_orig[j]
+        else:  # Empate ou menor à esquerda: a esquerda vem antes (estabilidade).
+            ch_dest[k] = chave_i
+            va_dest[k] = va_orig[i]
+            k += 1
+            i += 1
+            if i == meio:
+                break
+            chave_i = ch_orig[i]
+
+    # Copia o que sobrou de cada lado (apenas um deles ainda tem elementos).
+    if i < meio:
+        ch_dest[k:fim] = ch_orig[i:meio]
+        va_dest[k:fim] = va_orig[i:meio]
+    else:
+        ch_dest[k:fim] = ch_orig[j:fim]
+        va_dest[k:fim] = va_orig[j:fim]
+    return k - inicio + 1  # Uma comparação por item emitido no laço, mais a do encadeamento.
+
+
+def mergesort_natural(chaves, valores, estatisticas=None):
+    """
+    Ordena (de forma crescente e estável) as listas paralelas 'chaves' e 'valores'.
+    As listas recebidas são reaproveitadas como área de trabalho; o retorno é o par
+    (chaves_ordenadas, valores_ordenados), que pode ser o próprio par de entrada ou o buffer auxiliar.
+    Com 'estatisticas' (dicionário), acumula 'runs', 'mesclagens' e 'comparacoes' (instrumentação).
+    """
+    n = len(chaves)
+    if n < 2:
+        return chaves, valores
+
+    limites = _detectar_runs(chaves, valores, estatisticas)
+    if len(limites) == 2:  # Um único run: a entrada já está ordenada.
+        return chaves, valores
+
+    # Buffer auxiliar único (alocado uma vez) usado em "pingue-pongue" com a entrada.
+    ch_aux = [None] * n
+    va_aux = [None] * n
+    origem = (chaves, valores)
+    destino = (ch_aux, va_aux)
+
+    while len(limites) > 2:  # Cada passada mescla runs vizinhos aos pares.
+        ch_o, va_o = origem
+        ch_d, va_d = destino
+        novos_limites = [0]
+        total = len(limites) - 1  # Número de runs nesta passada.
+
+        for r in range(0, total - 1, 2):
+            comparacoes = _mesclar(ch_o, va_o, ch_d, va_d, limites[r], limites[r + 1], limites[r + 2])
+            novos_limites.append(limites[r + 2])
+            if estatisticas is not None:
+                estatisticas["mesclagens"] = estatisticas.get("mesclagens", 0) + 1
+                estatisticas["comparacoes"] += comparacoes
+
+        if total % 2:  # Run ímpar sobrando: apenas copiado para o destino.
+            inicio = limites[-2]
+            ch_d[inicio:n] = ch_o[inicio:n]
+            va_d[inicio:n] = va_o[inicio:n]
+            novos_limites.append(n)
+
+        limites = novos_limites
+        origem, destino = destino, origem  # Troca os papéis dos vetores.
+
+    return origem
+
+
+def ordenar(itens, campos, decrescente=True, estatisticas=None):
+    """
+    Ordena uma lista de dicionários por uma ou mais chaves, retornando uma NOVA lista.
+    Ex: ordenar(dados, ('salario_estimado_mensal', 'area'), decrescente=(True, False))
+    ordena pelo salário (maior primeiro) e, em caso de empate, pela área (A-Z).
+    Itens com chaves iguais mantêm a ordem original (ordenação estável).
+    Aceita qualquer iterável (inclusive geradores): a entrada é lida uma única vez.
+    """
+    itens = list(itens)  # Materializa antes: chaves e valores precisam ver os mesmos itens.
+    chaves = preparar_chaves(itens, campos, decrescente)
+    _, valores = mergesort_natural(chaves, itens, estatisticas)
+    return valores
+
+
+def selecionar_top_k(itens, k, campos, decrescente=True):
+    """
+    Retorna os 'k' primeiros itens da ordenação, sem ordenar a entrada inteira.
+    Usa um heap limitado a 'k' elementos (heapq.nsmallest): O(n log k) de tempo e O(k) de memória.
+    Aceita qualquer iterável (inclusive geradores, como o modo streaming de 'coletar_dados_da_api')
+    e desempata como o Mergesort estável: entre chaves iguais, vence o item que veio antes.
+    """
+    if k <= 0:
+        return []
+    iterador = iter(itens)
+    primeiro = next(iterador, None)
+    if primeiro is None:  # Entrada vazia.
+        return []
+    extrair = criar_extrator(campos, decrescente, primeiro)
+    # nsmallest desempata pela posição de chegada, o que equivale à estabilidade do Mergesort.
+    return heapq.nsmallest(k, itertools.chain((primeiro,), iterador), key=extrair)
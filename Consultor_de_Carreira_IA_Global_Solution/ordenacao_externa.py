@@ -0,0 +1,164 @@
+# --- Ordenação Externa (Out-of-Core) ---
+# Para rankings maiores que a memória disponível: a entrada é lida em blocos de tamanho
+# limitado, cada bloco é ordenado com o mesmo Mergesort de 'ordenacao.py' e gravado em disco
+# como um "run" binário compacto. No final, os runs são mesclados com um heap (k-way merge)
+# e o resultado é devolvido como um gerador, sem nunca carregar tudo na memória.
+import heapq  # Heap usado na mesclagem k-way (heapq.merge).
+import itertools  # Fatiamento da entrada em blocos (islice).
+import marshal  # Serialização binária compacta e rápida dos tipos nativos.
+import os  # Montagem dos caminhos dos arquivos de run.
+import sys  # Estimativa do tamanho em bytes de cada linha (getsizeof).
+import tempfile  # Diretório temporário para os runs.
+from operator import itemgetter  # Extrai a chave dos pares (chave, linha) na mesclagem.
+
+from ordenacao import mergesort_natural, normalizar_campos, preparar_chaves
+
+MEMORIA_PADRAO_MB = 64  # Orçamento padrão de memória para a ordenação externa.
+MAX_RUNS_ABERTOS = 64  # Máximo de arquivos abertos ao mesmo tempo em uma mesclagem.
+LINHAS_POR_LOTE_GRAVACAO = 4096  # Máximo de linhas por objeto 'marshal' gravado (unidade de leitura).
+_CUSTO_ORDENACAO_POR_LINHA = 4 * 8  # Chave + valor, na entrada e no buffer auxiliar (ponteiros).
+AMOSTRAGEM_ESTIMATIVA = 64  # Uma linha a cada N entra na média móvel do tamanho das linhas.
+
+
+def _bytes_por_linha(linha):
+    """ Estima quantos bytes uma linha (dicionário) ocupa na memória, incluindo o custo da ordenação. """
+    total = sys.getsizeof(linha) + _CUSTO_ORDENACAO_POR_LINHA
+    for valor in linha.values():
+        total += sys.getsizeof(valor)
+    return total
+
+
+def _ler_bloco(iterador, colunas, orcamento, estimativa, posicao):
+    """
+    Lê do iterador as linhas que cabem no orçamento de memória, retornando (bloco, entrada_esgotada).
+    O tamanho das linhas é uma média móvel (lista 'estimativa' = [bytes somados, linhas medidas])
+    atualizada por amostragem ao longo da entrada, não só pela primeira linha.
+    Cada linha precisa ter exatamente as 'colunas' da primeira: os runs gravam tuplas nessa ordem.
+    'posicao' é o número de linhas lidas antes deste bloco (usado na mensagem de erro).
+    """
+    bloco = []
+    limite = max(1, orcamento * estimativa[1] // estimativa[0])
+    for linha in iterador:
+        if linha.keys() != colunas.keys():
+            raise ValueError(
+                f"A linha {posicao + len(bloco) + 1} tem colunas {sorted(linha)}, diferentes das "
+                f"anteriores {sorted(colunas)}: a ordenação externa exige o mesmo esquema em todas.")
+        bloco.append(linha)
+        if len(bloco) % AMOSTRAGEM_ESTIMATIVA == 0:  # Atualiza a média e o limite deste bloco.
+            estimativa[0] += _bytes_por_linha(linha)
+            estimativa[1] += 1
+            limite = max(1, orcamento * estimativa[1] // estimativa[0])
+        if len(bloco) >= limite:
+            return bloco, False
+    return bloco, True
+
+
+def _gravar_run(caminho, colunas, linhas, linhas_por_lote):
+    """ Grava linhas ordenadas no disco: cabeçalho com as colunas e lotes de tuplas (marshal). """
+    extrair = itemgetter(*colunas) if len(colunas) > 1 else (lambda linha: (linha[colunas[0]],))
+    linhas = iter(linhas)  # Aceita listas ou geradores (mesclagens intermediárias).
+    with open(caminho, "wb") as arquivo:
+        marshal.dump(tuple(colunas), arquivo)
+        while True:
+            lote = [extrair(linha) for linha in itertools.islice(linhas, linhas_por_lote)]
+            if not lote:
+                break
+            marshal.dump(lote, arquivo)
+
+
+def _ler_run(caminho, campos, decrescente):
+    """
+    Gerador que lê um run do disco e devolve pares (chave, linha) em ordem.
+    A leitura é feita lote a lote, assim cada run aberto ocupa pouca memória.
+    """
+    with open(caminho, "rb") as arquivo:
+        colunas = marshal.load(arquivo)
+        while True:
+            try:
+                tuplas = marshal.load(arquivo)
+            except EOFError:  # Fim do arquivo de run.
+                return
+            lote = [dict(zip(colunas, tupla)) for tupla in tuplas]
+            del tuplas
+            # As chaves são recalculadas por lote (as colunas decrescentes não são serializáveis).
+            yield from zip(preparar_chaves(lote, campos, decrescente), lote)
+
+
+def _mesclar_runs(caminhos, campos, decrescente):
+    """ Mescla vários runs com um heap. Em empates, o run mais antigo vem antes (estável). """
+    leitores = [_ler_run(c, campos, decrescente) for c in caminhos]
+    # heapq.merge desempata pela posição do iterável: run 0 antes do run 1, e assim por diante.
+    return heapq.merge(*leitores, key=itemgetter(0))
+
+
+def ordenar_externo(itens, campos, decrescente=True, memoria_max_mb=MEMORIA_PADRAO_MB, diretorio_temp=None):
+    """
+    Ordena um iterável de dicionários (de qualquer tamanho) usando o disco como apoio.
+    Retorna um GERADOR de dicionários na mesma ordem estável que 'ordenar' produziria.
+    'memoria_max_mb' limita o tamanho de cada bloco ordenado na memória e dos buffers da mesclagem.
+    Os arquivos temporários são apagados quando o gerador termina ou é fechado.
+    Todas as linhas devem ter as mesmas chaves (ValueError, caso contrário).
+    """
+    campos, decrescente = normalizar_campos(campos, decrescente)
+    if memoria_max_mb <= 0:
+        raise ValueError("O limite de memória deve ser positivo.")
+    orcamento = int(memoria_max_mb * 1024 * 1024)
+
+    iterador = iter(itens)
+    primeira = next(iterador, None)
+    if primeira is None:  # Entrada vazia: nada a ordenar.
+        return
+
+    # Tamanho médio das linhas (bytes somados, linhas medidas), começando pela primeira linha.
+    estimativa = [_bytes_por_linha(primeira), 1]
+    colunas = dict.fromkeys(primeira)  # Ordem das colunas nos runs (e conjunto para a validação).
+    iterador = itertools.chain((primeira,), iterador)
+
+    def linhas_por_lote():
+        # Cada run aberto na mesclagem guarda no máximo um lote: k lotes cabem em um bloco.
+        linhas_por_run = orcamento * estimativa[1] // estimativa[0]
+        return max(1, min(LINHAS_POR_LOTE_GRAVACAO, linhas_por_run // MAX_RUNS_ABERTOS))
+
+    with tempfile.TemporaryDirectory(prefix="ordenacao_externa_", dir=diretorio_temp) as pasta:
+        # --- FASE 1: gera os runs ordenados ---
+        caminhos = []
+        lidas = 0
+        esgotada = False
+        while not esgotada:
+            bloco, esgotada = _ler_bloco(iterador, colunas, orcamento, estimativa, lidas)
+            if not bloco:
+                break
+            lidas += len(bloco)
+            chaves = preparar_chaves(bloco, campos, decrescente)
+            _, bloco_ordenado = mergesort_natural(chaves, bloco)
+            del chaves, bloco
+
+            if not caminhos and esgotada:
+                # Coube tudo em um único bloco: não há necessidade de usar o disco.
+                yield from bloco_ordenado
+                return
+
+            caminho = os.path.join(pasta, f"run_{len(caminhos):06d}.bin")
+            _gravar_run(caminho, tuple(colunas), bloco_ordenado, linhas_por_lote())
+            caminhos.append(caminho)
+            del bloco_ordenado
+
+        # --- FASE 2: mesclagens intermediárias (limita arquivos abertos e buffers) ---
+        geracao = 0
+        while len(caminhos) > MAX_RUNS_ABERTOS:
+            geracao += 1
+            novos_caminhos = []
+            for inicio in range(0, len(caminhos), MAX_RUNS_ABERTOS):
+                grupo = caminhos[inicio:inicio + MAX_RUNS_ABERTOS]
+                destino = os.path.join(pasta, f"run_g{geracao}_{len(novos_caminhos):06d}.bin")
+                linhas = (linha for _, linha in _mesclar_runs(grupo, campos, decrescente))
+                _gravar_run(destino, tuple(colunas), linhas, linhas_por_lote())
+                for caminho in grupo:  # Libera o disco assim que possível.
+                    os.remove(caminho)
+                novos_caminhos.append(destino)
+            caminhos = novos_caminhos
+
+        # --- FASE 3: mesclagem final, devolvida sob demanda ---
+        for _, linha in _mesclar_runs(caminhos, campos, decrescente):
+            yield linha
+
@@ -0,0 +1,83 @@
+# --- Renderização da Tabela no Console ---
+# Usado por 'mostrar_dados' (main.py). A versão original fazia três passadas de max(...)
+# sobre os dados (formatando cada salário duas vezes) e um print() por linha.
+# Aqui:
+#   1. Cada salário é formatado UMA única vez; as larguras saem dessa mesma passada.
+#   2. Listas e TabelaColunar são medidas por inteiro; geradores são medidos por uma
+#      amostra limitada (as primeiras 'amostra' linhas) e o restante é transmitido sem
+#      ser guardado. Textos maiores que a largura da amostra são abreviados com '…'.
+#   3. As linhas são escritas em blocos (uma única chamada de write por bloco).
+#   4. Paginação opcional: a cada 'por_pagina' linhas, 'continuar()' decide se segue.
+import itertools  # Fatiamento de iteradores (amostra e blocos).
+import sys  # Saída padrão.
+
+from tabela import TabelaColunar, iterar_tuplas
+
+CABECALHOS = ("Área de Atuação", "Curso Exemplo", "Salário Mensal (R$)")
+SEPARADOR = " | "  # Separador entre colunas.
+TAMANHO_AMOSTRA = 1000  # Linhas usadas para medir as colunas quando a entrada é um gerador.
+LINHAS_POR_ESCRITA = 512  # Linhas agrupadas em cada chamada de write.
+
+
+def _formatar(tuplas):
+    """ Formata o salário (separador de milhar) uma única vez por linha. """
+    return [(area, curso, f"{salario:,}") for area, curso, salario in tuplas]
+
+
+def _abreviar(texto, largura):
+    return texto if len(texto) <= largura else texto[:largura - 1] + "…"
+
+
+def renderizar_tabela(dados, saida=None, amostra=TAMANHO_AMOSTRA, por_pagina=None, continuar=None):
+    """
+    Escreve 'dados' (lista de dicionários, TabelaColunar ou gerador) como tabela alinhada em
+    'saida' (padrão: sys.stdout). Com 'por_pagina', o cabeçalho é repetido a cada página e
+    'continuar()' é chamada entre as páginas (retornar False interrompe a exibição).
+    Retorna a quantidade de linhas escritas.
+    """
+    saida = saida or sys.stdout
+    tuplas = iterar_tuplas(dados)
+    if isinstance(dados, (list, tuple, TabelaColunar)):  # Entrada completa: mede todas as linhas.
+        medidas, restante = _formatar(tuplas), ()
+    else:  # Gerador: mede apenas a amostra e transmite o restante.
+        medidas, restante = _formatar(itertools.islice(tuplas, amostra)), tuplas
+    if not medidas:
+        return 0
+
+    # 1. Larguras: o maior entre o cabeçalho e os valores (max em C sobre cada coluna).
+    areas, cursos, salarios = zip(*medidas)
+    w_area = max(len(CABECALHOS[0]), max(map(len, areas)))
+    w_curso = max(len(CABECALHOS[1]), max(map(len, cursos)))
+    w_salario = max(len(CABECALHOS[2]), max(map(len, salarios)))
+    modelo = f"{{:<{w_area}}}{SEPARADOR}{{:<{w_curso}}}{SEPARADOR}{{:>{w_salario}}}"
+    cabecalho = modelo.format(*CABECALHOS) + "\n" + "-" * (w_area + w_curso + w_salario + len(SEPARADOR) * 2) + "\n"
+
+    # 2. Linhas: as já medidas e, em seguida, o restante (formatado bloco a bloco).
+    linhas = itertools.chain(
+        medidas,
+        ((_abreviar(area, w_area), _abreviar(curso, w_curso), f"{salario:,}") for area, curso, salario in restante))
+
+    escrever = saida.write
+    escritas = 0
+    na_pagina = 0  # Linhas já escritas na página atual.
+    escrever(cabecalho)
+    while True:
+        tamanho_bloco = min(LINHAS_POR_ESCRITA, por_pagina - na_pagina) if por_pagina else LINHAS_POR_ESCRITA
+        bloco = list(itertools.islice(linhas, tamanho_bloco))
+        if not bloco:
+            break
+        escrever("\n".join(itertools.starmap(modelo.format, bloco)) + "\n")
+        escritas += len(bloco)
+        na_pagina += len(bloco)
+        if por_pagina and na_pagina == por_pagina:  # Fim da página: pergunta se continua.
+            proxima = next(linhas, None)
+            if proxima is None:
+                break
+            saida.flush()
+            if continuar is not None and not continuar():
+                break
+            linhas = itertools.chain((proxima,), linhas)
+            na_pagina = 0
+            escrever(cabecalho)
+    saida.flush()
+    return escritas
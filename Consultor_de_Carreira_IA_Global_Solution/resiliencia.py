@@ -0,0 +1,278 @@
+# --- Camada Resiliente de Chamadas à IA ---
+# Envolve qualquer backend (ver backends.py) com a mesma interface, acrescentando:
+#   * prazo por chamada: a chamada roda em uma thread e é abandonada ao estourar o prazo;
+#   * novas tentativas com espera exponencial e aleatória ("full jitter") em erros temporários
+#     (APIError 429/503 e afins, tempo esgotado, falha de conexão);
+#   * requisições "hedged" (opcional): se a resposta demora mais que o percentil escolhido das
+#     latências recentes, uma cópia da chamada é disparada e vale a que terminar primeiro;
+#   * disjuntor (circuit breaker): após várias falhas seguidas, as chamadas falham de imediato
+#     por um tempo, em vez de esperar o prazo de um serviço que está fora do ar.
+# O cliente da API continua único e compartilhado (obter_backend_gemini): as cópias "hedged"
+# e as novas tentativas reutilizam o mesmo pool de conexões.
+import random  # Jitter das esperas.
+import threading  # Threads das chamadas e trava do disjuntor.
+import time  # Relógio monotônico e esperas.
+from collections import deque  # Janela das latências recentes.
+from concurrent.futures import FIRST_COMPLETED, Future, wait  # Espera pela primeira chamada concluída.
+
+from backends import BackendIA
+from instrumentacao import metricas
+
+CODIGOS_RETENTAVEIS = {408, 429, 500, 502, 503, 504}  # Erros HTTP temporários (sobrecarga, limite de uso).
+PRAZO_PADRAO_SEGUNDOS = 120.0  # Respostas longas do modelo podem levar dezenas de segundos.
+AMOSTRAS_MINIMAS_HEDGE = 20  # Latências observadas antes de o percentil ser confiável.
+JANELA_LATENCIAS = 200  # Latências recentes consideradas no percentil.
+
+
+# Erros de transporte do httpx (usado pelo SDK) e do aiohttp, reconhecidos pelo nome da classe
+# (ou de uma classe base) para não importar essas bibliotecas: não herdam de OSError.
+ERROS_REDE_RETENTAVEIS = {"TransportError", "TimeoutException", "ClientConnectionError", "ServerTimeoutError"}
+# Subclasses desses erros que indicam problema na própria requisição (repetir não adianta).
+ERROS_REDE_PERMANENTES = {"UnsupportedProtocol", "LocalProtocolError", "InvalidURL", "InvalidUrlClientError"}
+
+
+def erro_retentavel(erro):
+    """ Decide se vale tentar de novo: erros HTTP temporários, tempo esgotado ou falha de conexão. """
+    codigo = getattr(erro, "code", None)
+    if isinstance(codigo, int):
+        return codigo in CODIGOS_RETENTAVEIS
+    if isinstance(erro, OSError):  # Inclui TimeoutError (e asyncio.TimeoutError) e erros de rede.
+        return True
+    nomes = {classe.__name__ for classe in type(erro).__mro__}
+    return bool(nomes & ERROS_REDE_RETENTAVEIS) and not nomes & ERROS_REDE_PERMANENTES
+
+
+class TempoEsgotado(TimeoutError):
+    """ A chamada não terminou dentro do prazo. """
+
+
+class CircuitoAberto(RuntimeError):
+    """ O disjuntor está aberto: a chamada foi recusada sem acessar a API. """
+
+
+class Disjuntor:
+    """
+    Circuit breaker com três estados:
+      * fechado: chamadas normais; 'limite_falhas' falhas seguidas abrem o circuito;
+      * aberto: chamadas recusadas (CircuitoAberto) por 'tempo_reabertura' segundos;
+      * meio_aberto: uma única chamada de teste; sucesso fecha o circuito, falha o reabre.
+    """
+
+    def __init__(self, limite_falhas=5, tempo_reabertura=30.0):
+        self.limite_falhas = limite_falhas
+        self.tempo_reabertura = tempo_reabertura
+        self.estado = "fechado"
+        self.falhas_seguidas = 0
+        self._aberto_em = 0.0
+        self._teste_em_andamento = False
+        self._trava = threading.Lock()
+
+    def permitir(self):
+        """ Levanta CircuitoAberto se a chamada não deve ser feita agora. """
+        with self._trava:
+            if self.estado == "fechado":
+                return
+            if self.estado == "aberto":
+                restante = self.tempo_reabertura - (time.monotonic() - self._aberto_em)
+                if restante > 0:
+                    raise CircuitoAberto(f"Serviço indisponível; nova tentativa em {restante:.0f} s.")
+                self.estado = "meio_aberto"
+            if self._teste_em_andamento:  # Meio aberto: só uma chamada de teste por vez.
+                raise CircuitoAberto("Chamada de teste do serviço em andamento.")
+            self._teste_em_andamento = True
+
+    def registrar_sucesso(self):
+        with self._trava:
+            self.estado = "fechado"
+            self.falhas_seguidas = 0
+            self._teste_em_andamento = False
+
+    def registrar_falha(self):
+        with self._trava:
+            self.falhas_seguidas += 1
+            self._teste_em_andamento = False
+            if self.estado == "meio_aberto" or self.falhas_seguidas >= self.limite_falhas:
+                if self.estado != "aberto":
+                    metricas.contar("api_circuito_aberto")
+                self.estado = "aberto"
+                self._aberto_em = time.monotonic()
+
+
+def _executar_em_thread(funcao, *args):
+    """
+    Executa 'funcao(*args)' em uma thread daemon e devolve um Future com o resultado.
+    Daemon: uma chamada abandonada (prazo estourado ou cópia "hedged" perdedora) não impede o
+    programa de encerrar.
+    """
+    futuro = Future()
+
+    def trabalhar():
+        try:
+            futuro.set_result(funcao(*args))
+        except BaseException as erro:
+            futuro.set_exception(erro)
+
+    threading.Thread(target=trabalhar, daemon=True).start()
+    return futuro
+
+
+class BackendResiliente(BackendIA):
+    """
+    Backend que delega a 'interno' com prazo, novas tentativas, hedging e disjuntor.
+      * prazo: segundos por tentativa (None desativa);
+      * tentativas: total de tentativas em erros temporários;
+      * percentil_hedge: ex. 95 dispara uma cópia quando a chamada passa do p95 recente (None desativa).
+    """
+    nome = "resiliente"
+
+    def __init__(self, interno, prazo=PRAZO_PADRAO_SEGUNDOS, tentativas=3, espera_base=0.5, espera_maxima=20.0,
+                 percentil_hedge=None, disjuntor=None, eh_retentavel=erro_retentavel, gerador=random):
+        self.interno = interno
+        self.prazo = prazo
+        self.tentativas = max(1, tentativas)
+        self.espera_base = espera_base
+        self.espera_maxima = espera_maxima
+        self.percentil_hedge = percentil_hedge
+        self.disjuntor = disjuntor or Disjuntor()
+        self.eh_retentavel = eh_retentavel
+        self.gerador = gerador
+        self.latencias = deque(maxlen=JANELA_LATENCIAS)  # Latências (s) das chamadas bem sucedidas.
+        self._trava = threading.Lock()
+
+    # --- Auxiliares ---
+
+    def limite_hedge(self):
+        """ Latência a partir da qual uma cópia é disparada (None sem hedging ou sem amostras suficientes). """
+        if self.percentil_hedge is None:
+            return None
+        with self._trava:
+            if len(self.latencias) < AMOSTRAS_MINIMAS_HEDGE:
+                return None
+            ordenadas = sorted(self.latencias)
+        posicao = min(len(ordenadas) - 1, int(len(ordenadas) * self.percentil_hedge / 100))
+        return ordenadas[posicao]
+
+    def _registrar_latencia(self, segundos):
+        with self._trava:
+            self.latencias.append(segundos)
+
+    def _registrar_erro(self, erro):
+        """ Erros temporários contam para o disjuntor; os demais (ex: 400) mostram que o serviço respondeu. """
+        if self.eh_retentavel(erro):
+            self.disjuntor.registrar_falha()
+            return True
+        self.disjuntor.registrar_sucesso()
+        return False
+
+    def _esperar(self, tentativa):
+        """ Espera "full jitter": aleatória entre 0 e min(máximo, base * 2^tentativa). """
+        time.sleep(self.gerador.uniform(0, min(self.espera_maxima, self.espera_base * 2 ** tentativa)))
+
+    def _chamar_uma_vez(self, prompt, modelo, esquema=None):
+        """ Uma tentativa: chamada principal, cópia "hedged" opcional e prazo. """
+        argumentos = (prompt, modelo) if esquema is None else (prompt, modelo, esquema)
+        inicio = time.monotonic()
+        principal = _executar_em_thread(self.interno.gerar, *argumentos)
+        pendentes = {principal}
+
+        limite = self.limite_hedge()
+        if limite is not None and (self.prazo is None or limite < self.prazo):
+            concluidos, _ = wait(pendentes, timeout=limite)
+            if not concluidos:  # Retardatária: dispara uma cópia e fica com a primeira resposta.
+                pendentes.add(_executar_em_thread(self.interno.gerar, *argumentos))
+                metricas.contar("api_hedges")
+
+        erro = None
+        while pendentes:
+            restante = None if self.prazo is None else self.prazo - (time.monotonic() - inicio)
+            if restante is not None and restante <= 0:
+                break
+            concluidos, pendentes = wait(pendentes, timeout=restante, return_when=FIRST_COMPLETED)
+            for futuro in concluidos:
+                if futuro.exception() is None:
+                    self._registrar_latencia(time.monotonic() - inicio)
+                    if futuro is not principal:
+                        metricas.contar("api_hedges_vencedores")
+                    return futuro.result()
+                erro = futuro.exception()
+        if pendentes or erro is None:  # Ainda havia chamada em andamento: o prazo acabou.
+            metricas.contar("api_prazos_esgotados")
+            raise TempoEsgotado(f"A API não respondeu em {self.prazo:.1f} s.")
+        raise erro
+
+    # --- Interface do backend ---
+
+    def gerar(self, prompt, modelo, esquema=None):
+        for tentativa in range(self.tentativas):
+            self.disjuntor.permitir()
+            try:
+                texto = self._chamar_uma_vez(prompt, modelo, esquema)
+            except Exception as erro:
+                retentavel = self._registrar_erro(erro)
+                if tentativa == self.tentativas - 1 or not retentavel:
+                    raise
+                metricas.contar("api_novas_tentativas")
+                self._esperar(tentativa)
+                continue
+            self.disjuntor.registrar_sucesso()
+            return texto
+
+    def _abrir_stream(self, prompt, modelo):
+        """ Abre o streaming e espera o primeiro pedaço dentro do prazo. Retorna (pedaços, primeiro). """
+        def abrir():
+            pedacos = iter(self.interno.gerar_stream(prompt, modelo))
+            return pedacos, next(pedacos, None)
+
+        futuro = _executar_em_thread(abrir)
+        concluidos, _ = wait({futuro}, timeout=self.prazo)
+        if not concluidos:
+            metricas.contar("api_prazos_esgotados")
+            raise TempoEsgotado(f"A API não começou a responder em {self.prazo:.1f} s.")
+        return futuro.result()
+
+    def gerar_stream(self, prompt, modelo):
+        """
+        Streaming: as novas tentativas só acontecem antes do primeiro pedaço (depois dele, parte da
+        resposta já foi entregue). O prazo vale para a espera pelo primeiro pedaço.
+        """
+        for tentativa in range(self.tentativas):
+            self.disjuntor.permitir()
+            try:
+                pedacos, primeiro = self._abrir_stream(prompt, modelo)
+            except Exception as erro:
+                retentavel = self._registrar_erro(erro)
+                if tentativa == self.tentativas - 1 or not retentavel:
+                    raise
+                metricas.contar("api_novas_tentativas")
+                self._esperar(tentativa)
+                continue
+            self.disjuntor.registrar_sucesso()
+            if primeiro is not None:
+                yield primeiro
+            yield from pedacos
+            return
+
+    async def gerar_async(self, prompt, modelo, esquema=None):
+        """
+        Versão assíncrona (modo lote): prazo e disjuntor. As novas tentativas do lote continuam
+        em 'lote.chamar_com_tentativas', que também respeita o limite de taxa.
+        """
+        import asyncio  # Import adiado (ver BackendIA.gerar_async).
+        self.disjuntor.permitir()
+        inicio = time.monotonic()
+        try:
+            argumentos = (prompt, modelo) if esquema is None else (prompt, modelo, esquema)
+            texto = await asyncio.wait_for(self.interno.gerar_async(*argumentos), self.prazo)
+        except asyncio.TimeoutError:
+            self.disjuntor.registrar_falha()
+            metricas.contar("api_prazos_esgotados")
+            raise TempoEsgotado(f"A API não respondeu em {self.prazo:.1f} s.") from None
+        except Exception as erro:
+            self._registrar_erro(erro)
+            raise
+        self.disjuntor.registrar_sucesso()
+        self._registrar_latencia(time.monotonic() - inicio)
+        return texto
+
+    def validar(self):
+        self.interno.validar()
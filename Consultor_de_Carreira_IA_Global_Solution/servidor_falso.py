@@ -0,0 +1,79 @@
+# --- Servidor Falso da API Gemini (Testes Locais) ---
+# Servidor HTTP mínimo que imita o endpoint REST 'generateContent' do Gemini, respondendo com
+# tópicos sintéticos no formato "* Área: Curso: Salário" (ou em JSON, quando a requisição pede
+# saída estruturada). Permite executar o modo lote de ponta a ponta sem internet e sem gastar cota:
+#   python servidor_falso.py --porta 8765 --latencia-ms 200 --taxa-erro 0.1
+#   GOOGLE_API_KEY=falsa python main.py --lote --base-url http://127.0.0.1:8765
+import argparse  # Leitura dos parâmetros de linha de comando.
+import json  # Corpo das requisições e respostas.
+import random  # Injeção de erros.
+import re  # Reconhecimento do caminho da requisição.
+import time  # Latência simulada.
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # Servidor HTTP da biblioteca padrão.
+
+from backends import gerar_resposta_sintetica, gerar_resposta_sintetica_json  # Mesmo conteúdo do BackendSintetico.
+
+ROTA_GERAR = re.compile(r"^/v1(?:beta)?/models/([^/:]+):generateContent")
+
+
+class ManipuladorGemini(BaseHTTPRequestHandler):
+    """ Responde às requisições 'generateContent' com o formato JSON da API real. """
+    latencia = 0.0  # Segundos de espera antes de cada resposta.
+    taxa_erro = 0.0  # Fração das requisições respondidas com 429 (limite de uso).
+    linhas = 20  # Tópicos por resposta.
+
+    def do_POST(self):
+        rota = ROTA_GERAR.match(self.path)
+        corpo = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if rota is None:
+            return self._responder(404, {"error": {"code": 404, "message": "Rota desconhecida.", "status": "NOT_FOUND"}})
+
+        time.sleep(self.latencia)
+        if random.random() < self.taxa_erro:  # Simula o limite de uso da API.
+            return self._responder(429, {"error": {"code": 429, "message": "Limite de uso simulado.",
+                                                   "status": "RESOURCE_EXHAUSTED"}})
+
+        prompt = "".join(parte.get("text", "") for conteudo in corpo.get("contents", [])
+                         for parte in conteudo.get("parts", []))
+        if corpo.get("generationConfig", {}).get("responseMimeType") == "application/json":  # Saída estruturada.
+            texto = gerar_resposta_sintetica_json(prompt, self.linhas)
+        else:
+            texto = gerar_resposta_sintetica(prompt, self.linhas)
+        self._responder(200, {
+            "candidates": [{"content": {"role": "model", "parts": [{"text": texto}]}, "finishReason": "STOP"}],
+            "modelVersion": rota.group(1),
+        })
+
+    def _responder(self, status, dados):
+        conteudo = json.dumps(dados, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(conteudo)))
+        self.end_headers()
+        self.wfile.write(conteudo)
+
+    def log_message(self, formato, *args):  # Silencia o log padrão de cada requisição.
+        pass
+
+
+def criar_servidor(porta=8765, latencia=0.0, taxa_erro=0.0, linhas=20, host="127.0.0.1"):
+    """ Cria (sem iniciar) o servidor falso; use 'serve_forever()' ou uma thread para executá-lo. """
+    manipulador = type("ManipuladorConfigurado", (ManipuladorGemini,),
+                       {"latencia": latencia, "taxa_erro": taxa_erro, "linhas": linhas})
+    return ThreadingHTTPServer((host, porta), manipulador)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor falso da API Gemini para testes locais.")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--latencia-ms", type=float, default=0.0)
+    parser.add_argument("--taxa-erro", type=float, default=0.0, help="Fração de respostas 429 (0 a 1).")
+    parser.add_argument("--linhas", type=int, default=20, help="Tópicos por resposta.")
+    args = parser.parse_args()
+
+    servidor = criar_servidor(args.porta, args.latencia_ms / 1000, args.taxa_erro, args.linhas)
+    print(f"Servidor falso do Gemini em http://127.0.0.1:{args.porta} (Ctrl+C para sair)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        servidor.server_close()
@@ -0,0 +1,251 @@
+# --- Tabela Colunar (Dataframe Compacto) ---
+# Alternativa à lista de dicionários para grandes volumes: cada coluna é guardada separadamente.
+#   * 'salario_estimado_mensal' fica em um array('q') (inteiros de 64 bits, 8 bytes por linha).
+#   * 'area' e 'curso' são "internados": cada texto distinto é guardado uma única vez e a
+#     coluna guarda apenas o código (array('I'), 4 bytes por linha).
+# Se o NumPy estiver instalado, ele é usado (sem cópia) para ordenar e reordenar as colunas.
+# A tabela também pode ser gravada/lida em um formato binário compacto (ver 'gravar_binario').
+import struct  # Cabeçalho do formato binário.
+import sys  # Ordem dos bytes da máquina (formato binário é little-endian).
+from array import array  # Vetores compactos de tipo fixo.
+
+from ordenacao import mergesort_natural, normalizar_campos
+
+try:  # Dependência opcional: acelera argsort/take quando disponível.
+    import numpy as np
+except ImportError:
+    np = None
+
+COLUNA_AREA = 'area'
+COLUNA_CURSO = 'curso'
+COLUNA_SALARIO = 'salario_estimado_mensal'
+COLUNAS = (COLUNA_AREA, COLUNA_CURSO, COLUNA_SALARIO)  # Mesmo esquema da lista de dicionários.
+SALARIO_MAXIMO = 2 ** 63 - 1  # Maior salário que cabe na coluna array('q').
+
+# Formato binário: assinatura + (linhas, tamanho do vocabulário de áreas, de cursos), seguidos
+# dos vocabulários (tamanhos em 'I' + textos UTF-8) e das colunas (códigos 'I', salários 'q').
+ASSINATURA_BINARIO = b"CCT1"
+_CABECALHO_BINARIO = struct.Struct("<4sIII")
+
+
+class _ColunaTexto:
+    """ Coluna de texto internada: vocabulário de valores distintos + vetor de códigos. """
+    __slots__ = ("valores", "indice", "codigos")
+
+    def __init__(self):
+        self.valores = []  # Código -> texto.
+        self.indice = {}  # Texto -> código.
+        self.codigos = array("I")  # Um código por linha.
+
+    def adicionar(self, texto):
+        codigo = self.indice.get(texto)
+        if codigo is None:  # Primeiro uso deste texto: entra no vocabulário.
+            codigo = len(self.valores)
+            self.valores.append(texto)
+            self.indice[texto] = codigo
+        self.codigos.append(codigo)
+
+    def postos(self):
+        """ Devolve, para cada código, sua posição na ordem alfabética (permite comparar inteiros). """
+        ordem = sorted(range(len(self.valores)), key=self.valores.__getitem__)
+        posto = [0] * len(self.valores)
+        for posicao, codigo in enumerate(ordem):
+            posto[codigo] = posicao
+        return posto
+
+    def selecionar(self, indices):
+        """ Nova coluna com as linhas indicadas (o vocabulário é compartilhado, não copiado). """
+        nova = _ColunaTexto.__new__(_ColunaTexto)
+        nova.valores = self.valores
+        nova.indice = self.indice
+        nova.codigos = _selecionar(self.codigos, indices, "I")
+        return nova
+
+
+def _selecionar(vetor, indices, codigo_tipo):
+    """ Reordena/filtra um array pelos índices (com NumPy quando disponível). """
+    if np is not None and len(indices):
+        resultado = np.frombuffer(vetor, dtype=vetor.typecode).take(np.asarray(indices, dtype=np.intp))
+        return array(codigo_tipo, resultado.tobytes())
+    return array(codigo_tipo, [vetor[i] for i in indices])
+
+
+class TabelaColunar:
+    """
+    Dataframe colunar com o mesmo esquema de 'coletar_dados_da_api':
+    'area', 'curso' e 'salario_estimado_mensal'. Pode ser iterada (gera dicionários),
+    indexada, fatiada e ordenada, e é aceita por 'organizar_dados' e 'mostrar_dados'.
+    """
+
+    def __init__(self):
+        self._areas = _ColunaTexto()
+        self._cursos = _ColunaTexto()
+        self._salarios = array("q")
+
+    # --- Construção ---
+
+    @classmethod
+    def de_linhas(cls, linhas):
+        """ Cria uma tabela a partir de um iterável de dicionários (ex: a lista de 'coletar_dados_da_api'). """
+        tabela = cls()
+        for linha in linhas:
+            tabela.adicionar(linha[COLUNA_AREA], linha[COLUNA_CURSO], linha[COLUNA_SALARIO])
+        return tabela
+
+    def adicionar(self, area, curso, salario):
+        """ Acrescenta uma linha ao final da tabela. """
+        self._areas.adicionar(area)
+        self._cursos.adicionar(curso)
+        self._salarios.append(salario)
+
+    # --- Acesso ---
+
+    def __len__(self):
+        return len(self._salarios)
+
+    def __iter__(self):
+        areas, cursos = self._areas.valores, self._cursos.valores
+        for cod_area, cod_curso, salario in zip(self._areas.codigos, self._cursos.codigos, self._salarios):
+            yield {COLUNA_AREA: areas[cod_area], COLUNA_CURSO: cursos[cod_curso], COLUNA_SALARIO: salario}
+
+    def __getitem__(self, posicao):
+        if isinstance(posicao, slice):  # Fatia: devolve uma nova tabela.
+            return self.selecionar(range(*posicao.indices(len(self))))
+        return {
+            COLUNA_AREA: self._areas.valores[self._areas.codigos[posicao]],
+            COLUNA_CURSO: self._cursos.valores[self._cursos.codigos[posicao]],
+            COLUNA_SALARIO: self._salarios[posicao],
+        }
+
+    def __repr__(self):
+        return f"TabelaColunar({len(self)} linhas)"
+
+    def tuplas(self):
+        """ Gera (area, curso, salario) por linha, sem criar dicionários (exibição e exportação). """
+        areas, cursos = self._areas.valores, self._cursos.valores
+        for cod_area, cod_curso, salario in zip(self._areas.codigos, self._cursos.codigos, self._salarios):
+            yield areas[cod_area], cursos[cod_curso], salario
+
+    def vocabulario(self, nome):
+        """ Textos distintos de uma coluna de texto (pode incluir textos de linhas já filtradas). """
+        return self._coluna_texto(nome).valores
+
+    def coluna(self, nome):
+        """ Devolve os valores de uma coluna (o array de salários é devolvido sem cópia). """
+        if nome == COLUNA_SALARIO:
+            return self._salarios
+        coluna = self._coluna_texto(nome)
+        return [coluna.valores[codigo] for codigo in coluna.codigos]
+
+    def salarios_numpy(self):
+        """ Visão NumPy int64 (sem cópia) da coluna de salários; requer NumPy. """
+        if np is None:
+            raise RuntimeError("NumPy não está instalado.")
+        return np.frombuffer(self._salarios, dtype=np.int64)
+
+    def _coluna_texto(self, nome):
+        if nome == COLUNA_AREA:
+            return self._areas
+        if nome == COLUNA_CURSO:
+            return self._cursos
+        raise KeyError(nome)
+
+    # --- Ordenação ---
+
+    def _chaves_coluna(self, nome, decrescente):
+        """ Chave inteira de cada linha para uma coluna (texto vira posição alfabética). """
+        if nome == COLUNA_SALARIO:
+            valores = self._salarios
+        else:
+            coluna = self._coluna_texto(nome)
+            posto = coluna.postos()
+            valores = [posto[codigo] for codigo in coluna.codigos]
+        return [-v for v in valores] if decrescente else list(valores)
+
+    def argsort(self, campos=COLUNA_SALARIO, decrescente=True):
+        """
+        Devolve os índices das linhas na ordem pedida (estável, igual a 'ordenar').
+        Como todas as chaves viram inteiros, as comparações nunca tocam nos textos.
+        """
+        campos, decrescente = normalizar_campos(campos, decrescente)
+        colunas_chave = [self._chaves_coluna(c, d) for c, d in zip(campos, decrescente)]
+        n = len(self)
+
+        if np is not None:  # lexsort é estável; a última chave é a principal.
+            return np.lexsort([np.asarray(c, dtype=np.int64) for c in reversed(colunas_chave)]).tolist()
+
+        chaves = colunas_chave[0] if len(colunas_chave) == 1 else list(zip(*colunas_chave))
+        _, indices = mergesort_natural(chaves, list(range(n)))
+        return indices
+
+    def selecionar(self, indices):
+        """ Nova tabela com as linhas indicadas, na ordem dos índices. """
+        nova = TabelaColunar.__new__(TabelaColunar)
+        nova._areas = self._areas.selecionar(indices)
+        nova._cursos = self._cursos.selecionar(indices)
+        nova._salarios = _selecionar(self._salarios, indices, "q")
+        return nova
+
+    def ordenar(self, campos=COLUNA_SALARIO, decrescente=True):
+        """ Nova tabela ordenada (atalho para selecionar(argsort(...))). """
+        return self.selecionar(self.argsort(campos, decrescente))
+
+    # --- Formato Binário ---
+
+    def gravar_binario(self, arquivo):
+        """ Grava a tabela em um arquivo binário aberto ('wb'): as colunas vão direto, sem conversão por linha. """
+        vocabularios = [[texto.encode("utf-8") for texto in coluna.valores] for coluna in (self._areas, self._cursos)]
+        arquivo.write(_CABECALHO_BINARIO.pack(ASSINATURA_BINARIO, len(self), *map(len, vocabularios)))
+        for textos in vocabularios:
+            arquivo.write(_little_endian(array("I", map(len, textos))).tobytes())
+            arquivo.write(b"".join(textos))
+        for vetor in (self._areas.codigos, self._cursos.codigos, self._salarios):
+            arquivo.write(_little_endian(vetor).tobytes())
+
+    @classmethod
+    def ler_binario(cls, arquivo):
+        """ Lê uma tabela gravada por 'gravar_binario' de um arquivo binário aberto ('rb'). """
+        assinatura, n, n_areas, n_cursos = _CABECALHO_BINARIO.unpack(arquivo.read(_CABECALHO_BINARIO.size))
+        if assinatura != ASSINATURA_BINARIO:
+            raise ValueError("Arquivo não está no formato binário da TabelaColunar.")
+        tabela = cls()
+        for coluna, quantidade in ((tabela._areas, n_areas), (tabela._cursos, n_cursos)):
+            tamanhos = _ler_vetor(arquivo, "I", quantidade)
+            dados = arquivo.read(sum(tamanhos))
+            inicio = 0
+            for tamanho in tamanhos:
+                coluna.valores.append(dados[inicio:inicio + tamanho].decode("utf-8"))
+                inicio += tamanho
+            coluna.indice = {texto: codigo for codigo, texto in enumerate(coluna.valores)}
+        tabela._areas.codigos = _ler_vetor(arquivo, "I", n)
+        tabela._cursos.codigos = _ler_vetor(arquivo, "I", n)
+        tabela._salarios = _ler_vetor(arquivo, "q", n)
+        return tabela
+
+
+def _little_endian(vetor):
+    """ Cópia little-endian do array em máquinas big-endian (no caso comum, o próprio array). """
+    if sys.byteorder == "little":
+        return vetor
+    copia = array(vetor.typecode, vetor)
+    copia.byteswap()
+    return copia
+
+
+def _ler_vetor(arquivo, codigo_tipo, quantidade):
+    """ Lê 'quantidade' elementos little-endian do tipo indicado. """
+    vetor = array(codigo_tipo)
+    dados = arquivo.read(quantidade * vetor.itemsize)
+    if len(dados) != quantidade * vetor.itemsize:
+        raise ValueError("Arquivo binário truncado.")
+    vetor.frombytes(dados)
+    if sys.byteorder != "little":
+        vetor.byteswap()
+    return vetor
+
+
+def iterar_tuplas(dados):
+    """ Gera (area, curso, salario) de uma TabelaColunar ou de qualquer iterável de dicionários. """
+    if isinstance(dados, TabelaColunar):
+        return dados.tuplas()
+    return ((item[COLUNA_AREA], item[COLUNA_CURSO], item[COLUNA_SALARIO]) for item in dados)
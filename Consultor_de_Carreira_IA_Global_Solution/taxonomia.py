@@ -0,0 +1,424 @@
+# --- Taxonomia de Profissões (Menus de Profundidade Arbitrária) ---
+# Substitui o dicionário fixo de 3 níveis por uma árvore genérica, pensada para dezenas de
+# milhares de ocupações carregadas de um arquivo:
+#   * os nós ficam em vetores planos, em ordem de largura (BFS): os filhos de cada nó são
+#     contíguos, então listar uma página de opções é um fatiamento, sem percorrer a árvore;
+#   * busca por digitação ("type-ahead"), com nomes normalizados (sem acentos, minúsculas):
+#       - índice de prefixos: nós em ordem alfabética do nome e de cada palavra seguinte (guardadas
+#         como posição dentro do nome, sem copiar o texto) + busca binária;
+#       - índice de trigramas: trechos no meio do nome e nomes digitados com erros;
+#   * forma pré-compilada em disco (vetores binários + textos), carregada em poucos
+#     milissegundos na inicialização, sem reconstruir os índices.
+# Formatos de origem: JSON aninhado (mesmo formato de 'dados_profissoes') ou texto com um
+# caminho por linha, níveis separados por " > " (ex: "Exatas > Tecnologia > IA").
+import hashlib  # Nome do arquivo compilado em cache.
+import json  # Origem em JSON e metadados da forma compilada.
+import os  # Datas/tamanhos de arquivo e diretório do cache.
+import struct  # Cabeçalho da forma compilada.
+from array import array  # Vetores compactos de tipo fixo.
+from collections import Counter  # Contagem de trigramas em comum (busca aproximada).
+
+from agregacao import normalizar_area  # Mesma normalização do índice de áreas.
+from tabela import _ler_vetor, _little_endian  # Leitura/escrita little-endian dos vetores.
+
+RAIZ = 0  # Nó virtual (sem nome) cujos filhos são as opções do primeiro menu.
+SEPARADOR_CAMINHO = " > "
+DIRETORIO_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "consultor_carreira", "taxonomias")
+SIMILARIDADE_MINIMA = 0.5  # Fração dos trigramas da consulta presentes no nome (busca aproximada).
+
+# Forma compilada: assinatura + (nós, palavras indexadas, trigramas, postagens) + tamanhos em
+# bytes dos blocos de texto (metadados, nomes, nomes normalizados, trigramas), seguidos dos vetores.
+# Os blocos de texto são listas JSON: um nome pode conter qualquer caractere (inclusive '\n').
+ASSINATURA_COMPILADA = b"CCX2"
+_CABECALHO_COMPILADO = struct.Struct("<4s8I")
+
+
+def trigramas(texto):
+    """ Conjunto de trechos de 3 caracteres do texto normalizado ('ciber' -> {'cib', 'ibe', 'ber'}). """
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+
+def _faixa_com_prefixo(quantidade, chave, termo):
+    """
+    Posições, em ordem, cujas chaves começam com 'termo' em uma sequência ordenada de 'quantidade'
+    chaves, onde chave(i) devolve a i-ésima (busca binária pela primeira, depois varredura).
+    """
+    inicio, fim = 0, quantidade
+    while inicio < fim:
+        meio = (inicio + fim) // 2
+        if chave(meio) < termo:
+            inicio = meio + 1
+        else:
+            fim = meio
+    while inicio < quantidade and chave(inicio).startswith(termo):
+        yield inicio
+        inicio += 1
+
+
+def _caminhos_do_dicionario(dados, prefixo=()):
+    """ Caminhos (tuplas de nomes) de um dicionário aninhado; listas contêm as folhas. """
+    if isinstance(dados, dict):
+        for nome, filhos in dados.items():
+            if filhos:
+                yield from _caminhos_do_dicionario(filhos, prefixo + (nome,))
+            else:
+                yield prefixo + (nome,)
+    else:
+        for nome in dados:
+            yield prefixo + (nome,)
+
+
+def caminhos_do_texto(linhas):
+    """ Caminhos de um texto com um caminho por linha ("A > B > C"); ignora linhas vazias e '#'. """
+    for linha in linhas:
+        linha = linha.strip()
+        if linha and not linha.startswith("#"):
+            yield tuple(parte.strip() for parte in linha.split(SEPARADOR_CAMINHO))
+
+
+class Taxonomia:
+    """
+    Árvore de profissões em vetores planos. Os nós são inteiros (RAIZ = 0):
+      * nomes[no] e normalizados[no]: nome exibido e nome normalizado para a busca;
+      * pais[no]: nó pai (-1 na raiz);
+      * inicio_filhos[no] / quantidade_filhos[no]: faixa contígua dos filhos.
+    'niveis' nomeia os níveis nos menus; 'descricoes' guarda textos opcionais por nó.
+    """
+
+    def __init__(self):
+        self.nomes = [""]
+        self.normalizados = [""]
+        self.pais = array("i", [-1])
+        self.inicio_filhos = array("I", [0])
+        self.quantidade_filhos = array("I", [0])
+        self.niveis = []
+        self.descricoes = {}
+        self.origem = None  # (mtime_ns, tamanho) do arquivo de origem, para validar o cache compilado.
+        # Índices de busca (ver _indexar).
+        self._ordem_nomes = array("I")  # Nós em ordem alfabética do nome normalizado.
+        self._palavras_nos = array("I")  # Palavras após a primeira, em ordem alfabética do restante do nome:
+        self._palavras_posicoes = array("I")  # nó e posição em que a palavra começa no nome normalizado.
+        self._trigramas = []  # Trigramas distintos, em ordem alfabética.
+        self._inicio_postagens = array("I", [0])  # Faixa de cada trigrama em '_postagens'.
+        self._postagens = array("I")  # Nós que contêm cada trigrama (ordem crescente).
+        self._posicao_trigrama = None  # Trigrama -> posição (montado na primeira busca).
+
+    # --- Construção ---
+
+    @classmethod
+    def de_caminhos(cls, caminhos, niveis=(), descricoes=None):
+        """
+        Monta a taxonomia a partir de caminhos até as folhas (tuplas de nomes).
+        'descricoes' mapeia caminhos (tuplas) para textos exibidos junto da opção.
+        """
+        arvore = {}  # Trie temporária: nome -> subárvore (a ordem de inserção é preservada).
+        for caminho in caminhos:
+            no = arvore
+            for nome in caminho:
+                no = no.setdefault(nome, {})
+
+        taxonomia = cls()
+        taxonomia.niveis = list(niveis)
+        fila = [(RAIZ, arvore)]  # Percurso em largura: os filhos de cada nó recebem ids seguidos.
+        for pai, subarvore in fila:
+            taxonomia.inicio_filhos[pai] = len(taxonomia.nomes)
+            taxonomia.quantidade_filhos[pai] = len(subarvore)
+            for nome, filhos in subarvore.items():
+                fila.append((len(taxonomia.nomes), filhos))
+                taxonomia.nomes.append(nome)
+                taxonomia.normalizados.append(normalizar_area(nome))
+                taxonomia.pais.append(pai)
+                taxonomia.inicio_filhos.append(0)
+                taxonomia.quantidade_filhos.append(0)
+
+        for caminho, texto in (descricoes or {}).items():
+            no = taxonomia.no_do_caminho(caminho)
+            if no is not None:
+                taxonomia.descricoes[no] = texto
+        taxonomia._indexar()
+        return taxonomia
+
+    @classmethod
+    def de_dicionario(cls, dados, niveis=(), descricoes=None):
+        """ Monta a taxonomia a partir de um dicionário aninhado como 'dados_profissoes'. """
+        return cls.de_caminhos(_caminhos_do_dicionario(dados), niveis, descricoes)
+
+    def _indexar(self):
+        """ Monta os índices de prefixos e de trigramas a partir dos nomes normalizados. """
+        palavras = []
+        postagens = {}
+        for no in range(1, len(self.nomes)):
+            nome = self.normalizados[no]
+            # Uma entrada por palavra seguinte: "gestao hospitalar" também é encontrada por "hos".
+            for posicao, caractere in enumerate(nome):
+                if caractere == " ":
+                    palavras.append((nome[posicao + 1:], no, posicao + 1))
+            for trigrama in trigramas(nome):
+                postagens.setdefault(trigrama, []).append(no)
+        self._ordem_nomes = array("I", sorted(range(1, len(self.nomes)), key=self.normalizados.__getitem__))
+        palavras.sort()
+        self._palavras_nos = array("I", (no for _, no, _ in palavras))
+        self._palavras_posicoes = array("I", (posicao for _, _, posicao in palavras))
+        self._trigramas = sorted(postagens)
+        self._inicio_postagens = array("I", [0])
+        self._postagens = array("I")
+        for trigrama in self._trigramas:
+            self._postagens.extend(postagens[trigrama])
+            self._inicio_postagens.append(len(self._postagens))
+        self._posicao_trigrama = None
+
+    # --- Navegação ---
+
+    def __len__(self):
+        """ Quantidade de nós (sem contar a raiz virtual). """
+        return len(self.nomes) - 1
+
+    def filhos(self, no=RAIZ):
+        """ Faixa (range) dos filhos de 'no'. """
+        inicio = self.inicio_filhos[no]
+        return range(inicio, inicio + self.quantidade_filhos[no])
+
+    def eh_folha(self, no):
+        return self.quantidade_filhos[no] == 0
+
+    def profundidade(self, no):
+        """ 0 para a raiz, 1 para as opções do primeiro menu, e assim por diante. """
+        nivel = 0
+        while no != RAIZ:
+            no = self.pais[no]
+            nivel += 1
+        return nivel
+
+    def profundidade_maxima(self):
+        """ Níveis da árvore: em ordem de largura, o último nó é um dos mais profundos. """
+        return self.profundidade(len(self.nomes) - 1)
+
+    def linhagem(self, no):
+        """ Nós do primeiro nível até 'no' (inclusive), na ordem dos menus. """
+        nos = []
+        while no != RAIZ:
+            nos.append(no)
+            no = self.pais[no]
+        nos.reverse()
+        return nos
+
+    def caminho(self, no):
+        """ Tupla de nomes da raiz até 'no' (ex: ('Exatas', 'Tecnologia', 'IA')). """
+        return tuple(self.nomes[n] for n in self.linhagem(no))
+
+    def filho(self, no, nome):
+        """ Filho de 'no' com o nome indicado (None se não existir). """
+        for candidato in self.filhos(no):
+            if self.nomes[candidato] == nome:
+                return candidato
+        return None
+
+    def no_do_caminho(self, caminho):
+        """ Nó correspondente a uma tupla de nomes (None se o caminho não existir). """
+        no = RAIZ
+        for nome in caminho:
+            no = self.filho(no, nome)
+            if no is None:
+                return None
+        return no
+
+    def nome_nivel(self, profundidade):
+        """ Nome do nível das opções na profundidade indicada (1 = primeiro menu). """
+        if 0 < profundidade <= len(self.niveis):
+            return self.niveis[profundidade - 1]
+        return f"Nível {profundidade}"
+
+    def pagina(self, no, numero, por_pagina):
+        """ Filhos de 'no' na página 'numero' (começando em 0), como faixa de nós. """
+        filhos = self.filhos(no)
+        return filhos[numero * por_pagina:(numero + 1) * por_pagina]
+
+    def caminhos_folhas(self, no=RAIZ):
+        """ Caminhos de todas as folhas abaixo de 'no', na ordem dos menus. """
+        pilha = [no]
+        while pilha:
+            atual = pilha.pop()
+            if self.eh_folha(atual) and atual != RAIZ:
+                yield self.caminho(atual)
+            pilha.extend(reversed(self.filhos(atual)))
+
+    # --- Busca ---
+
+    def _postagens_de(self, trigrama):
+        if self._posicao_trigrama is None:  # Montado sob demanda: a carga compilada fica mais rápida.
+            self._posicao_trigrama = {t: posicao for posicao, t in enumerate(self._trigramas)}
+        posicao = self._posicao_trigrama.get(trigrama)
+        if posicao is None:
+            return ()
+        return self._postagens[self._inicio_postagens[posicao]:self._inicio_postagens[posicao + 1]]
+
+    def buscar(self, consulta, limite=10, raiz=RAIZ):
+        """
+        Nós cujo nome corresponde à consulta, do mais ao menos relevante:
+          1. o nome começa com a consulta; 2. uma palavra seguinte começa com ela (índice de prefixos);
+          3. a consulta aparece no meio do nome (trigramas + conferência);
+          4. nomes parecidos, para erros de digitação (trigramas em comum).
+        'raiz' restringe a busca aos descendentes de um nó.
+        """
+        termo = normalizar_area(consulta)
+        if not termo:
+            return []
+        resultados = []
+        vistos = set()
+
+        def aceitar(nos):  # Acrescenta os nós ainda não vistos; True quando o limite foi atingido.
+            for no in nos:
+                if no not in vistos and (raiz == RAIZ or self._descende_de(no, raiz)):
+                    vistos.add(no)
+                    resultados.append(no)
+                    if len(resultados) >= limite:
+                        return True
+            return False
+
+        # 1 e 2. Prefixos: as entradas que começam com o termo são contíguas e já estão em ordem
+        # alfabética, então a varredura para assim que o limite é atingido.
+        normalizados = self.normalizados
+        if aceitar(self._ordem_nomes[i] for i in _faixa_com_prefixo(
+                len(self._ordem_nomes), lambda i: normalizados[self._ordem_nomes[i]], termo)):
+            return resultados
+        if aceitar(self._palavras_nos[i] for i in _faixa_com_prefixo(
+                len(self._palavras_nos),
+                lambda i: normalizados[self._palavras_nos[i]][self._palavras_posicoes[i]:], termo)):
+            return resultados
+
+        consulta_trigramas = trigramas(termo)
+        if not consulta_trigramas:
+            return resultados
+        listas = sorted((self._postagens_de(t) for t in consulta_trigramas), key=len)
+        # 3. Trecho do nome: todo nome que contém o termo está na menor lista de postagens.
+        contem = [no for no in listas[0] if termo in normalizados[no]]
+        if aceitar(sorted(contem, key=lambda no: (len(normalizados[no]), normalizados[no]))):
+            return resultados
+        # 4. Aproximada: proporção dos trigramas da consulta presentes no nome.
+        comuns = Counter()
+        for lista in listas:
+            comuns.update(lista)
+        minimo = SIMILARIDADE_MINIMA * len(consulta_trigramas)
+        parecidos = [no for no, quantidade in comuns.items() if quantidade >= minimo]
+        parecidos.sort(key=lambda no: (-comuns[no], len(normalizados[no]), normalizados[no]))
+        aceitar(parecidos)
+        return resultados
+
+    def _descende_de(self, no, ancestral):
+        while no != RAIZ:
+            no = self.pais[no]
+            if no == ancestral:
+                return True
+        return False
+
+    # --- Forma compilada ---
+
+    def gravar_compilada(self, arquivo):
+        """ Grava a taxonomia e os índices em um arquivo binário aberto ('wb'). """
+        metadados = json.dumps({"niveis": self.niveis, "descricoes": self.descricoes, "origem": self.origem},
+                               ensure_ascii=False).encode("utf-8")
+        blocos = [metadados] + [json.dumps(textos, ensure_ascii=False).encode("utf-8")
+                                for textos in (self.nomes, self.normalizados, self._trigramas)]
+        arquivo.write(_CABECALHO_COMPILADO.pack(
+            ASSINATURA_COMPILADA, len(self.nomes), len(self._palavras_nos), len(self._trigramas),
+            len(self._postagens), *map(len, blocos)))
+        for bloco in blocos:
+            arquivo.write(bloco)
+        for vetor in (self.pais, self.inicio_filhos, self.quantidade_filhos, self._ordem_nomes, self._palavras_nos,
+                      self._palavras_posicoes, self._inicio_postagens, self._postagens):
+            arquivo.write(_little_endian(vetor).tobytes())
+
+    @classmethod
+    def ler_compilada(cls, arquivo):
+        """ Lê uma taxonomia gravada por 'gravar_compilada' de um arquivo binário aberto ('rb'). """
+        cabecalho = arquivo.read(_CABECALHO_COMPILADO.size)
+        if len(cabecalho) != _CABECALHO_COMPILADO.size or cabecalho[:4] != ASSINATURA_COMPILADA:
+            raise ValueError("Arquivo não está no formato compilado da Taxonomia.")
+        _, n_nos, n_palavras, n_trigramas, n_postagens, *tamanhos = _CABECALHO_COMPILADO.unpack(cabecalho)
+        blocos = [arquivo.read(tamanho) for tamanho in tamanhos]
+        if sum(map(len, blocos)) != sum(tamanhos):
+            raise ValueError("Arquivo compilado truncado.")
+
+        taxonomia = cls.__new__(cls)
+        metadados = json.loads(blocos[0])
+        taxonomia.niveis = metadados["niveis"]
+        taxonomia.descricoes = {int(no): texto for no, texto in metadados["descricoes"].items()}
+        taxonomia.origem = metadados["origem"]
+        taxonomia.nomes, taxonomia.normalizados, taxonomia._trigramas = map(json.loads, blocos[1:])
+        if (len(taxonomia.nomes), len(taxonomia.normalizados), len(taxonomia._trigramas)) != (n_nos, n_nos, n_trigramas):
+            raise ValueError("Arquivo compilado inconsistente (quantidade de textos).")
+        taxonomia.pais = _ler_vetor(arquivo, "i", n_nos)
+        taxonomia.inicio_filhos = _ler_vetor(arquivo, "I", n_nos)
+        taxonomia.quantidade_filhos = _ler_vetor(arquivo, "I", n_nos)
+        taxonomia._ordem_nomes = _ler_vetor(arquivo, "I", n_nos - 1)
+        taxonomia._palavras_nos = _ler_vetor(arquivo, "I", n_palavras)
+        taxonomia._palavras_posicoes = _ler_vetor(arquivo, "I", n_palavras)
+        taxonomia._inicio_postagens = _ler_vetor(arquivo, "I", n_trigramas + 1)
+        taxonomia._postagens = _ler_vetor(arquivo, "I", n_postagens)
+        taxonomia._posicao_trigrama = None
+        return taxonomia
+
+
+def ler_taxonomia_fonte(caminho, niveis=()):
+    """ Monta a taxonomia de um arquivo de origem: JSON aninhado (.json) ou texto "A > B > C". """
+    with open(caminho, encoding="utf-8") as arquivo:
+        if caminho.lower().endswith(".json"):
+            dados = json.load(arquivo)
+            return Taxonomia.de_dicionario(dados, niveis)
+        return Taxonomia.de_caminhos(caminhos_do_texto(arquivo), niveis)
+
+
+def compilar_taxonomia(caminho_origem, caminho_saida, niveis=()):
+    """ Lê o arquivo de origem e grava a forma compilada em 'caminho_saida'. Retorna a taxonomia. """
+    taxonomia = ler_taxonomia_fonte(caminho_origem, niveis)
+    _gravar_atomico(taxonomia, caminho_saida)
+    return taxonomia
+
+
+def carregar_taxonomia(caminho, niveis=(), diretorio_cache=DIRETORIO_CACHE):
+    """
+    Carrega uma taxonomia de 'caminho':
+      * arquivo já compilado (assinatura CCX2): leitura direta;
+      * arquivo de origem: usa a forma compilada guardada em 'diretorio_cache' se ela corresponder à
+        data/tamanho atuais do arquivo; caso contrário, lê a origem e atualiza o cache.
+    'diretorio_cache=None' desativa o cache.
+    """
+    with open(caminho, "rb") as arquivo:
+        if arquivo.read(len(ASSINATURA_COMPILADA)) == ASSINATURA_COMPILADA:
+            arquivo.seek(0)
+            return Taxonomia.ler_compilada(arquivo)
+
+    informacoes = os.stat(caminho)
+    origem = [informacoes.st_mtime_ns, informacoes.st_size]
+    caminho_cache = None
+    if diretorio_cache is not None:
+        nome_cache = hashlib.sha1(os.path.abspath(caminho).encode("utf-8")).hexdigest()[:16] + ".bin"
+        caminho_cache = os.path.join(diretorio_cache, nome_cache)
+        try:
+            with open(caminho_cache, "rb") as arquivo:
+                taxonomia = Taxonomia.ler_compilada(arquivo)
+            if taxonomia.origem == origem:
+                if niveis:
+                    taxonomia.niveis = list(niveis)
+                return taxonomia
+        except (OSError, ValueError):  # Sem cache (ou cache corrompido): reconstrói.
+            pass
+
+    taxonomia = ler_taxonomia_fonte(caminho, niveis)
+    taxonomia.origem = origem
+    if caminho_cache is not None:
+        try:
+            _gravar_atomico(taxonomia, caminho_cache)
+        except OSError:  # Cache é só otimização: falha ao gravar não impede o uso.
+            pass
+    return taxonomia
+
+
+def _gravar_atomico(taxonomia, caminho):
+    """ Grava em um arquivo temporário e o renomeia: uma leitura simultânea nunca vê o arquivo pela metade. """
+    diretorio = os.path.dirname(os.path.abspath(caminho))
+    os.makedirs(diretorio, exist_ok=True)
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, "wb") as arquivo:
+        taxonomia.gravar_compilada(arquivo)
+    os.replace(temporario, caminho)
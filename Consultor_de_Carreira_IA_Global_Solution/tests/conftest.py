@@ -0,0 +1,11 @@
+# --- Configuração dos Testes (pytest) ---
+# Os módulos do projeto ficam na pasta acima de 'tests' e são importados pelo nome (como em main.py);
+# os dados sintéticos vêm dos mesmos geradores dos benchmarks (benchmarks/dados_sinteticos.py).
+# Uso (a partir da pasta do projeto):
+#   python -m pytest -q tests
+import os  # Montagem do caminho do projeto.
+import sys  # Ajuste do sys.path.
+
+PASTA_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PASTA_PROJETO)
+sys.path.insert(0, os.path.join(PASTA_PROJETO, "benchmarks"))
@@ -0,0 +1,116 @@
+# --- Testes da Agregação entre Perfis (agregacao.py) ---
+# O P² é comparado com a mediana exata pela posição (rank) da estimativa na amostra ordenada;
+# o índice é testado com dois objetos abertos sobre o mesmo banco, como dois processos.
+import bisect  # Posição da estimativa na amostra ordenada.
+import random  # Amostras contínuas (normal e log-normal).
+import statistics  # Mediana exata de referência.
+
+import pytest
+
+from agregacao import EstimadorP2, IndiceAreas, normalizar_area
+from dados_sinteticos import gerar_salarios
+
+CHAVE = 'salario_estimado_mensal'
+
+
+def estimar(valores, p=0.5):
+    estimador = EstimadorP2(p)
+    for valor in valores:
+        estimador.adicionar(valor)
+    return estimador
+
+
+def amostras():
+    gerador = random.Random(1)
+    yield "normal", [gerador.gauss(8_000, 2_000) for _ in range(5_000)]
+    yield "lognormal", [gerador.lognormvariate(9, 0.6) for _ in range(5_000)]
+    for distribuicao in ("aleatoria", "ordenada", "invertida"):
+        yield distribuicao, gerar_salarios(10_000, distribuicao)
+
+
+@pytest.mark.parametrize("nome,valores", list(amostras()))
+def test_p2_perto_da_mediana_exata(nome, valores):
+    ordenados = sorted(valores)
+    posicao = bisect.bisect_left(ordenados, estimar(valores).valor()) / len(valores)
+    assert abs(posicao - 0.5) <= 0.02, nome
+
+
+def test_p2_com_muitos_empates():
+    valores = gerar_salarios(10_000, "iguais")
+    assert estimar(valores).valor() == pytest.approx(statistics.median(valores), rel=0.05)
+
+
+@pytest.mark.parametrize("valores", [[7], [3, 1], [5, 1, 9], [4, 8, 2, 6]])
+def test_p2_exato_com_menos_de_cinco_valores(valores):
+    assert estimar(valores).valor() == statistics.median(valores)
+    assert EstimadorP2().valor() is None
+
+
+def test_p2_sobrevive_a_serializacao():
+    valores = gerar_salarios(1_000)
+    estimador = estimar(valores[:500])
+    copia = EstimadorP2.de_dict(estimador.para_dict())
+    for valor in valores[500:]:
+        estimador.adicionar(valor)
+        copia.adicionar(valor)
+    assert copia.valor() == estimador.valor()
+
+
+def test_normalizar_area():
+    assert normalizar_area("  Engenharia  de SOFTWARE ") == "engenharia de software"
+    assert normalizar_area("Ciência de Dados") == normalizar_area("ciencia de dados")
+
+
+def ranking(*pares):
+    return [{'area': area, 'curso': "Curso", CHAVE: salario} for area, salario in pares]
+
+
+def test_ranking_repetido_conta_uma_vez(tmp_path):
+    indice = IndiceAreas(str(tmp_path / "agregacao.sqlite3"))
+    linhas = ranking(("Dados", 10_000), ("Saúde", 7_000))
+    assert indice.registrar(linhas, ("Tecnologia", "Dados", "ML")) is True
+    assert indice.registrar(list(reversed(linhas)), ("Tecnologia", "Dados", "ML")) is False  # Mesma resposta.
+    assert indice.registrar(linhas, ("Saúde", "Clínica", "Geral")) is True  # Outra origem conta.
+    indice.fechar()
+
+    reaberto = IndiceAreas(str(tmp_path / "agregacao.sqlite3"))
+    assert reaberto.registrar(linhas, ("Tecnologia", "Dados", "ML")) is False  # Já gravado no banco.
+    assert reaberto.registrar([], "vazio") is False
+    assert reaberto.consultar("dados").contagem == 2
+    assert reaberto.consultar("saude").origens == {'["Tecnologia", "Dados", "ML"]': 1,
+                                                   '["Saúde", "Clínica", "Geral"]': 1}
+    reaberto.fechar()
+
+
+def test_perfis_com_barra_no_nome_nao_se_confundem(tmp_path):
+    indice = IndiceAreas(str(tmp_path / "agregacao.sqlite3"))
+    linhas = ranking(("Design", 9_000))
+    assert indice.registrar(linhas, ("Artes", "Design", "UX/UI")) is True
+    assert indice.registrar(linhas, ("Artes", "Design/UX", "UI")) is True  # Mesmo texto com "/".join.
+    indice.fechar()
+    reaberto = IndiceAreas(str(tmp_path / "agregacao.sqlite3"))
+    assert reaberto.consultar("design").resumo()["perfis"] == 2
+    assert reaberto.registrar(linhas, ["Artes", "Design", "UX/UI"]) is False  # Lista ou tupla: mesma origem.
+    reaberto.fechar()
+
+
+def test_indices_simultaneos_somam_as_contagens(tmp_path):
+    caminho = str(tmp_path / "agregacao.sqlite3")
+    primeiro, segundo = IndiceAreas(caminho), IndiceAreas(caminho)
+    primeiro.registrar(ranking(("Dados", 10_000), ("Saúde", 6_000)), "a")
+    segundo.registrar(ranking(("Dados", 12_000)), "b")
+    segundo.registrar(ranking(("Dados", 10_000), ("Saúde", 6_000)), "a")  # Mesmo ranking do primeiro.
+    primeiro.salvar()
+    segundo.salvar()  # Soma ao que o primeiro gravou, sem sobrescrever.
+    assert segundo.consultar("Dados").contagem == 2
+    primeiro.fechar()
+    segundo.fechar()
+
+    final = IndiceAreas(caminho)
+    dados = final.consultar("Dados")
+    assert (dados.contagem, dados.minimo, dados.maximo, dados.soma) == (2, 10_000, 12_000, 22_000)
+    assert final.consultar("Saúde").contagem == 1
+    assert [linha['area'] for linha in final.ranking(2, "maximo")] == ["Dados", "Saúde"]
+    with pytest.raises(ValueError):
+        final.ranking(criterio="moda")
+    final.fechar()
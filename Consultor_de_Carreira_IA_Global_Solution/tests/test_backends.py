@@ -0,0 +1,119 @@
+# --- Testes dos Backends Locais (backends.py) ---
+# BackendSintetico: respostas determinísticas por prompt, legíveis pelo mesmo Regex da API real.
+# BackendGravacao: o que foi gravado é reproduzido byte a byte, sem o backend interno.
+import asyncio  # Caminho assíncrono (modo lote).
+import json  # Leitura do arquivo de gravações.
+
+import pytest
+
+from backends import BackendGravacao, BackendSintetico, RespostaNaoGravada, _topicos_sinteticos
+from estruturado import ESQUEMA_RESPOSTA, converter_resposta_json
+from extracao import converter_linha
+
+MODELO = "gemini-2.5-flash"
+PROMPTS = ["Liste cursos de Exatas > Tecnologia > IA", "Liste cursos de Saúde > Enfermagem", "Ação: \"ç\" ✓"]
+
+
+def test_sintetico_deterministico_por_prompt():
+    primeiro, segundo = BackendSintetico(linhas=30), BackendSintetico(linhas=30)
+    for prompt in PROMPTS:
+        assert primeiro.gerar(prompt, MODELO) == segundo.gerar(prompt, "outro-modelo")
+        assert primeiro.gerar(prompt, MODELO, ESQUEMA_RESPOSTA) == segundo.gerar(prompt, MODELO, ESQUEMA_RESPOSTA)
+    respostas = {primeiro.gerar(prompt, MODELO) for prompt in PROMPTS}
+    assert len(respostas) == len(PROMPTS)  # Prompts diferentes, respostas diferentes.
+    assert primeiro.chamadas == 3 * len(PROMPTS)
+
+
+@pytest.mark.parametrize("linhas", [0, 1, 50])
+def test_sintetico_legivel_pelo_regex(linhas):
+    prompt = PROMPTS[0]
+    texto = BackendSintetico(linhas=linhas).gerar(prompt, MODELO)
+    convertidas = [converter_linha(linha.strip()) for linha in texto.splitlines()]
+    esperadas = [{'area': area, 'curso': curso, 'salario_estimado_mensal': salario}
+                 for area, curso, salario in _topicos_sinteticos(prompt, linhas)]
+    assert convertidas == esperadas
+    assert all(linha['salario_estimado_mensal'] >= 2_000 for linha in convertidas)
+
+
+@pytest.mark.parametrize("linhas", [1, 50])
+def test_sintetico_estruturado_com_os_mesmos_topicos(linhas):
+    prompt = PROMPTS[0]
+    texto = BackendSintetico(linhas=linhas).gerar(prompt, MODELO)
+    esperadas = [converter_linha(linha) for linha in texto.splitlines()]
+    resposta = BackendSintetico(linhas=linhas).gerar(prompt, MODELO, ESQUEMA_RESPOSTA)
+    assert converter_resposta_json(resposta) == (esperadas, "json", 0)
+
+
+def test_sintetico_stream_e_async_iguais_ao_gerar():
+    backend = BackendSintetico(linhas=40, tamanho_pedaco=17)
+    texto = backend.gerar(PROMPTS[1], MODELO)
+    pedacos = list(backend.gerar_stream(PROMPTS[1], MODELO))
+    assert "".join(pedacos) == texto and len(pedacos) > 1
+    assert all(len(pedaco) <= 17 for pedaco in pedacos)
+    assert asyncio.run(backend.gerar_async(PROMPTS[1], MODELO)) == texto
+
+
+def gravar_tudo(caminho):
+    """ Grava uma resposta de cada tipo de chamada; retorna o que o backend interno respondeu. """
+    gravacao = BackendGravacao(str(caminho), modo="gravar", interno=BackendSintetico(linhas=8, tamanho_pedaco=10))
+    return {
+        "gerar": [gravacao.gerar(prompt, MODELO) for prompt in PROMPTS],
+        "stream": "".join(gravacao.gerar_stream("Prompt do stream", MODELO)),
+        "async": asyncio.run(gravacao.gerar_async("Prompt assíncrono", MODELO)),
+        "estruturado": gravacao.gerar("Prompt estruturado", MODELO, ESQUEMA_RESPOSTA),
+    }
+
+
+def test_gravacao_reproduz_as_mesmas_respostas(tmp_path):
+    caminho = tmp_path / "gravacoes.jsonl"
+    gravadas = gravar_tudo(caminho)
+    assert len(caminho.read_text(encoding="utf-8").splitlines()) == len(PROMPTS) + 3
+
+    reproducao = BackendGravacao(str(caminho))  # Sem backend interno: nada vai à rede.
+    assert [reproducao.gerar(prompt, MODELO) for prompt in PROMPTS] == gravadas["gerar"]
+    assert "".join(reproducao.gerar_stream("Prompt do stream", MODELO)) == gravadas["stream"]
+    assert asyncio.run(reproducao.gerar_async("Prompt assíncrono", MODELO)) == gravadas["async"]
+    assert reproducao.gerar("Prompt estruturado", MODELO, ESQUEMA_RESPOSTA) == gravadas["estruturado"]
+    assert reproducao.gerar(PROMPTS[0], MODELO) == reproducao.gerar(PROMPTS[0], MODELO)  # Repetível.
+
+
+def test_gravacao_nao_guarda_o_prompt(tmp_path):
+    caminho = tmp_path / "gravacoes.jsonl"
+    gravar_tudo(caminho)
+    registros = [json.loads(linha) for linha in caminho.read_text(encoding="utf-8").splitlines()]
+    assert all(set(registro) == {"chave", "modelo", "texto"} for registro in registros)
+    assert "Tecnologia > IA" not in caminho.read_text(encoding="utf-8")
+
+
+def test_reproducao_sem_gravacao_levanta_erro(tmp_path):
+    caminho = tmp_path / "gravacoes.jsonl"
+    gravar_tudo(caminho)
+    reproducao = BackendGravacao(str(caminho))
+    with pytest.raises(RespostaNaoGravada):
+        reproducao.gerar("Prompt nunca gravado", MODELO)
+    with pytest.raises(RespostaNaoGravada):
+        reproducao.gerar(PROMPTS[0], "outro-modelo")  # O modelo faz parte da chave.
+    with pytest.raises(RespostaNaoGravada):
+        list(reproducao.gerar_stream("Prompt nunca gravado", MODELO))
+    with pytest.raises(KeyError):  # RespostaNaoGravada também é um KeyError.
+        asyncio.run(reproducao.gerar_async("Prompt nunca gravado", MODELO))
+
+
+def test_gravacao_acrescenta_ao_arquivo_existente(tmp_path):
+    caminho = tmp_path / "gravacoes.jsonl"
+    primeira = gravar_tudo(caminho)
+    continuacao = BackendGravacao(str(caminho), modo="gravar", interno=BackendSintetico(linhas=8))
+    nova = continuacao.gerar("Prompt novo", MODELO)
+
+    reproducao = BackendGravacao(str(caminho))
+    assert reproducao.gerar("Prompt novo", MODELO) == nova
+    assert reproducao.gerar(PROMPTS[2], MODELO) == primeira["gerar"][2]
+
+
+def test_gravacao_opcoes_invalidas(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        BackendGravacao(str(tmp_path / "inexistente.jsonl"))
+    with pytest.raises(ValueError, match="interno"):
+        BackendGravacao(str(tmp_path / "nova.jsonl"), modo="gravar")
+    with pytest.raises(ValueError, match="desconhecido"):
+        BackendGravacao(str(tmp_path / "nova.jsonl"), modo="apagar")
@@ -0,0 +1,107 @@
+# --- Testes do Cache de Respostas (cache_respostas.py) ---
+# O relógio é substituído por um contador controlado pelo teste, para que TTL e LRU não
+# dependam do tempo real da máquina.
+import threading  # Chamadas simultâneas (single-flight).
+
+import pytest
+
+import cache_respostas
+from cache_respostas import CacheRespostas, gerar_chave
+
+
+class Relogio:
+    def __init__(self):
+        self.agora = 1_000.0
+
+    def __call__(self):
+        return self.agora
+
+
+@pytest.fixture
+def relogio(monkeypatch):
+    relogio = Relogio()
+    monkeypatch.setattr(cache_respostas.time, "time", relogio)
+    return relogio
+
+
+@pytest.fixture
+def cache(tmp_path, relogio):
+    cache = CacheRespostas(str(tmp_path / "respostas.sqlite3"), ttl_segundos=60, max_entradas=3)
+    yield cache
+    cache.fechar()
+
+
+def test_chave_depende_de_modelo_versao_e_prompt():
+    base = gerar_chave("modelo", "prompt", 1)
+    assert base == gerar_chave("modelo", "prompt", 1)
+    assert len({base, gerar_chave("outro", "prompt", 1), gerar_chave("modelo", "prompt", 2),
+                gerar_chave("modelo", "prompt!", 1)}) == 4
+
+
+def test_acertos_e_falhas(cache):
+    assert cache.obter("a") is None
+    cache.guardar("a", "m", "texto")
+    assert cache.obter("a") == "texto"
+    assert cache.obter("a", contar=False) == "texto"
+    estatisticas = cache.estatisticas()
+    assert (estatisticas["acertos"], estatisticas["falhas"], estatisticas["entradas"]) == (1, 1, 1)
+    assert estatisticas["taxa_acerto"] == 0.5
+
+
+def test_ttl_expira_pela_data_de_criacao(cache, relogio):
+    cache.guardar("a", "m", "texto")
+    relogio.agora += 59
+    assert cache.obter("a") == "texto"  # O acesso não renova o TTL...
+    relogio.agora += 2
+    assert cache.obter("a") is None  # ...que conta a partir da gravação.
+    assert cache.expiradas == 1 and cache.estatisticas()["entradas"] == 0
+
+
+def test_lru_descarta_o_acessado_ha_mais_tempo(cache, relogio):
+    for chave in "abc":
+        cache.guardar(chave, "m", chave.upper())
+        relogio.agora += 1
+    assert cache.obter("a") == "A"  # 'a' passa a ser o mais recente; 'b' vira o mais antigo.
+    relogio.agora += 1
+    cache.guardar("d", "m", "D")
+    assert cache.obter("b", contar=False) is None
+    assert [cache.obter(chave, contar=False) for chave in "acd"] == ["A", "C", "D"]
+    assert cache.descartadas == 1 and cache.estatisticas()["entradas"] == 3
+
+
+def test_obter_ou_calcular_renovar_e_respostas_vazias(cache):
+    chamadas = []
+
+    def calcular():
+        chamadas.append(1)
+        return f"resposta {len(chamadas)}"
+
+    assert cache.obter_ou_calcular("m", "p", 1, calcular) == "resposta 1"
+    assert cache.obter_ou_calcular("m", "p", 1, calcular) == "resposta 1"
+    assert cache.obter_ou_calcular("m", "p", 1, calcular, renovar=True) == "resposta 2"
+    assert cache.obter_ou_calcular("m", "p", 1, calcular) == "resposta 2"
+    assert len(chamadas) == 2
+    assert cache.obter_ou_calcular("m", "vazio", 1, lambda: "") == ""
+    assert cache.obter(gerar_chave("m", "vazio", 1)) is None  # Respostas vazias não são guardadas.
+
+
+def test_single_flight_agrupa_chamadas_simultaneas(tmp_path):
+    cache = CacheRespostas(str(tmp_path / "respostas.sqlite3"))
+    liberar, chamadas, resultados = threading.Event(), [], []
+
+    def calcular():
+        chamadas.append(1)
+        liberar.wait(5)
+        return "texto"
+
+    threads = [threading.Thread(target=lambda: resultados.append(cache.obter_ou_calcular("m", "p", 1, calcular)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    while cache.agrupadas < 3 and all(thread.is_alive() for thread in threads):
+        threading.Event().wait(0.01)
+    liberar.set()
+    for thread in threads:
+        thread.join(5)
+    cache.fechar()
+    assert resultados == ["texto"] * 4 and len(chamadas) == 1
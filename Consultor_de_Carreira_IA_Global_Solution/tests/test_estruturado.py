@@ -0,0 +1,79 @@
+# --- Testes das Respostas Estruturadas (estruturado.py) ---
+# Cada caminho de leitura (json, json_reparado, objetos, regex, vazia) com respostas típicas de
+# um modelo fora do esquema; os testes rodam com o decodificador padrão e com o json da stdlib.
+import json  # Respostas de exemplo e decodificador alternativo.
+
+import pytest
+
+import estruturado
+from estruturado import CAMINHOS_LEITURA, converter_item, converter_resposta_json
+from tabela import SALARIO_MAXIMO
+
+CHAVE = 'salario_estimado_mensal'
+ITENS = [{'area': "Dados", 'curso': "Curso A", CHAVE: 12_500}, {'area': "UX/UI", 'curso': "Curso B", CHAVE: 8_000}]
+LISTA = json.dumps(ITENS, ensure_ascii=False)
+
+
+@pytest.fixture(params=["padrao", "stdlib"], autouse=True)
+def decodificador(request, monkeypatch):
+    if request.param == "stdlib":  # Sem orjson: mesmo comportamento com json.loads.
+        monkeypatch.setattr(estruturado, "_decodificar", json.loads)
+
+
+@pytest.mark.parametrize("texto,caminho,descartados", [
+    (LISTA, "json", 0),
+    (json.dumps({"profissoes": ITENS}), "json", 0),
+    (f"```json\n{LISTA[:-1]},\n]\n```", "json_reparado", 0),  # Cercas e vírgula sobrando.
+    (f"Claro! Aqui está a lista:\n{LISTA}\nEspero ter ajudado.", "json_reparado", 0),
+    (LISTA[:-1] + ', {"area": "Saúde", "curso": "Cur', "objetos", 0),  # Cortada no limite de tokens.
+    ("* Dados: Curso A: 12.500,00\n* UX/UI: Curso B: 8.000\nFim.", "regex", 1),
+])
+def test_caminhos_de_leitura(texto, caminho, descartados):
+    assert converter_resposta_json(texto) == (ITENS, caminho, descartados)
+    assert caminho in CAMINHOS_LEITURA
+
+
+@pytest.mark.parametrize("texto", ["", "   \n", "[]", "{}", "null", "Não sei responder."])
+def test_respostas_sem_linhas(texto):
+    linhas, caminho, _ = converter_resposta_json(texto)
+    assert linhas == [] and caminho in ("vazia", "regex")
+
+
+def test_objetos_invalidos_sao_contados():
+    itens = ITENS + [{'area': "", 'curso': "x", CHAVE: 1}, {'area': "Sem salário", 'curso': "x"}, "texto",
+                     {'area': "Bool", 'curso': "x", CHAVE: True}]
+    assert converter_resposta_json(json.dumps(itens)) == (ITENS, "json", 4)
+
+
+@pytest.mark.parametrize("salario,esperado", [
+    (12_500, 12_500), (12_500.9, 12_500), ("12.500,00", 12_500), ("R$ 8.000", 8_000), (0, 0),
+    (SALARIO_MAXIMO, SALARIO_MAXIMO),
+    (SALARIO_MAXIMO + 1, None), (1e30, None), (-1, None), (-1.5, None), ("R$ 99.999.999.999.999.999.999", None),
+    (float("nan"), None), (float("inf"), None), (None, None), ("a combinar", None), ([1], None),
+])
+def test_converter_item_limites_do_salario(salario, esperado):
+    linha = converter_item({'area': " Dados ", 'curso': " C ", CHAVE: salario})
+    if esperado is None:
+        assert linha is None
+    else:
+        assert linha == {'area': "Dados", 'curso': "C", CHAVE: esperado}
+
+
+@pytest.mark.parametrize("bruto", ["1e30", str(2 ** 63), str(2 ** 70), "-5"])
+def test_salarios_fora_do_int64_sao_descartados_em_todos_os_caminhos(bruto):
+    texto = LISTA[:-1] + ', {"area": "Grande", "curso": "x", "salario_estimado_mensal": ' + bruto + '}]'
+    linhas, _, descartados = converter_resposta_json(texto)
+    assert linhas == ITENS and descartados == 1
+    linhas, caminho, descartados = converter_resposta_json("* Grande: x: " + "9" * 25 + "\n* Dados: Curso A: 12.500")
+    assert (linhas, caminho, descartados) == (ITENS[:1], "regex", 1)
+
+
+def test_salario_com_digitos_demais_e_descartado():
+    enorme = "9" * 5000  # int() recusa textos com mais de 4300 dígitos (ValueError).
+    assert converter_item({'area': "Dados", 'curso': "C", CHAVE: enorme}) is None
+    assert converter_item({'area': "Dados", 'curso': "C", CHAVE: "R$ " + enorme + ",00"}) is None
+    texto = LISTA[:-1] + ', {"area": "Grande", "curso": "x", "salario_estimado_mensal": "' + enorme + '"}]'
+    assert converter_resposta_json(texto) == (ITENS, "json", 1)
+    texto = LISTA[:-1] + ', {"area": "Grande", "curso": "x", "salario_estimado_mensal": ' + enorme + '}]'
+    assert converter_resposta_json(texto) == (ITENS, "objetos", 1)
+    assert converter_resposta_json("* Grande: x: " + enorme + "\n* Dados: Curso A: 12.500") == (ITENS[:1], "regex", 1)
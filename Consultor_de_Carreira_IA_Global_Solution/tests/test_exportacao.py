@@ -0,0 +1,72 @@
+# --- Testes da Exportação (exportacao.py) ---
+# CSV e JSON Lines são lidos de volta com os módulos csv e json da biblioteca padrão, com textos
+# acentuados, vírgulas, aspas e quebras de linha; o JSON Lines é testado com e sem orjson.
+import csv  # Leitura do CSV exportado.
+import json  # Leitura do JSON Lines exportado.
+
+import pytest
+
+import exportacao
+from dados_sinteticos import gerar_linhas
+from exportacao import exportar, formato_do_caminho
+from tabela import COLUNAS, TabelaColunar
+
+CHAVE = 'salario_estimado_mensal'
+DIFICEIS = [
+    {'area': "Ciência de Dados", 'curso': 'Bacharelado em "Estatística", Matemática', CHAVE: 12_500},
+    {'area': "Saúde", 'curso': "Enfermagem; Obstetrícia\nResidência", CHAVE: 7_800},
+    {'area': "Engenharia", 'curso': "São Paulo, \"Poli\" — ação", CHAVE: 2 ** 63 - 1},
+    {'area': "", 'curso': "", CHAVE: 0},
+]
+
+
+def ler_csv(caminho):
+    with open(caminho, encoding="utf-8", newline="") as arquivo:
+        leitor = csv.reader(arquivo)
+        assert next(leitor) == list(COLUNAS)
+        return [{'area': area, 'curso': curso, CHAVE: int(salario)} for area, curso, salario in leitor]
+
+
+def ler_jsonl(caminho):
+    with open(caminho, encoding="utf-8") as arquivo:
+        return [json.loads(linha) for linha in arquivo]
+
+
+@pytest.mark.parametrize("entrada", [list, iter, TabelaColunar.de_linhas])
+def test_csv_ida_e_volta(tmp_path, entrada):
+    linhas = gerar_linhas(300) + DIFICEIS
+    caminho = tmp_path / "ranking.csv"
+    assert exportar(entrada(linhas), str(caminho)) == len(linhas)
+    assert ler_csv(caminho) == linhas
+
+
+@pytest.mark.parametrize("com_orjson", [True, False])
+@pytest.mark.parametrize("entrada", [list, iter, TabelaColunar.de_linhas])
+def test_jsonl_ida_e_volta(tmp_path, monkeypatch, entrada, com_orjson):
+    if com_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(exportacao, "orjson", None)
+    monkeypatch.setattr(exportacao, "LINHAS_POR_ESCRITA", 7)  # Vários blocos de escrita.
+    linhas = gerar_linhas(100) + DIFICEIS
+    caminho = tmp_path / "ranking.jsonl"
+    assert exportar(entrada(linhas), str(caminho)) == len(linhas)
+    assert ler_jsonl(caminho) == linhas
+    assert "Ciência" in caminho.read_text(encoding="utf-8")  # UTF-8 direto, sem escapes \u.
+
+
+def test_entrada_vazia(tmp_path):
+    assert exportar([], str(tmp_path / "vazio.csv")) == 0
+    assert ler_csv(tmp_path / "vazio.csv") == []
+    assert exportar(iter(()), str(tmp_path / "vazio.jsonl")) == 0
+    assert (tmp_path / "vazio.jsonl").read_bytes() == b""
+
+
+def test_formato_pela_extensao():
+    assert formato_do_caminho("saida/Ranking.CSV") == "csv"
+    assert formato_do_caminho("ranking.ndjson") == "jsonl"
+    assert formato_do_caminho("ranking.cct") == "bin"
+    with pytest.raises(ValueError, match="Extensão"):
+        formato_do_caminho("ranking.xlsx")
+    with pytest.raises(ValueError, match="desconhecido"):
+        exportar([], "ranking.csv", formato="xml")
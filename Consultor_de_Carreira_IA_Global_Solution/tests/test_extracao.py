@@ -0,0 +1,116 @@
+# --- Testes da Extração dos Tópicos (extracao.py) ---
+# A referência é o caminho original: dividir o texto em linhas e aplicar 'converter_linha' a cada
+# uma. O analisador incremental deve dar o mesmo resultado com qualquer divisão em pedaços, e a
+# ingestão em massa (mmap + finditer sobre o arquivo inteiro) o mesmo resultado por arquivo.
+import contextlib  # Silencia as mensagens do pipeline.
+import io  # Destino das mensagens silenciadas.
+import random  # Pontos de corte aleatórios dos pedaços.
+
+import pytest
+
+import main
+from dados_sinteticos import gerar_texto
+from extracao import AnalisadorIncremental, IngestaoEmMassa, converter_linha, linhas_do_fluxo
+from tabela import SALARIO_MAXIMO
+
+# Casos de borda escritos à mão: CRLF, recuo, salário sem parte inteira, texto após o salário.
+TEXTO_BORDAS = (
+    "Aqui está a lista:\r\n"
+    "* Tecnologia: Ciência de Dados: 12.500,00\r\n"
+    "   *   UX/UI :  Design de Interação :  8.000  \n"
+    "* Saúde: Enfermagem: ,50\n"
+    "* Saúde: Medicina: ...\n"
+    "* Direito: Direito Digital: 15.000 (sênior)\n"
+    "\n"
+    "* Artes: Música\n"
+    "* Sem quebra no final: Curso: 3.100"
+)
+
+
+def referencia(texto):
+    linhas = (converter_linha(linha.strip()) for linha in texto.split("\n") if linha.strip())
+    return [linha for linha in linhas if linha is not None]
+
+
+def em_pedacos(texto, gerador, maximo):
+    inicio = 0
+    while inicio < len(texto):
+        fim = inicio + gerador.randint(0, maximo)  # Pedaços vazios também chegam do streaming.
+        yield texto[inicio:fim]
+        inicio = fim
+
+
+def test_referencia_das_bordas():
+    assert [linha['salario_estimado_mensal'] for linha in referencia(TEXTO_BORDAS)] == [12500, 8000, 15000, 3100]
+    assert referencia(TEXTO_BORDAS)[1] == {'area': "UX/UI", 'curso': "Design de Interação",
+                                           'salario_estimado_mensal': 8000}
+
+
+@pytest.mark.parametrize("semente", range(5))
+@pytest.mark.parametrize("maximo", [1, 7, 64, 4096])
+def test_pedacos_aleatorios_como_converter_linha(semente, maximo):
+    texto = gerar_texto(400, fracao_malformadas=0.3, semente=semente) + "\n" + TEXTO_BORDAS
+    gerador = random.Random(semente)
+    assert list(linhas_do_fluxo(em_pedacos(texto, gerador, maximo))) == referencia(texto)
+
+
+def test_linhas_ignoradas_incluem_salarios_invalidos():
+    analisador = AnalisadorIncremental()
+    resultado = analisador.alimentar(TEXTO_BORDAS) + analisador.finalizar()
+    assert resultado == referencia(TEXTO_BORDAS)
+    assert [linha.strip() for linha in analisador.linhas_ignoradas] == [
+        "Aqui está a lista:", "* Saúde: Enfermagem: ,50", "* Saúde: Medicina: ...", "* Artes: Música"]
+
+
+def test_pedaco_sem_quebra_so_acumula():
+    analisador = AnalisadorIncremental()
+    assert analisador.alimentar("* Área: Curso: 1.") == []
+    assert analisador.alimentar("000") == []
+    assert analisador.alimentar("\n* Outra") == [{'area': "Área", 'curso': "Curso", 'salario_estimado_mensal': 1000}]
+    assert analisador.finalizar() == []
+    assert analisador.linhas_ignoradas == ["* Outra"]
+
+
+@pytest.mark.parametrize("semente", range(3))
+def test_ingestao_em_massa_como_converter_linha(semente, tmp_path):
+    textos = [gerar_texto(500, fracao_malformadas=0.3, semente=semente), TEXTO_BORDAS, "", "* Só: Texto: ,"]
+    caminhos = []
+    for i, texto in enumerate(textos):
+        caminho = tmp_path / f"resposta_{i}.txt"
+        caminho.write_bytes(texto.encode("utf-8"))
+        caminhos.append(str(caminho))
+    ingestao = IngestaoEmMassa()
+    assert list(ingestao.linhas(caminhos)) == [linha for texto in textos for linha in referencia(texto)]
+    assert ingestao.salarios_invalidos == 3  # ',50', '...' e ','.
+    assert ingestao.topicos_extraidos == sum(len(referencia(texto)) for texto in textos)
+
+
+def test_topicos_do_buffer_e_cache_de_textos(monkeypatch):
+    monkeypatch.setattr("extracao.MAX_TEXTOS_EM_CACHE", 4)
+    texto = gerar_texto(300, semente=9)
+    ingestao = IngestaoEmMassa()
+    obtido = [dict(zip(('area', 'curso', 'salario_estimado_mensal'), topico))
+              for topico in ingestao.topicos_do_buffer(memoryview(texto.encode("utf-8")))]
+    assert obtido == referencia(texto)
+    assert len(ingestao._textos) <= 4 and ingestao.bytes_lidos == len(texto.encode("utf-8"))
+
+
+def test_salario_acima_do_int64_e_descartado_em_todos_os_parsers(tmp_path):
+    texto = f"* Gigante: Curso: 99.999.999.999.999.999.999\n* Limite: Curso: {SALARIO_MAXIMO}\n* Dados: Curso: 12.500"
+    esperado = [{'area': "Limite", 'curso': "Curso", 'salario_estimado_mensal': SALARIO_MAXIMO},
+                {'area': "Dados", 'curso': "Curso", 'salario_estimado_mensal': 12_500}]
+    assert referencia(texto) == esperado
+    analisador = AnalisadorIncremental()
+    assert list(linhas_do_fluxo([texto], analisador)) == esperado
+    assert analisador.linhas_ignoradas == ["* Gigante: Curso: 99.999.999.999.999.999.999"]
+
+    caminho = tmp_path / "respostas.txt"
+    caminho.write_text(texto, encoding="utf-8")
+    ingestao = IngestaoEmMassa()
+    assert list(ingestao.linhas([str(caminho)])) == esperado
+    assert ingestao.salarios_invalidos == 1
+
+    with contextlib.redirect_stdout(io.StringIO()):  # Antes: OverflowError em TabelaColunar.adicionar.
+        assert list(main.coletar_dados_de_arquivos([str(caminho)], colunar=True)) == esperado
+        assert list(main.coletar_dados_da_api(texto, colunar=True)) == esperado
+        assert list(main.coletar_dados_da_api_stream(iter([texto]), colunar=True)) == esperado
@@ -0,0 +1,176 @@
+# --- Testes da Instrumentação (instrumentacao.py) ---
+# Desligada, a instrumentação não pode registrar nada nem cronometrar; ligada, os relatórios em
+# JSON e no formato de texto do Prometheus devem ser válidos (nomes de métricas, rótulos, tipos).
+import contextlib  # Silencia as mensagens do pipeline.
+import io  # Destino das mensagens silenciadas.
+import json  # Leitura do relatório exportado.
+import pathlib  # Código-fonte dos módulos (nomes de contadores).
+import re  # Gramática do formato de texto do Prometheus.
+
+import pytest
+
+import instrumentacao
+import main
+from dados_sinteticos import gerar_texto
+from estruturado import CAMINHOS_LEITURA
+from instrumentacao import PREFIXO_PROMETHEUS, Metricas, medir, metricas
+
+NOME_METRICA = re.compile(r"[a-zA-Z_:][a-zA-Z0-9_:]*")
+ROTULOS = r'\{(?:[a-zA-Z_][a-zA-Z0-9_]*="(?:[^"\\\n]|\\.)*",?)*\}'
+AMOSTRA = re.compile(rf"(?P<nome>{NOME_METRICA.pattern})(?P<rotulos>{ROTULOS})? (?P<valor>\S+)")
+COMENTARIO = re.compile(rf"# (?:HELP (?P<ajuda>{NOME_METRICA.pattern}) .+|TYPE (?P<tipo>{NOME_METRICA.pattern}) "
+                        r"(?P<categoria>counter|gauge|summary|histogram|untyped))")
+SUFIXOS_SUMMARY = ("_sum", "_count")
+
+
+@pytest.fixture
+def ativas():
+    """ Liga a instância do processo e a desliga (limpa) ao final do teste. """
+    metricas.ativar()
+    yield metricas
+    metricas.ativo = False
+    metricas.etapas.clear()
+    metricas.contadores.clear()
+
+
+def validar_prometheus(texto):
+    """ Confere cada linha e devolve {métrica: (tipo, [amostras])}. """
+    assert texto.endswith("\n")
+    declaradas = {}
+    for linha in texto.splitlines():
+        if linha.startswith("#"):
+            comentario = COMENTARIO.fullmatch(linha)
+            assert comentario, linha
+            if comentario["tipo"]:
+                assert comentario["tipo"] not in declaradas, f"TYPE repetido: {linha}"
+                declaradas[comentario["tipo"]] = (comentario["categoria"], [])
+            continue
+        amostra = AMOSTRA.fullmatch(linha)
+        assert amostra, linha
+        float(amostra["valor"])
+        nome = amostra["nome"]
+        base = next((nome[:-len(s)] for s in SUFIXOS_SUMMARY if nome.endswith(s) and nome[:-len(s)] in declaradas),
+                    nome)
+        assert base in declaradas, f"amostra sem TYPE: {linha}"
+        declaradas[base][1].append(amostra.groupdict())
+    return declaradas
+
+
+def test_desligada_nao_registra_nem_cronometra(monkeypatch):
+    assert Metricas().ativo is False and metricas.ativo is False
+
+    def proibido(*args):
+        raise AssertionError("cronometrou com a instrumentação desligada")
+
+    monkeypatch.setattr(instrumentacao.time, "perf_counter", proibido)
+    monkeypatch.setattr(instrumentacao, "_Etapa", proibido)
+
+    @medir("etapa_teste")
+    def dobrar(valor):
+        return valor * 2
+
+    assert dobrar(21) == 42
+    with metricas.etapa("bloco") as contexto:
+        metricas.contar("linhas_convertidas", 10)
+    assert contexto is instrumentacao._ETAPA_INATIVA  # O mesmo contexto vazio em toda chamada.
+    assert metricas.etapa("outro") is contexto
+    assert metricas.etapas == {} and metricas.contadores == {}
+
+
+def test_desligada_no_pipeline(monkeypatch):
+    monkeypatch.setattr(instrumentacao.time, "perf_counter", lambda: pytest.fail("cronometrou"))
+    with contextlib.redirect_stdout(io.StringIO()):
+        dados = main.coletar_dados_da_api(gerar_texto(50, fracao_malformadas=0.3))
+        main.organizar_dados(dados, 'salario_estimado_mensal')
+        main.mostrar_dados(dados, limite=5)
+    assert metricas.etapas == {} and metricas.contadores == {}
+
+
+def test_medir_preserva_a_funcao(ativas):
+    @medir("soma")
+    def somar(a, b=1):
+        """ Soma. """
+        return a + b
+
+    assert somar(2, b=3) == 5 and somar(1) == 2
+    assert somar.__name__ == "somar" and somar.__doc__ == " Soma. "
+    with pytest.raises(TypeError):
+        somar()
+    assert ativas.etapas["soma"][0] == 3  # A chamada que falhou também foi cronometrada.
+
+
+def test_relatorio_json(ativas, tmp_path):
+    for segundos in (0.5, 0.1, 0.3):
+        ativas.registrar_tempo("organização", segundos)
+    ativas.contar("linhas_convertidas", 40)
+    ativas.contar("linhas_convertidas", 2)
+    ativas.contar("api_hedges")
+
+    caminho = tmp_path / "metricas.json"
+    ativas.exportar_json(str(caminho))
+    relatorio = json.loads(caminho.read_text(encoding="utf-8"))
+    assert "organização" in caminho.read_text(encoding="utf-8")  # UTF-8 direto, sem escapes.
+    assert set(relatorio) == {"duracao_total_s", "etapas", "contadores"}
+    assert relatorio["duracao_total_s"] >= 0
+    assert relatorio["etapas"]["organização"] == pytest.approx(
+        {"execucoes": 3, "total_s": 0.9, "media_s": 0.3, "minimo_s": 0.1, "maximo_s": 0.5})
+    assert relatorio["contadores"] == {"linhas_convertidas": 42, "api_hedges": 1}
+
+
+def test_prometheus_bem_formado(ativas, tmp_path):
+    ativas.registrar_tempo("organizar_dados", 0.25)
+    ativas.registrar_tempo("organizar_dados", 0.75)
+    ativas.registrar_tempo('etapa "estranha"\\ com\nquebra', 0.1)
+    ativas.contar("linhas_convertidas", 42)
+    ativas.contar("api_novas_tentativas", 3)
+
+    caminho = tmp_path / "metricas.prom"
+    ativas.exportar_prometheus(str(caminho))
+    metricas_prom = validar_prometheus(caminho.read_text(encoding="utf-8"))
+
+    p = PREFIXO_PROMETHEUS
+    assert metricas_prom[f"{p}_execucao_segundos"][0] == "gauge"
+    tipo, amostras = metricas_prom[f"{p}_etapa_segundos"]
+    assert tipo == "summary"
+    por_etapa = {(a["nome"], a["rotulos"]): float(a["valor"]) for a in amostras}
+    assert por_etapa[(f"{p}_etapa_segundos_sum", '{etapa="organizar_dados"}')] == pytest.approx(1.0)
+    assert por_etapa[(f"{p}_etapa_segundos_count", '{etapa="organizar_dados"}')] == 2
+    assert (f"{p}_etapa_segundos_count", r'{etapa="etapa \"estranha\"\\ com\nquebra"}') in por_etapa
+    assert metricas_prom[f"{p}_linhas_convertidas_total"] == ("counter", [
+        {"nome": f"{p}_linhas_convertidas_total", "rotulos": None, "valor": "42"}])
+    assert metricas_prom[f"{p}_api_novas_tentativas_total"][0] == "counter"
+
+
+def test_prometheus_sem_registros():
+    metricas_prom = validar_prometheus(Metricas().texto_prometheus())
+    assert set(metricas_prom) == {f"{PREFIXO_PROMETHEUS}_execucao_segundos", f"{PREFIXO_PROMETHEUS}_etapa_segundos"}
+
+
+def nomes_de_contadores_no_codigo():
+    """ Nomes literais passados a 'metricas.contar' nos módulos do projeto. """
+    pasta = pathlib.Path(main.__file__).parent
+    nomes = set()
+    for arquivo in pasta.glob("*.py"):
+        nomes.update(re.findall(r'metricas\.contar\(\s*"([^"]+)"', arquivo.read_text(encoding="utf-8")))
+    return nomes
+
+
+def test_nomes_das_metricas_do_programa(ativas):
+    with contextlib.redirect_stdout(io.StringIO()):
+        dados = main.coletar_dados_da_api(gerar_texto(200, fracao_malformadas=0.3))
+        main.organizar_dados(dados, 'salario_estimado_mensal')
+        main.organizar_top_k(dados, 'salario_estimado_mensal', 10)
+        main.mostrar_dados(dados, limite=5)
+        main.coletar_dados_estruturados('[{"area": "Dados", "curso": "Estatística", "salario": 9000}]')
+    for caminho in CAMINHOS_LEITURA:  # 'respostas_<caminho>' (coletar_dados_estruturados).
+        ativas.contar(f"respostas_{caminho}")
+    for nome in nomes_de_contadores_no_codigo():
+        ativas.contar(nome)
+    assert {"linhas_convertidas", "ordenacao_comparacoes", "api_prazos_esgotados"} <= set(ativas.contadores)
+    assert {"coletar_dados_da_api", "organizar_dados", "organizar_top_k", "mostrar_dados"} <= set(ativas.etapas)
+
+    metricas_prom = validar_prometheus(ativas.texto_prometheus())
+    for nome, (_, amostras) in metricas_prom.items():
+        assert NOME_METRICA.fullmatch(nome)
+        assert all(NOME_METRICA.fullmatch(amostra["nome"]) for amostra in amostras)
+    assert len(metricas_prom) == 2 + len(ativas.contadores)
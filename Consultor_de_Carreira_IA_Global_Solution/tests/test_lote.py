@@ -0,0 +1,232 @@
+# --- Testes do Modo Lote contra o Servidor Falso ---
+# Executa 'main.executar_modo_lote' de ponta a ponta contra 'servidor_falso.py' (em uma thread, porta
+# livre): BackendResiliente.gerar_async -> executar_lote (semáforo, balde de fichas, tentativas,
+# checkpoint) -> coletar_dados_da_api -> organizar_dados. O SDK do Google não está disponível em
+# todo ambiente, então o backend HTTP aqui é um cliente mínimo da biblioteca padrão (urllib) que
+# fala o mesmo protocolo REST; com o SDK instalado, o último teste roda 'main.py --lote --base-url'.
+import argparse  # Opções do modo lote (mesmos nomes da linha de comando).
+import contextlib  # Silencia as mensagens do pipeline.
+import io  # Destino das mensagens silenciadas.
+import json  # Corpo das requisições e leitura do checkpoint.
+import os  # Ambiente do subprocesso.
+import subprocess  # Execução de 'main.py --lote' com o SDK real.
+import sys  # Interpretador do subprocesso.
+import threading  # Servidor falso em segundo plano e contagem de requisições simultâneas.
+import time  # Horário de cada requisição (limite de taxa).
+import urllib.error  # Erros HTTP (429/5xx) vistos pelo cliente.
+import urllib.request  # Cliente HTTP mínimo.
+from http.server import ThreadingHTTPServer  # Servidor instrumentado.
+
+import pytest
+
+import lote
+import main
+from backends import BackendIA
+from lote import carregar_concluidos
+from resiliencia import BackendResiliente, Disjuntor
+from servidor_falso import ManipuladorGemini
+from taxonomia import Taxonomia
+
+CHAVE = 'salario_estimado_mensal'
+PERFIS = [("Exatas", "Tecnologia", f"Nicho {i}") for i in range(5)] + [("Artes", "Design", "UX/UI")]
+
+
+class Registro:
+    """ O que o servidor viu: horário de cada requisição e pico de requisições simultâneas. """
+
+    def __init__(self, codigos=(), latencia=0.0, linhas=5):
+        self.codigos = list(codigos)  # Respostas de erro roteirizadas, em ordem.
+        self.latencia = latencia
+        self.linhas = linhas
+        self.horarios = []
+        self.em_andamento = 0
+        self.pico = 0
+        self.trava = threading.Lock()
+
+
+def criar_servidor_instrumentado(registro):
+    """ Servidor falso que registra as requisições e responde as primeiras com os códigos roteirizados. """
+
+    class ManipuladorInstrumentado(ManipuladorGemini):
+        latencia = registro.latencia
+        linhas = registro.linhas
+
+        def do_POST(self):
+            with registro.trava:
+                registro.horarios.append(time.monotonic())
+                registro.em_andamento += 1
+                registro.pico = max(registro.pico, registro.em_andamento)
+                codigo = registro.codigos.pop(0) if registro.codigos else None
+            try:
+                if codigo is None:
+                    return super().do_POST()
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                self._responder(codigo, {"error": {"code": codigo, "message": "Falha roteirizada."}})
+            finally:
+                with registro.trava:
+                    registro.em_andamento -= 1
+
+    return ThreadingHTTPServer(("127.0.0.1", 0), ManipuladorInstrumentado)
+
+
+@contextlib.contextmanager
+def servidor_em_thread(servidor):
+    """ Executa o servidor em uma thread e retorna a URL base (como em --base-url). """
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, porta = servidor.server_address[:2]
+        yield f"http://{host}:{porta}"
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+
+
+class BackendHttp(BackendIA):
+    """ Cliente REST mínimo de 'generateContent' (o que o BackendGemini faz com --base-url). """
+    nome = "http"
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+
+    def gerar(self, prompt, modelo, esquema=None):
+        corpo = {"contents": [{"role": "user", "parts": [{"text": prompt}]}]}
+        if esquema is not None:
+            corpo["generationConfig"] = {"responseMimeType": "application/json"}
+        requisicao = urllib.request.Request(f"{self.base_url}/v1beta/models/{modelo}:generateContent",
+                                            json.dumps(corpo).encode("utf-8"), {"Content-Type": "application/json"})
+        with urllib.request.urlopen(requisicao, timeout=10) as resposta:
+            dados = json.load(resposta)
+        return dados["candidates"][0]["content"]["parts"][0]["text"]
+
+
+@pytest.fixture(autouse=True)
+def programa(monkeypatch):
+    """ Estado global do programa como no modo lote, com a taxonomia dos PERFIS e sem esperas reais. """
+    monkeypatch.setattr(main, "backend", None)  # Preenchido por 'executar'; restaurado ao final do teste.
+    monkeypatch.setattr(main, "taxonomia", Taxonomia.de_caminhos(PERFIS))
+    monkeypatch.setattr(main, "cache_respostas", None)
+    monkeypatch.setattr(main, "indice_areas", None)
+    monkeypatch.setattr(main, "renovar_cache", False)
+    monkeypatch.setattr(lote.random, "uniform", lambda inicio, fim: 0.0)  # Jitter das novas tentativas.
+
+
+def executar(url, saida, subconjunto=None, estruturado=False, **opcoes):
+    """ 'main.executar_modo_lote' com as opções de linha de comando (padrões de main.py). """
+    main.backend = BackendResiliente(BackendHttp(url), prazo=10.0, tentativas=1, disjuntor=Disjuntor(100))
+    padrao = {"concorrencia": 8, "taxa": None, "tentativas": 5}
+    argumentos = argparse.Namespace(saida=str(saida), subconjunto=subconjunto, estruturado=estruturado,
+                                    **{**padrao, **opcoes})
+    saida_texto = io.StringIO()
+    with contextlib.redirect_stdout(saida_texto):
+        resumo = main.executar_modo_lote(argumentos)
+    return resumo, saida_texto.getvalue()
+
+
+def ler_saida(caminho):
+    registros = []
+    with open(caminho, encoding="utf-8") as arquivo:
+        for linha in arquivo:
+            with contextlib.suppress(ValueError):
+                registros.append(json.loads(linha))
+    return registros
+
+
+def test_lote_completo_respeita_semaforo(tmp_path):
+    saida = tmp_path / "lote.jsonl"
+    registro = Registro(latencia=0.1, linhas=10)
+    with servidor_em_thread(criar_servidor_instrumentado(registro)) as url:
+        resumo, _ = executar(url, saida, concorrencia=2)
+
+    assert resumo == {"total": 6, "pulados": 0, "concluidos": 6, "falhas": 0}
+    assert registro.pico == 2 and len(registro.horarios) == 6
+    registros = ler_saida(saida)
+    assert sorted(tuple(r["perfil"]) for r in registros) == sorted(PERFIS)
+    for item in registros:
+        salarios = [linha[CHAVE] for linha in item["linhas"]]
+        assert len(salarios) == 10 and salarios == sorted(salarios, reverse=True)
+
+
+def test_limitador_de_taxa(tmp_path):
+    registro = Registro()
+    with servidor_em_thread(criar_servidor_instrumentado(registro)) as url:
+        resumo, _ = executar(url, tmp_path / "lote.jsonl", concorrencia=8, taxa=4.0)
+
+    # Rajada inicial de 4 fichas (capacidade = taxa); as outras 2 saem a 4 por segundo.
+    assert resumo["concluidos"] == 6
+    inicio = registro.horarios[0]
+    assert sum(horario - inicio < 0.2 for horario in registro.horarios) <= 4
+    assert registro.horarios[-1] - inicio >= 0.45
+
+
+def test_retomada_pelo_checkpoint(tmp_path):
+    saida = tmp_path / "lote.jsonl"
+    registro = Registro()
+    with servidor_em_thread(criar_servidor_instrumentado(registro)) as url:
+        executar(url, saida, subconjunto=['["Artes", "Design", "UX/UI"]', "Exatas > Tecnologia > Nicho 0"])
+        with open(saida, "a", encoding="utf-8") as arquivo:  # Interrupção no meio de uma gravação.
+            arquivo.write('{"perfil": ["Exatas", "Tec')
+        assert len(registro.horarios) == 2
+        resumo, _ = executar(url, saida)
+
+    assert len(registro.horarios) == 6  # Só os 4 perfis que faltavam foram pedidos à API.
+    assert resumo == {"total": 6, "pulados": 2, "concluidos": 4, "falhas": 0}
+    assert carregar_concluidos(saida) == set(PERFIS)
+    assert len(ler_saida(saida)) == 6
+
+
+@pytest.mark.parametrize("codigos", [(429, 429), (503, 500, 502)])
+def test_novas_tentativas_em_erros_temporarios(tmp_path, codigos):
+    saida = tmp_path / "lote.jsonl"
+    registro = Registro(codigos)
+    with servidor_em_thread(criar_servidor_instrumentado(registro)) as url:
+        resumo, _ = executar(url, saida, subconjunto=["Artes"], tentativas=5)
+
+    assert resumo["concluidos"] == 1
+    assert len(registro.horarios) == len(codigos) + 1
+    assert carregar_concluidos(saida) == {PERFIS[-1]}
+
+
+def test_erro_permanente_nao_repete(tmp_path):
+    saida = tmp_path / "lote.jsonl"
+    registro = Registro((400,))
+    with servidor_em_thread(criar_servidor_instrumentado(registro)) as url:
+        resumo, mensagens = executar(url, saida, subconjunto=["Artes"], tentativas=5)
+
+    assert resumo["falhas"] == 1 and len(registro.horarios) == 1
+    assert "❌ HTTP Error 400" in mensagens
+    assert carregar_concluidos(saida) == set()
+
+
+def test_resposta_sem_topicos_nao_entra_no_checkpoint(tmp_path):
+    saida = tmp_path / "lote.jsonl"
+    registro = Registro(linhas=0)
+    with servidor_em_thread(criar_servidor_instrumentado(registro)) as url:
+        resumo, _ = executar(url, saida, subconjunto=["Artes"], tentativas=3)
+        assert resumo["falhas"] == 1 and len(registro.horarios) == 3
+        assert carregar_concluidos(saida) == set()
+
+        executar(url, saida, subconjunto=["Artes"], tentativas=1)  # Na retomada, o perfil é tentado de novo.
+        assert len(registro.horarios) == 4
+
+
+def test_lote_estruturado(tmp_path):
+    saida = tmp_path / "lote.jsonl"
+    with servidor_em_thread(criar_servidor_instrumentado(Registro())) as url:
+        resumo, _ = executar(url, saida, subconjunto=["Exatas"], estruturado=True)
+    assert resumo["concluidos"] == 5
+    assert all(len(item["linhas"]) == 5 for item in ler_saida(saida))
+
+
+def test_main_lote_com_base_url(tmp_path):
+    """ Linha de comando real: 'main.py --lote --base-url' com o SDK do Google (pulado sem ele). """
+    pytest.importorskip("google.genai")
+    registro = Registro(codigos=(429,))
+    saida = tmp_path / "lote.jsonl"
+    ambiente = {**os.environ, "GOOGLE_API_KEY": "falsa", "HOME": str(tmp_path)}
+    with servidor_em_thread(criar_servidor_instrumentado(registro)) as url:
+        comando = [sys.executable, main.__file__, "--lote", "--base-url", url, "--saida", str(saida),
+                   "--subconjunto", "Exatas > Engenharia", "--concorrencia", "2", "--sem-cache", "--sem-agregacao"]
+        subprocess.run(comando, env=ambiente, check=True, capture_output=True, timeout=120)
+    assert len(carregar_concluidos(saida)) == 5
+    assert registro.pico <= 2 and len(registro.horarios) == 6
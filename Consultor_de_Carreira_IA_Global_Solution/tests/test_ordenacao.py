@@ -0,0 +1,59 @@
+# --- Testes do Mergesort Iterativo (ordenacao.py) ---
+# Compara 'ordenar' com o sorted() nativo (estável) nas distribuições dos benchmarks,
+# com várias chaves, sentidos mistos e entradas de uso único (geradores).
+import random  # Empates entre chaves secundárias.
+from operator import itemgetter  # Chaves do sorted() de referência.
+
+import pytest
+
+from dados_sinteticos import DISTRIBUICOES, gerar_linhas
+from ordenacao import ordenar
+
+CHAVE = 'salario_estimado_mensal'
+
+
+def referencia(itens, campos, decrescente):
+    """ sorted() estável aplicado da última chave para a primeira (cada passada preserva a anterior). """
+    resultado = list(itens)
+    for campo, desc in reversed(list(zip(campos, decrescente))):
+        resultado = sorted(resultado, key=itemgetter(campo), reverse=desc)
+    return resultado
+
+
+@pytest.mark.parametrize("distribuicao", DISTRIBUICOES)
+@pytest.mark.parametrize("n", [0, 1, 2, 31, 33, 1000])
+def test_uma_chave_como_sorted(distribuicao, n):
+    linhas = gerar_linhas(n, distribuicao)
+    assert ordenar(linhas, CHAVE) == sorted(linhas, key=itemgetter(CHAVE), reverse=True)
+    assert ordenar(linhas, CHAVE, decrescente=False) == sorted(linhas, key=itemgetter(CHAVE))
+
+
+@pytest.mark.parametrize("decrescente", [(True, False), (False, True), (True, True), (False, False)])
+def test_varias_chaves_e_sentidos_mistos(decrescente):
+    gerador = random.Random(7)
+    linhas = [{'area': f"Área {gerador.randrange(20)}", 'curso': "c", CHAVE: gerador.choice((3_000, 5_000, 8_000))}
+              for _ in range(2000)]
+    campos = (CHAVE, 'area')
+    assert ordenar(linhas, campos, decrescente) == referencia(linhas, campos, decrescente)
+
+
+def test_estavel_entre_chaves_iguais():
+    linhas = gerar_linhas(500, "iguais")
+    ordenadas = ordenar(linhas, CHAVE)
+    posicao = {id(linha): i for i, linha in enumerate(linhas)}
+    for anterior, atual in zip(ordenadas, ordenadas[1:]):
+        if anterior[CHAVE] == atual[CHAVE]:
+            assert posicao[id(anterior)] < posicao[id(atual)]
+
+
+def test_aceita_gerador_de_uso_unico():
+    linhas = gerar_linhas(300)
+    assert ordenar(iter(linhas), CHAVE) == sorted(linhas, key=itemgetter(CHAVE), reverse=True)
+    assert ordenar((linha for linha in linhas), CHAVE) == sorted(linhas, key=itemgetter(CHAVE), reverse=True)
+
+
+def test_nao_altera_a_entrada():
+    linhas = gerar_linhas(200)
+    copia = list(linhas)
+    ordenar(linhas, CHAVE)
+    assert linhas == copia
@@ -0,0 +1,57 @@
+# --- Testes da Ordenação Externa (ordenacao_externa.py) ---
+# Orçamentos de memória pequenos forçam vários runs em disco (e mesclagens intermediárias);
+# o resultado deve ser idêntico ao sorted() estável.
+from operator import itemgetter  # Chave do sorted() de referência.
+
+import pytest
+
+import ordenacao_externa
+from dados_sinteticos import DISTRIBUICOES, gerar_linhas
+from ordenacao_externa import ordenar_externo
+
+CHAVE = 'salario_estimado_mensal'
+
+
+@pytest.mark.parametrize("distribuicao", DISTRIBUICOES)
+def test_varios_runs_como_sorted(distribuicao, tmp_path):
+    linhas = gerar_linhas(5000, distribuicao)
+    obtido = list(ordenar_externo(iter(linhas), CHAVE, memoria_max_mb=0.05, diretorio_temp=tmp_path))
+    assert obtido == sorted(linhas, key=itemgetter(CHAVE), reverse=True)
+    assert list(tmp_path.iterdir()) == []  # Runs temporários apagados ao final.
+
+
+def test_mesclagens_intermediarias(monkeypatch, tmp_path):
+    monkeypatch.setattr(ordenacao_externa, "MAX_RUNS_ABERTOS", 3)
+    linhas = gerar_linhas(3000)
+    obtido = list(ordenar_externo(linhas, (CHAVE, 'area'), (False, True), memoria_max_mb=0.02,
+                                  diretorio_temp=tmp_path))
+    esperado = sorted(sorted(linhas, key=itemgetter('area'), reverse=True), key=itemgetter(CHAVE))
+    assert obtido == esperado
+
+
+def test_entrada_pequena_sem_disco(tmp_path):
+    linhas = gerar_linhas(50)
+    assert list(ordenar_externo(linhas, CHAVE, diretorio_temp=tmp_path)) == \
+        sorted(linhas, key=itemgetter(CHAVE), reverse=True)
+    assert list(ordenar_externo([], CHAVE)) == []
+
+
+def test_linhas_que_crescem_respeitam_o_orcamento(monkeypatch, tmp_path):
+    """ O tamanho dos runs segue a média das linhas, não só a primeira (curta). """
+    blocos = []
+    original = ordenacao_externa._gravar_run
+    monkeypatch.setattr(ordenacao_externa, "_gravar_run",
+                        lambda caminho, colunas, linhas, lote: blocos.append(len(linhas)) or
+                        original(caminho, colunas, linhas, lote))
+    linhas = [{'area': "a" * (1 if i == 0 else 2000), CHAVE: i % 97} for i in range(2000)]
+    obtido = list(ordenar_externo(linhas, CHAVE, memoria_max_mb=0.5, diretorio_temp=tmp_path))
+    assert obtido == sorted(linhas, key=itemgetter(CHAVE), reverse=True)
+    orcamento_linhas = 0.5 * 1024 * 1024 // ordenacao_externa._bytes_por_linha(linhas[1])
+    assert len(blocos) > 1 and max(blocos) <= 2 * orcamento_linhas
+
+
+@pytest.mark.parametrize("ruim", [{CHAVE: 1}, {'area': "x", 'curso': "y", 'extra': 0, CHAVE: 1}])
+def test_colunas_diferentes_levantam_erro(ruim, tmp_path):
+    linhas = gerar_linhas(100) + [ruim] + gerar_linhas(100)
+    with pytest.raises(ValueError, match="linha 101"):
+        list(ordenar_externo(linhas, CHAVE, memoria_max_mb=0.01, diretorio_temp=tmp_path))
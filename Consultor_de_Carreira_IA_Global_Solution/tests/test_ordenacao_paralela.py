@@ -0,0 +1,44 @@
+# --- Testes da Ordenação Paralela (ordenacao_paralela.py) ---
+# 'limiar=0' força o caminho com processos mesmo em entradas pequenas; o resultado deve ser
+# idêntico ao sorted() estável (a mesclagem k-way desempata pela partição de origem).
+import random  # Chaves secundárias com empates e chaves de tipos variados.
+from operator import itemgetter  # Chaves do sorted() de referência.
+
+import pytest
+
+from dados_sinteticos import DISTRIBUICOES, gerar_linhas
+from ordenacao_paralela import _compactar, ordenar_paralelo
+
+CHAVE = 'salario_estimado_mensal'
+
+
+@pytest.mark.parametrize("distribuicao", DISTRIBUICOES)
+def test_processos_como_sorted(distribuicao):
+    linhas = gerar_linhas(3001, distribuicao)  # Partições de tamanhos diferentes.
+    assert ordenar_paralelo(linhas, CHAVE, processos=2, limiar=0) == \
+        sorted(linhas, key=itemgetter(CHAVE), reverse=True)
+
+
+def test_varias_chaves_mantem_estabilidade():
+    gerador = random.Random(3)
+    linhas = [{'area': f"Área {gerador.randrange(5)}", 'curso': str(i), CHAVE: gerador.choice((1, 2, 3))}
+              for i in range(2000)]
+    esperado = sorted(sorted(linhas, key=itemgetter('area')), key=itemgetter(CHAVE), reverse=True)
+    assert ordenar_paralelo(linhas, (CHAVE, 'area'), (True, False), processos=3, limiar=0) == esperado
+
+
+def test_caminho_serial_e_entradas_pequenas():
+    linhas = gerar_linhas(100)
+    esperado = sorted(linhas, key=itemgetter(CHAVE), reverse=True)
+    assert ordenar_paralelo(iter(linhas), CHAVE, processos=1) == esperado
+    assert ordenar_paralelo(linhas, CHAVE) == esperado  # Abaixo do limiar padrão.
+    assert ordenar_paralelo([], CHAVE, processos=2, limiar=0) == []
+    assert ordenar_paralelo(linhas[:1], CHAVE, processos=2, limiar=0) == linhas[:1]
+
+
+def test_compactar_recusa_o_que_array_nao_representa():
+    assert _compactar([1, 2, 3]).typecode == "q"
+    assert _compactar([1.5, 2.0]).typecode == "d"
+    assert _compactar([2 ** 63, 1]) == [2 ** 63, 1]  # Excede int64: mantém a lista.
+    assert _compactar([1, 2.5]) == [1, 2.5]  # Tipos mistos.
+    assert _compactar([("a", 1)]) == [("a", 1)]
@@ -0,0 +1,87 @@
+# --- Testes da Renderização da Tabela (relatorio.py) ---
+# Larguras, abreviação das linhas que não cabem na amostra de um gerador (lido uma única vez)
+# e paginação, inclusive a interrupção no fim de uma página sem ler o resto da entrada.
+import io  # Saída em memória.
+
+import pytest
+
+from dados_sinteticos import gerar_linhas
+from relatorio import CABECALHOS, SEPARADOR, renderizar_tabela
+from tabela import TabelaColunar
+
+CHAVE = 'salario_estimado_mensal'
+
+
+class Entrada:
+    """ Gerador de uso único que conta quantas linhas foram lidas. """
+
+    def __init__(self, linhas):
+        self.linhas = linhas
+        self.lidas = 0
+
+    def __iter__(self):
+        for linha in self.linhas:
+            self.lidas += 1
+            yield linha
+
+
+def renderizar(dados, **opcoes):
+    saida = io.StringIO()
+    escritas = renderizar_tabela(dados, saida=saida, **opcoes)
+    return escritas, saida.getvalue().splitlines()
+
+
+def celulas(linha):
+    return [celula.strip() for celula in linha.split(SEPARADOR)]
+
+
+@pytest.mark.parametrize("entrada", [list, TabelaColunar.de_linhas])
+def test_lista_medida_por_inteiro(entrada):
+    linhas = gerar_linhas(50) + [{'area': "Área com um nome bem mais comprido", 'curso': "C", CHAVE: 1_234_567}]
+    escritas, texto = renderizar(entrada(linhas))
+
+    assert escritas == len(linhas) and len(texto) == len(linhas) + 2
+    assert celulas(texto[0]) == list(CABECALHOS) and set(texto[1]) == {"-"}
+    assert len({len(linha) for linha in texto}) == 1  # Todas as linhas com a mesma largura.
+    assert celulas(texto[-1]) == ["Área com um nome bem mais comprido", "C", "1,234,567"]
+    assert [celulas(linha)[0] for linha in texto[2:]] == [linha['area'] for linha in linhas]
+
+
+def test_gerador_medido_pela_amostra_e_lido_uma_vez():
+    linhas = [{'area': f"A{i}", 'curso': "Curso", CHAVE: 1_000 + i} for i in range(20)]
+    linhas.append({'area': "Uma área longa demais para a amostra", 'curso': "Curso", CHAVE: 9})
+    entrada = Entrada(linhas)
+    escritas, texto = renderizar(iter(entrada), amostra=5)
+
+    assert escritas == len(linhas) and entrada.lidas == len(linhas)
+    largura_area = len(texto[0].split(SEPARADOR)[0])
+    assert largura_area == len(CABECALHOS[0])  # A amostra não tinha nada maior que o cabeçalho.
+    assert celulas(texto[-1])[0] == "Uma área longa demais para a amostra"[:largura_area - 1] + "…"
+    assert [celulas(linha)[0] for linha in texto[2:-1]] == [f"A{i}" for i in range(20)]
+
+
+def test_entrada_vazia():
+    assert renderizar([]) == (0, [])
+    assert renderizar(iter(())) == (0, [])
+
+
+def test_paginacao_repete_o_cabecalho():
+    perguntas = []
+    escritas, texto = renderizar(gerar_linhas(25), por_pagina=10, continuar=lambda: perguntas.append(1) or True)
+    assert escritas == 25 and len(perguntas) == 2
+    assert sum(celulas(linha) == list(CABECALHOS) for linha in texto) == 3
+    assert len(texto) == 25 + 3 * 2
+
+
+def test_paginacao_sem_pergunta_apos_a_ultima_pagina():
+    perguntas = []
+    escritas, _ = renderizar(gerar_linhas(20), por_pagina=10, continuar=lambda: perguntas.append(1) or True)
+    assert escritas == 20 and len(perguntas) == 1  # Entrada esgotada exatamente no fim da página.
+
+
+@pytest.mark.parametrize("amostra", [5, 1000])
+def test_paginacao_interrompida_para_cedo(amostra):
+    entrada = Entrada(gerar_linhas(10_000))
+    escritas, texto = renderizar(iter(entrada), amostra=amostra, por_pagina=10, continuar=lambda: False)
+    assert escritas == 10 and len(texto) == 12
+    assert entrada.lidas <= max(amostra, 11)  # A página, a linha seguinte (há mais?) e a amostra.
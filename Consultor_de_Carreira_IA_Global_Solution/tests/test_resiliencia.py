@@ -0,0 +1,225 @@
+# --- Testes da Camada Resiliente (resiliencia.py) ---
+# Um backend roteirizado (lista de ações por chamada) substitui a API; o relógio do disjuntor e
+# as esperas entre tentativas são substituídos para que os testes não dependam do tempo real.
+import asyncio  # Caminho assíncrono (modo lote).
+import contextlib  # Silencia as mensagens do pipeline.
+import io  # Destino das mensagens silenciadas.
+import random  # Jitter reprodutível.
+import threading  # Contagem de chamadas vinda de várias threads.
+import time  # Latências simuladas e duração das chamadas.
+
+import pytest
+
+import main
+import resiliencia
+from backends import BackendIA
+from resiliencia import BackendResiliente, CircuitoAberto, Disjuntor, TempoEsgotado, erro_retentavel
+
+
+class ErroAPI(Exception):
+    """ Mesmo formato do APIError do SDK: código HTTP em '.code'. """
+
+    def __init__(self, code):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+
+
+class BackendRoteirizado(BackendIA):
+    """
+    Cada chamada consome a próxima ação do roteiro: uma exceção é levantada, um número é uma
+    latência (segundos) antes de responder "ok <n>"; sem roteiro, responde na hora.
+    """
+
+    def __init__(self, *roteiro):
+        self.roteiro = list(roteiro)
+        self.chamadas = 0
+        self._trava = threading.Lock()
+
+    def gerar(self, prompt, modelo, esquema=None):
+        with self._trava:
+            self.chamadas += 1
+            numero = self.chamadas
+            acao = self.roteiro.pop(0) if self.roteiro else 0
+        if isinstance(acao, BaseException):
+            raise acao
+        time.sleep(acao)
+        return f"ok {numero}"
+
+    def gerar_stream(self, prompt, modelo):
+        texto = self.gerar(prompt, modelo)
+        yield texto[:2]
+        yield texto[2:]
+
+
+class Relogio:
+    def __init__(self):
+        self.agora = 100.0
+
+    def __call__(self):
+        return self.agora
+
+
+@pytest.fixture
+def esperas(monkeypatch):
+    """ Registra as esperas entre tentativas em vez de dormir. """
+    registradas = []
+    monkeypatch.setattr(BackendResiliente, "_esperar",
+                        lambda self, tentativa: registradas.append(tentativa))
+    return registradas
+
+
+@pytest.mark.parametrize("erro,retentavel", [
+    (ErroAPI(429), True), (ErroAPI(503), True), (ErroAPI(500), True), (ErroAPI(408), True),
+    (ErroAPI(400), False), (ErroAPI(401), False), (ErroAPI(404), False),
+    (ConnectionResetError(), True), (TempoEsgotado(), True), (ValueError("resposta ruim"), False),
+    (type("ConnectTimeout", (type("TimeoutException", (Exception,), {}),), {})(), True),
+    (type("UnsupportedProtocol", (type("TransportError", (Exception,), {}),), {})(), False),
+])
+def test_erro_retentavel(erro, retentavel):
+    assert erro_retentavel(erro) is retentavel
+
+
+def test_repete_apenas_erros_temporarios(esperas):
+    interno = BackendRoteirizado(ErroAPI(429), ErroAPI(503))
+    assert BackendResiliente(interno, tentativas=3).gerar("p", "m") == "ok 3"
+    assert interno.chamadas == 3 and esperas == [0, 1]
+
+    interno = BackendRoteirizado(ErroAPI(400))
+    with pytest.raises(ErroAPI):
+        BackendResiliente(interno, tentativas=3).gerar("p", "m")
+    assert interno.chamadas == 1
+
+    interno = BackendRoteirizado(*[ErroAPI(503)] * 5)
+    with pytest.raises(ErroAPI):
+        BackendResiliente(interno, tentativas=3).gerar("p", "m")
+    assert interno.chamadas == 3  # Tentativas esgotadas: o último erro sobe.
+
+
+def test_espera_exponencial_limitada_e_aleatoria(monkeypatch):
+    dormidas = []
+    monkeypatch.setattr(resiliencia.time, "sleep", dormidas.append)
+    resiliente = BackendResiliente(BackendRoteirizado(), espera_base=0.5, espera_maxima=3.0, gerador=random.Random(1))
+    for tentativa in range(8):
+        for _ in range(50):
+            resiliente._esperar(tentativa)
+    por_tentativa = [dormidas[i:i + 50] for i in range(0, len(dormidas), 50)]
+    for tentativa, valores in enumerate(por_tentativa):
+        teto = min(3.0, 0.5 * 2 ** tentativa)
+        assert all(0 <= valor <= teto for valor in valores)
+        assert len(set(valores)) == 50  # Full jitter: nenhuma espera fixa.
+    assert max(por_tentativa[-1]) > 2.0 and max(max(valores) for valores in por_tentativa) <= 3.0
+
+
+def test_copia_hedged_vence_a_principal_lenta():
+    interno = BackendRoteirizado(2.0)  # A principal demora; a cópia responde na hora.
+    resiliente = BackendResiliente(interno, prazo=5.0, percentil_hedge=95)
+    resiliente.latencias.extend([0.01] * 30)
+    inicio = time.monotonic()
+    assert resiliente.gerar("p", "m") == "ok 2"
+    assert time.monotonic() - inicio < 1.0 and interno.chamadas == 2
+
+
+def test_sem_hedge_antes_de_amostras_suficientes():
+    resiliente = BackendResiliente(BackendRoteirizado(), percentil_hedge=95)
+    resiliente.latencias.extend([0.01] * 5)
+    assert resiliente.limite_hedge() is None
+    assert BackendResiliente(BackendRoteirizado()).limite_hedge() is None
+
+
+def test_prazo_vale_para_cada_tentativa(esperas):
+    interno = BackendRoteirizado(1.0, 1.0, 0)
+    resiliente = BackendResiliente(interno, prazo=0.1, tentativas=3)
+    inicio = time.monotonic()
+    assert resiliente.gerar("p", "m") == "ok 3"
+    assert time.monotonic() - inicio < 0.8 and esperas == [0, 1]
+
+    interno = BackendRoteirizado(1.0, 1.0)
+    with pytest.raises(TempoEsgotado):
+        BackendResiliente(interno, prazo=0.1, tentativas=2).gerar("p", "m")
+    assert interno.chamadas == 2
+
+
+def test_disjuntor_fechado_aberto_meio_aberto(monkeypatch):
+    relogio = Relogio()
+    monkeypatch.setattr(resiliencia.time, "monotonic", relogio)
+    disjuntor = Disjuntor(limite_falhas=3, tempo_reabertura=30.0)
+    for _ in range(2):
+        disjuntor.permitir()
+        disjuntor.registrar_falha()
+    assert disjuntor.estado == "fechado"
+    disjuntor.registrar_sucesso()  # Sucesso zera a sequência de falhas.
+    for _ in range(3):
+        disjuntor.permitir()
+        disjuntor.registrar_falha()
+    assert disjuntor.estado == "aberto"
+    with pytest.raises(CircuitoAberto):
+        disjuntor.permitir()
+
+    relogio.agora += 31
+    disjuntor.permitir()  # Passou o tempo: uma única chamada de teste.
+    assert disjuntor.estado == "meio_aberto"
+    with pytest.raises(CircuitoAberto):
+        disjuntor.permitir()
+    disjuntor.registrar_falha()  # O teste falhou: reabre imediatamente.
+    assert disjuntor.estado == "aberto"
+    relogio.agora += 29
+    with pytest.raises(CircuitoAberto):
+        disjuntor.permitir()
+
+    relogio.agora += 2
+    disjuntor.permitir()
+    disjuntor.registrar_sucesso()  # O teste passou: fecha.
+    assert (disjuntor.estado, disjuntor.falhas_seguidas) == ("fechado", 0)
+    disjuntor.permitir()
+    disjuntor.permitir()
+
+
+def test_circuito_aberto_recusa_sem_chamar_a_api(esperas):
+    interno = BackendRoteirizado(*[ErroAPI(503)] * 4)
+    resiliente = BackendResiliente(interno, tentativas=2, disjuntor=Disjuntor(limite_falhas=2))
+    with pytest.raises(ErroAPI):
+        resiliente.gerar("p", "m")
+    with pytest.raises(CircuitoAberto):
+        resiliente.gerar("p", "m")
+    assert interno.chamadas == 2
+
+    interno = BackendRoteirizado(*[ErroAPI(400)] * 4)  # O serviço respondeu: não abre o circuito.
+    resiliente = BackendResiliente(interno, tentativas=1, disjuntor=Disjuntor(limite_falhas=2))
+    for _ in range(3):
+        with pytest.raises(ErroAPI):
+            resiliente.gerar("p", "m")
+    assert resiliente.disjuntor.estado == "fechado"
+
+
+def test_stream_repete_antes_do_primeiro_pedaco_e_tem_prazo(esperas):
+    interno = BackendRoteirizado(ErroAPI(503))
+    assert "".join(BackendResiliente(interno).gerar_stream("p", "m")) == "ok 2"
+
+    interno = BackendRoteirizado(1.0, 1.0)
+    inicio = time.monotonic()
+    with pytest.raises(TempoEsgotado):
+        list(BackendResiliente(interno, prazo=0.1, tentativas=2).gerar_stream("p", "m"))
+    assert time.monotonic() - inicio < 0.8 and interno.chamadas == 2
+
+
+def test_prompt_stream_nao_derruba_o_programa(monkeypatch, esperas):
+    monkeypatch.setattr(main, "backend", BackendResiliente(BackendRoteirizado(*[ConnectionError()] * 6)))
+    monkeypatch.setattr(main, "cache_respostas", None)
+    saida = io.StringIO()
+    with contextlib.redirect_stdout(saida):
+        assert list(main.prompt_para_ia_stream("p")) == []
+        assert main.prompt_para_ia("p") == ""
+    assert saida.getvalue().count("❌ Falha na chamada à API") == 2
+
+
+def test_gerar_async_prazo_e_disjuntor():
+    class Lento(BackendRoteirizado):
+        async def gerar_async(self, prompt, modelo, esquema=None):
+            await asyncio.sleep(1.0)
+
+    resiliente = BackendResiliente(Lento(), prazo=0.05, disjuntor=Disjuntor(limite_falhas=1))
+    with pytest.raises(TempoEsgotado):
+        asyncio.run(resiliente.gerar_async("p", "m"))
+    with pytest.raises(CircuitoAberto):
+        asyncio.run(resiliente.gerar_async("p", "m"))
+    assert asyncio.run(BackendResiliente(BackendRoteirizado()).gerar_async("p", "m")) == "ok 1"
@@ -0,0 +1,63 @@
+# --- Testes da Tabela Colunar (tabela.py) ---
+# A ordenação por argsort (chaves inteiras, textos por posição alfabética) deve coincidir com
+# o sorted() estável da lista de dicionários; o formato binário deve preservar a tabela.
+import io  # Arquivos binários em memória.
+import random  # Chaves secundárias com empates.
+from operator import itemgetter  # Chaves do sorted() de referência.
+
+import pytest
+
+import main
+from dados_sinteticos import DISTRIBUICOES, gerar_linhas
+from exportacao import exportar, importar_binario
+from tabela import COLUNA_AREA, COLUNA_SALARIO, TabelaColunar, iterar_tuplas
+
+
+@pytest.mark.parametrize("distribuicao", DISTRIBUICOES)
+def test_organizar_dados_como_sorted(distribuicao):
+    linhas = gerar_linhas(2000, distribuicao)
+    tabela = TabelaColunar.de_linhas(linhas)
+    ordenada = main.organizar_dados(tabela, COLUNA_SALARIO)
+    assert isinstance(ordenada, TabelaColunar)
+    assert list(ordenada) == sorted(linhas, key=itemgetter(COLUNA_SALARIO), reverse=True)
+    assert list(tabela) == linhas  # A tabela original não é alterada.
+
+
+@pytest.mark.parametrize("decrescente", [(True, False), (False, True)])
+def test_texto_como_chave_secundaria(decrescente):
+    gerador = random.Random(11)
+    linhas = [{'area': gerador.choice(["Dados", "Área", "UX/UI", "dados", "Zeta"]), 'curso': str(i),
+               COLUNA_SALARIO: gerador.choice((2_000, 9_000))} for i in range(1500)]
+    tabela = TabelaColunar.de_linhas(linhas)
+    esperado = sorted(linhas, key=itemgetter(COLUNA_AREA), reverse=decrescente[1])
+    esperado = sorted(esperado, key=itemgetter(COLUNA_SALARIO), reverse=decrescente[0])
+    assert list(tabela.ordenar((COLUNA_SALARIO, COLUNA_AREA), decrescente)) == esperado
+
+
+def test_acesso_fatias_e_tuplas():
+    linhas = gerar_linhas(50)
+    tabela = TabelaColunar.de_linhas(linhas)
+    assert len(tabela) == 50 and tabela[7] == linhas[7]
+    assert list(tabela[10:20:3]) == linhas[10:20:3]
+    assert list(iterar_tuplas(tabela)) == list(iterar_tuplas(linhas))
+    assert tabela.coluna(COLUNA_AREA) == [linha['area'] for linha in linhas]
+
+
+def test_binario_ida_e_volta(tmp_path):
+    linhas = gerar_linhas(300) + [{'area': "Ação\n\"x\"", 'curso': "", COLUNA_SALARIO: 2 ** 63 - 1}]
+    caminho = tmp_path / "dados.bin"
+    assert exportar(linhas, str(caminho)) == len(linhas)
+    lida = importar_binario(str(caminho))
+    assert list(lida) == linhas
+    assert list(lida.ordenar()) == sorted(linhas, key=itemgetter(COLUNA_SALARIO), reverse=True)
+    lida.adicionar("Nova", "Curso", 1)  # Vocabulário reconstruído: aceita novas linhas.
+    assert lida[-1] == {'area': "Nova", 'curso': "Curso", COLUNA_SALARIO: 1}
+
+
+def test_binario_invalido_ou_truncado():
+    with pytest.raises(ValueError):
+        TabelaColunar.ler_binario(io.BytesIO(b"XXXX" + bytes(12)))
+    arquivo = io.BytesIO()
+    TabelaColunar.de_linhas(gerar_linhas(10)).gravar_binario(arquivo)
+    with pytest.raises(ValueError, match="truncado"):
+        TabelaColunar.ler_binario(io.BytesIO(arquivo.getvalue()[:-8]))
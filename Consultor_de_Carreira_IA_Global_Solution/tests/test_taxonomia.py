@@ -0,0 +1,103 @@
+# --- Testes da Taxonomia de Profissões (taxonomia.py) ---
+# A forma compilada deve reproduzir a árvore e os índices exatamente, inclusive com nomes que
+# contêm quebras de linha, barras ou o próprio separador " > ".
+import io  # Arquivos binários em memória.
+import json  # Origem em JSON.
+import os  # Data de modificação da origem (validação do cache).
+
+import pytest
+
+from dados_sinteticos import gerar_caminhos_taxonomia
+from taxonomia import (ASSINATURA_COMPILADA, Taxonomia, _CABECALHO_COMPILADO, caminhos_do_texto,
+                       carregar_taxonomia, compilar_taxonomia)
+
+NOMES_DIFICEIS = {
+    "Exatas": {"Tecnologia": ["UX/UI", "Ciência\nde Dados", "IA > Visão", "  espaços  "]},
+    "Saúde": {"Enfermagem": [], "Medicina\r\n": ["Clínica \"Geral\"", " Linha"]},
+}
+
+
+def compilar_e_ler(taxonomia):
+    arquivo = io.BytesIO()
+    taxonomia.gravar_compilada(arquivo)
+    arquivo.seek(0)
+    return Taxonomia.ler_compilada(arquivo)
+
+
+def atributos(taxonomia):
+    return (taxonomia.nomes, taxonomia.normalizados, list(taxonomia.pais), list(taxonomia.inicio_filhos),
+            list(taxonomia.quantidade_filhos), list(taxonomia._ordem_nomes), list(taxonomia._palavras_nos),
+            list(taxonomia._palavras_posicoes), taxonomia._trigramas, list(taxonomia._inicio_postagens),
+            list(taxonomia._postagens), taxonomia.niveis, taxonomia.descricoes)
+
+
+@pytest.mark.parametrize("taxonomia", [
+    Taxonomia.de_dicionario(NOMES_DIFICEIS, niveis=("Área", "Campo", "Nicho"),
+                            descricoes={("Exatas", "Tecnologia", "UX/UI"): "Design\nde interfaces"}),
+    Taxonomia.de_caminhos(gerar_caminhos_taxonomia(2000)),
+    Taxonomia.de_caminhos([]),
+], ids=["nomes_dificeis", "sintetica", "vazia"])
+def test_forma_compilada_ida_e_volta(taxonomia):
+    lida = compilar_e_ler(taxonomia)
+    assert atributos(lida) == atributos(taxonomia)
+    assert list(lida.caminhos_folhas()) == list(taxonomia.caminhos_folhas())
+    for consulta in ("ciencia", "dados", "ux/ui", "visao", "medicna", "Engenharia", "12"):
+        assert lida.buscar(consulta) == taxonomia.buscar(consulta)
+
+
+def test_navegacao_com_nomes_dificeis():
+    taxonomia = compilar_e_ler(Taxonomia.de_dicionario(NOMES_DIFICEIS))
+    no = taxonomia.no_do_caminho(("Exatas", "Tecnologia", "Ciência\nde Dados"))
+    assert no is not None and taxonomia.eh_folha(no) and taxonomia.profundidade(no) == 3
+    assert ("Saúde", "Enfermagem") in set(taxonomia.caminhos_folhas())
+    assert taxonomia.nomes[taxonomia.buscar("ux/ui")[0]] == "UX/UI"
+
+
+def test_buscar_prefixo_palavra_trecho_e_erro_de_digitacao():
+    taxonomia = Taxonomia.de_caminhos([
+        ("Saúde", "Gestão Hospitalar"), ("Saúde", "Enfermagem"), ("Exatas", "Engenharia de Software"),
+        ("Exatas", "Engenharia de Dados"), ("Exatas", "Ciência de Dados")])
+    nomes = lambda consulta, **kw: [taxonomia.nomes[no] for no in taxonomia.buscar(consulta, **kw)]
+    assert nomes("eng") == ["Engenharia de Dados", "Engenharia de Software"]
+    assert nomes("HOSP") == ["Gestão Hospitalar"]  # Palavra seguinte, sem acento nem maiúsculas.
+    assert nomes("ftwa") == ["Engenharia de Software"]  # Trecho no meio do nome.
+    assert nomes("enfermagen") == ["Enfermagem"]  # Erro de digitação.
+    assert nomes("dados", raiz=taxonomia.no_do_caminho(("Exatas",)), limite=1) == ["Engenharia de Dados"]
+    assert nomes("") == [] and nomes("zzzz") == []
+
+
+def test_caminhos_do_texto():
+    linhas = ["# comentário", "", " Exatas > Tecnologia > IA ", "Humanas>Direito"]
+    assert list(caminhos_do_texto(linhas)) == [("Exatas", "Tecnologia", "IA"), ("Humanas>Direito",)]
+
+
+def test_carregar_taxonomia_usa_e_renova_o_cache(tmp_path):
+    origem = tmp_path / "profissoes.json"
+    origem.write_text(json.dumps(NOMES_DIFICEIS, ensure_ascii=False), encoding="utf-8")
+    cache = tmp_path / "cache"
+    primeira = carregar_taxonomia(str(origem), diretorio_cache=str(cache))
+    assert len(os.listdir(cache)) == 1
+    segunda = carregar_taxonomia(str(origem), niveis=("A", "B", "C"), diretorio_cache=str(cache))
+    assert atributos(segunda)[:-2] == atributos(primeira)[:-2] and segunda.niveis == ["A", "B", "C"]
+
+    origem.write_text(json.dumps({"Nova": ["Folha"]}), encoding="utf-8")
+    os.utime(origem, ns=(0, os.stat(origem).st_mtime_ns + 10 ** 9))
+    assert list(carregar_taxonomia(str(origem), diretorio_cache=str(cache)).caminhos_folhas()) == [("Nova", "Folha")]
+
+
+def test_carregar_taxonomia_compilada(tmp_path):
+    compilada = tmp_path / "profissoes.ccx"
+    taxonomia = compilar_taxonomia(str(_origem_texto(tmp_path)), str(compilada))
+    assert atributos(carregar_taxonomia(str(compilada), diretorio_cache=None)) == atributos(taxonomia)
+
+    with pytest.raises(ValueError, match="truncado"):
+        Taxonomia.ler_compilada(io.BytesIO(compilada.read_bytes()[:_CABECALHO_COMPILADO.size + 3]))
+    with pytest.raises(ValueError, match="formato compilado"):
+        Taxonomia.ler_compilada(io.BytesIO(b"XXXX" + bytes(_CABECALHO_COMPILADO.size)))
+    assert compilada.read_bytes()[:4] == ASSINATURA_COMPILADA
+
+
+def _origem_texto(pasta):
+    origem = pasta / "profissoes.txt"
+    origem.write_text("\n".join(" > ".join(caminho) for caminho in gerar_caminhos_taxonomia(200)), encoding="utf-8")
+    return origem
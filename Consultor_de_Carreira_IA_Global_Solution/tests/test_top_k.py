@@ -0,0 +1,112 @@
+# --- Testes da Seleção Top-K (ordenacao.selecionar_top_k e mostrar_dados com 'limite') ---
+# A referência é o Mergesort estável: os k primeiros de 'ordenar' devem ser exatamente os mesmos
+# itens (comparados pela identidade, não só pelo valor), inclusive entre chaves empatadas.
+import contextlib  # Captura da tabela impressa.
+import io  # Destino da tabela capturada.
+import random  # Chaves com muitos empates.
+
+import pytest
+
+import main
+from dados_sinteticos import DISTRIBUICOES, gerar_linhas
+from ordenacao import ordenar, selecionar_top_k
+from tabela import TabelaColunar
+
+CHAVE = 'salario_estimado_mensal'
+
+
+def identidades(itens):
+    return [id(item) for item in itens]
+
+
+def linhas_com_empates(n=2000, semente=3):
+    """ Poucos salários e poucas áreas distintos: quase toda comparação termina em empate. """
+    gerador = random.Random(semente)
+    return [{'area': f"Área {gerador.randrange(5)}", 'curso': f"Curso {i}", CHAVE: gerador.choice((3_000, 5_000, 8_000))}
+            for i in range(n)]
+
+
+@pytest.mark.parametrize("distribuicao", DISTRIBUICOES)
+@pytest.mark.parametrize("decrescente", [True, False])
+@pytest.mark.parametrize("k", [1, 10, 250])
+def test_mesmos_itens_que_o_mergesort(distribuicao, decrescente, k):
+    linhas = gerar_linhas(1000, distribuicao)
+    esperado = ordenar(linhas, CHAVE, decrescente)[:k]
+    assert identidades(selecionar_top_k(linhas, k, CHAVE, decrescente)) == identidades(esperado)
+
+
+@pytest.mark.parametrize("campos,decrescente", [
+    (CHAVE, True), (CHAVE, False),
+    ((CHAVE, 'area'), (True, False)), ((CHAVE, 'area'), (False, True)),
+    ((CHAVE, 'area'), True), (('area', CHAVE), False),
+])
+@pytest.mark.parametrize("k", [1, 7, 100, 1999])
+def test_empates_desfeitos_como_no_mergesort_estavel(campos, decrescente, k):
+    linhas = linhas_com_empates()
+    esperado = ordenar(linhas, campos, decrescente)[:k]
+    assert identidades(selecionar_top_k(linhas, k, campos, decrescente)) == identidades(esperado)
+
+
+def test_aceita_gerador_de_uso_unico():
+    linhas = linhas_com_empates()
+    lidos = []
+
+    def gerador():
+        for linha in linhas:
+            lidos.append(linha)
+            yield linha
+
+    selecionados = selecionar_top_k(gerador(), 20, CHAVE)
+    assert identidades(selecionados) == identidades(ordenar(linhas, CHAVE)[:20])
+    assert len(lidos) == len(linhas)  # Uma única passada pela entrada.
+
+
+@pytest.mark.parametrize("k", [50, 51, 1000])
+def test_k_maior_ou_igual_a_n_devolve_tudo_ordenado(k):
+    linhas = linhas_com_empates(50)
+    assert identidades(selecionar_top_k(linhas, k, CHAVE)) == identidades(ordenar(linhas, CHAVE))
+
+
+@pytest.mark.parametrize("k", [0, -1])
+def test_k_zero_ou_entrada_vazia(k):
+    consumidos = []
+    entrada = (consumidos.append(linha) or linha for linha in gerar_linhas(10))
+    assert selecionar_top_k(entrada, k, CHAVE) == []
+    assert consumidos == []  # Nada a selecionar: a entrada nem é lida.
+    assert selecionar_top_k([], 5, CHAVE) == []
+    assert selecionar_top_k(iter(()), 5, CHAVE) == []
+
+
+@pytest.mark.parametrize("campos,decrescente", [(CHAVE, True), ((CHAVE, 'area'), (True, False))])
+def test_tabela_colunar(campos, decrescente):
+    linhas = linhas_com_empates(500)
+    tabela = TabelaColunar.de_linhas(linhas)
+    assert selecionar_top_k(tabela, 30, campos, decrescente) == ordenar(linhas, campos, decrescente)[:30]
+
+
+def linhas_impressas(texto):
+    """ Linhas de dados da tabela de 'mostrar_dados', como (área, curso, salário). """
+    linhas = texto.splitlines()
+    traco = next(i for i, linha in enumerate(linhas) if linha and set(linha) == {"-"})  # Abaixo do cabeçalho.
+    return [tuple(celula.strip() for celula in linha.split(" | ")) for linha in linhas[traco + 1:] if linha]
+
+
+@pytest.mark.parametrize("entrada", [list, iter, TabelaColunar.de_linhas])
+@pytest.mark.parametrize("limite", [1, 15, 500])
+def test_mostrar_dados_com_limite(monkeypatch, entrada, limite):
+    monkeypatch.setattr(main, "linhas_por_pagina", None)
+    linhas = linhas_com_empates(300)
+    saida = io.StringIO()
+    with contextlib.redirect_stdout(saida):
+        main.mostrar_dados(entrada(linhas), titulo="Top", limite=limite)
+
+    esperado = [(linha['area'], linha['curso'], f"{linha[CHAVE]:,}") for linha in ordenar(linhas, CHAVE)[:limite]]
+    assert linhas_impressas(saida.getvalue()) == esperado
+
+
+def test_mostrar_dados_limite_zero(monkeypatch):
+    monkeypatch.setattr(main, "linhas_por_pagina", None)
+    saida = io.StringIO()
+    with contextlib.redirect_stdout(saida):
+        main.mostrar_dados(gerar_linhas(10), limite=0)
+    assert "Nenhum dado para mostrar." in saida.getvalue()
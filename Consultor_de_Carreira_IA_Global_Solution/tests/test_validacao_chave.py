@@ -0,0 +1,113 @@
+# --- Testes do Cache da Validação da Chave (validacao_chave.py) ---
+# O relógio é substituído para testar a expiração sem esperar; o arquivo é lido de volta para
+# garantir que só o hash (nunca a chave) vai para o disco, e que cada 'base_url' tem o seu.
+import contextlib  # Silencia as mensagens de 'validar_chave_input'.
+import functools  # Arquivo de validações temporário em 'main'.
+import io  # Destino das mensagens silenciadas.
+import json  # Leitura do arquivo de validações.
+import re  # Formato do hash (SHA-256 em hexadecimal).
+
+import pytest
+
+import main
+import validacao_chave
+from validacao_chave import chave_validada, registrar_validacao
+
+CHAVE = "AIzaSyChaveDeTeste-1234567890abcdef"
+OUTRA_CHAVE = "AIzaSyOutraChave-0987654321fedcba"
+
+
+class Relogio:
+    def __init__(self):
+        self.agora = 1_000_000.0
+
+    def __call__(self):
+        return self.agora
+
+
+@pytest.fixture
+def relogio(monkeypatch):
+    relogio = Relogio()
+    monkeypatch.setattr(validacao_chave.time, "time", relogio)
+    return relogio
+
+
+@pytest.fixture
+def caminho(tmp_path):
+    return str(tmp_path / "cache" / "chaves_validadas.json")  # O diretório ainda não existe.
+
+
+def test_chave_registrada_e_aceita(caminho, relogio):
+    assert chave_validada(CHAVE, caminho) is False
+    registrar_validacao(CHAVE, caminho)
+    assert chave_validada(CHAVE, caminho) is True
+    assert chave_validada(OUTRA_CHAVE, caminho) is False
+    assert chave_validada(CHAVE[:-1], caminho) is False
+
+
+def test_validacao_expira(caminho, relogio):
+    registrar_validacao(CHAVE, caminho, validade_segundos=60)
+    relogio.agora += 59
+    assert chave_validada(CHAVE, caminho) is True
+    relogio.agora += 1
+    assert chave_validada(CHAVE, caminho) is False
+
+    registrar_validacao(CHAVE, caminho, validade_segundos=60)  # Nova validação: vale de novo.
+    assert chave_validada(CHAVE, caminho) is True
+
+
+def test_entradas_expiradas_sao_descartadas(caminho, relogio):
+    registrar_validacao(CHAVE, caminho, validade_segundos=10)
+    relogio.agora += 20
+    registrar_validacao(OUTRA_CHAVE, caminho, validade_segundos=10)
+    with open(caminho, encoding="utf-8") as arquivo:
+        assert list(json.load(arquivo).values()) == [relogio.agora + 10]
+
+
+def test_arquivo_guarda_apenas_o_hash(caminho, relogio):
+    base_url = "http://127.0.0.1:8080"
+    registrar_validacao(CHAVE, caminho)
+    registrar_validacao(OUTRA_CHAVE, caminho, base_url=base_url)
+    with open(caminho, encoding="utf-8") as arquivo:
+        texto = arquivo.read()
+    assert CHAVE not in texto and OUTRA_CHAVE not in texto and base_url not in texto
+    assert "AIza" not in texto  # Nem um prefixo da chave.
+    validacoes = json.loads(texto)
+    assert len(validacoes) == 2
+    assert all(re.fullmatch(r"[0-9a-f]{64}", hash_chave) for hash_chave in validacoes)
+    assert all(isinstance(expira, float) for expira in validacoes.values())
+
+
+def test_validacao_vale_apenas_para_o_mesmo_base_url(caminho, relogio):
+    registrar_validacao(CHAVE, caminho, base_url="http://localhost:8080")
+    assert chave_validada(CHAVE, caminho, base_url="http://localhost:8080") is True
+    assert chave_validada(CHAVE, caminho, base_url="http://localhost:9090") is False
+    assert chave_validada(CHAVE, caminho) is False  # Validada em outro servidor, não na API oficial.
+
+    registrar_validacao(OUTRA_CHAVE, caminho)
+    assert chave_validada(OUTRA_CHAVE, caminho) is True
+    assert chave_validada(OUTRA_CHAVE, caminho, base_url="http://localhost:8080") is False
+
+
+def test_arquivo_corrompido_vale_como_vazio(caminho, relogio):
+    registrar_validacao(CHAVE, caminho)
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write('{"abc": 1')
+    assert chave_validada(CHAVE, caminho) is False
+    registrar_validacao(CHAVE, caminho)  # Sobrescreve o arquivo corrompido.
+    assert chave_validada(CHAVE, caminho) is True
+
+
+def test_main_aceita_chave_do_cache_sem_chamar_a_api(caminho, monkeypatch):
+    """ Com a chave em cache, 'validar_chave_input' responde sem carregar o SDK nem acessar a rede. """
+    monkeypatch.setattr(main, "chave_validada", functools.partial(chave_validada, caminho=caminho))
+
+    def sem_api(*args, **kwargs):
+        raise AssertionError("acessou a API com a chave em cache")
+
+    monkeypatch.setattr(main, "obter_backend_gemini", sem_api)
+    registrar_validacao(CHAVE, caminho, base_url="http://localhost:8080")
+    saida = io.StringIO()
+    with contextlib.redirect_stdout(saida):
+        assert main.validar_chave_input(CHAVE, base_url="http://localhost:8080") is True
+    assert "cache" in saida.getvalue()
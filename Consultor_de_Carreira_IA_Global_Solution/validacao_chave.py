@@ -0,0 +1,44 @@
+# --- Cache da Validação da Chave de API ---
+# Validar a chave exige uma ida completa à API (models.list()). Depois de uma validação bem
+# sucedida, guardamos em disco apenas o HASH da chave (nunca a chave em si) e a data de
+# expiração; nas próximas execuções a chave é aceita sem nova chamada até expirar.
+# Com um endpoint próprio (--base-url), o hash também cobre o endereço: a validação vale só
+# para o servidor em que foi feita.
+import hashlib  # Hash SHA-256 da chave.
+import json  # Formato do arquivo de validações.
+import os  # Caminho e criação do diretório do arquivo.
+import time  # Data de expiração.
+
+CAMINHO_PADRAO = os.path.join(os.path.expanduser("~"), ".cache", "consultor_carreira", "chaves_validadas.json")
+VALIDADE_PADRAO_SEGUNDOS = 24 * 3600  # Uma validação vale por um dia.
+
+
+def _hash_chave(chave, base_url=None):
+    texto = f"{base_url}\n{chave}" if base_url else chave  # Sem base_url: mesmo hash de antes.
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+def _carregar(caminho):
+    try:
+        with open(caminho, encoding="utf-8") as arquivo:
+            return json.load(arquivo)
+    except (OSError, ValueError):  # Arquivo inexistente ou corrompido: nenhuma validação guardada.
+        return {}
+
+
+def chave_validada(chave, caminho=CAMINHO_PADRAO, base_url=None):
+    """ Retorna True se a chave foi validada antes (no mesmo 'base_url') e a validação ainda não expirou. """
+    expira_em = _carregar(caminho).get(_hash_chave(chave, base_url))
+    return expira_em is not None and expira_em > time.time()
+
+
+def registrar_validacao(chave, caminho=CAMINHO_PADRAO, validade_segundos=VALIDADE_PADRAO_SEGUNDOS, base_url=None):
+    """ Guarda o hash da chave (e do 'base_url') com a data de expiração, descartando entradas já expiradas. """
+    agora = time.time()
+    validacoes = {h: expira for h, expira in _carregar(caminho).items() if expira > agora}
+    validacoes[_hash_chave(chave, base_url)] = agora + validade_segundos
+    os.makedirs(os.path.dirname(os.path.abspath(caminho)), exist_ok=True)
+    temporario = caminho + ".tmp"
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        json.dump(validacoes, arquivo)
+    os.replace(temporario, caminho)  # Troca atômica: leitores nunca veem o arquivo pela metade.